@@ -7,9 +7,6 @@ import sqlite3
 from enum import Enum
 import logging
 from datetime import datetime, timedelta
-import plotly.figure_factory as ff
-import plotly.graph_objects as go
-import pandas as pd
 
 # Set up logging
 logging.basicConfig(
@@ -262,6 +259,11 @@ class ProjectTimelineManager:
 
     def generate_gantt_chart(self, project_id: int, output_path: str = "timeline.html"):
         """Generate an interactive Gantt chart using plotly."""
+        # plotly and pandas are only needed for chart rendering
+        import plotly.figure_factory as ff
+        import plotly.graph_objects as go
+        import pandas as pd
+        
         project = self.get_project(project_id)
         if not project:
             raise ValueError(f"Project with ID {project_id} not found")
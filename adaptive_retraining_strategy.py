@@ -1,14 +1,19 @@
+from __future__ import annotations
+
 import os
 import json
-import sqlite3
 import numpy as np
-import pandas as pd
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Heavy dependencies are imported on the code paths that need them
+    import pandas as pd
+    import tensorflow as tf
 
-import tensorflow as tf
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
+from interaction_archive import read_interactions
+from metadata_repository import load_metadata_snapshot
+from categorical_encoder import CategoricalEncoder
 
 class AdaptiveRetrainingStrategy:
     """
@@ -18,6 +23,9 @@ class AdaptiveRetrainingStrategy:
     Local Economic Context: Dynamic professional resource optimization
     """
     
+    # Interaction columns used as model features and target
+    TRAINING_COLUMNS = ['current_directory', 'target_directory', 'professional_stage', 'interaction_score']
+    
     def __init__(
         self, 
         metadata_path: str = None,
@@ -50,6 +58,8 @@ class AdaptiveRetrainingStrategy:
         
         # Load metadata and configurations
         self.metadata = self._load_metadata()
+        self.directory_encoder = CategoricalEncoder(self.metadata_snapshot.directories)
+        self.stage_encoder = CategoricalEncoder(self.metadata_snapshot.stages)
         self.retraining_config = self._load_retraining_configuration()
     
     def _load_metadata(self) -> Dict[str, Any]:
@@ -57,14 +67,10 @@ class AdaptiveRetrainingStrategy:
         Load cross-referencing metadata
         
         Returns:
-            Metadata dictionary
+            Read-only metadata mapping shared through the metadata repository
         """
-        try:
-            with open(self.metadata_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print("❌ Metadata not found. Using default configuration.")
-            return {}
+        self.metadata_snapshot = load_metadata_snapshot(self.metadata_path)
+        return self.metadata_snapshot.data
     
     def _load_retraining_configuration(self) -> Dict[str, Any]:
         """
@@ -84,7 +90,8 @@ class AdaptiveRetrainingStrategy:
                 "performance_threshold": 0.85,
                 "learning_rate_decay": 0.95,
                 "max_iterations": 1000,
-                "early_stopping_patience": 10
+                "early_stopping_patience": 10,
+                "training_window_days": 90
             }
             
             with open(config_path, 'w') as f:
@@ -94,22 +101,25 @@ class AdaptiveRetrainingStrategy:
     
     def _load_training_data(self) -> pd.DataFrame:
         """
-        Load training data from SQLite database
+        Load training data
+        
+        Reads only the model's feature and target columns for the configured
+        training window, from the compacted archive plus the recent SQLite tail.
         
         Returns:
             Pandas DataFrame with user interactions
         """
+        import pandas as pd
+        
+        window_days = self.retraining_config.get('training_window_days')
+        start_date = datetime.now() - timedelta(days=window_days) if window_days else None
+        
         try:
-            with sqlite3.connect(self.training_data_path) as conn:
-                query = "SELECT * FROM user_interactions"
-                df = pd.read_sql_query(query, conn)
-                
-                # Parse context metadata
-                df['context_metadata'] = df['context_metadata'].apply(
-                    lambda x: json.loads(x) if x else {}
-                )
-                
-                return df
+            return read_interactions(
+                self.training_data_path,
+                columns=self.TRAINING_COLUMNS,
+                start_date=start_date
+            )
         except Exception as e:
             print(f"❌ Error loading training data: {e}")
             return pd.DataFrame()
@@ -124,22 +134,15 @@ class AdaptiveRetrainingStrategy:
         Returns:
             Tuple of feature matrix and target vector
         """
-        # Feature engineering
-        features = []
-        targets = []
-        
-        directories = list(self.metadata.get('directory_relationships', {}).keys())
-        professional_stages = list(self.metadata.get('professional_growth_pathways', {}).keys())
-        
-        for _, row in df.iterrows():
-            # Encode features
-            feature_vector = [
-                directories.index(row['current_directory']) / len(directories),
-                directories.index(row['target_directory']) / len(directories),
-                professional_stages.index(row['professional_stage']) / len(professional_stages)
-            ]
-            features.append(feature_vector)
-            targets.append(row['interaction_score'])
+        # Feature engineering; unknown categories fall into the encoders' unknown bucket
+        features = np.column_stack([
+            self.directory_encoder.transform(df['current_directory']),
+            self.directory_encoder.transform(df['target_directory']),
+            self.stage_encoder.transform(df['professional_stage'])
+        ])
+        targets = df['interaction_score'].to_numpy()
+        
+        from sklearn.preprocessing import StandardScaler
         
         # Scale features
         scaler = StandardScaler()
@@ -157,6 +160,8 @@ class AdaptiveRetrainingStrategy:
         Returns:
             Compiled Keras model
         """
+        import tensorflow as tf
+        
         model = tf.keras.Sequential([
             tf.keras.layers.Dense(
                 64, 
@@ -206,6 +211,9 @@ class AdaptiveRetrainingStrategy:
             print("❌ No training data available. Skipping retraining.")
             return
         
+        import tensorflow as tf
+        from sklearn.model_selection import train_test_split
+        
         X, y = self._prepare_training_data(df)
         
         # Split data
@@ -0,0 +1,94 @@
+import os
+import json
+import hashlib
+import tempfile
+from typing import Any
+
+def _file_digest(path: str, expected_size: int) -> str:
+    """
+    SHA-256 of an existing file, or "" when it is missing or a different size
+
+    Args:
+        path: File to hash
+        expected_size: Size of the content about to be written
+
+    Returns:
+        Hex digest
+    """
+    try:
+        if os.path.getsize(path) != expected_size:
+            return ""
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+    except OSError:
+        return ""
+
+def _fsync_directory(directory: str):
+    """
+    Persist a rename by syncing its directory (a no-op where unsupported)
+    """
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def atomic_write_bytes(path: str, data: bytes, skip_unchanged: bool = True) -> bool:
+    """
+    Crash-safe file write: temp file in the same directory, fsync, rename
+
+    Readers see either the old file or the new one, never a partial write.
+
+    Args:
+        path: Destination file
+        data: Full file content
+        skip_unchanged: Leave the file untouched when its content already matches
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = os.path.abspath(path)
+    if skip_unchanged and _file_digest(path, len(data)) == hashlib.sha256(data).hexdigest():
+        return False
+
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+    _fsync_directory(directory)
+    return True
+
+def atomic_write_json(path: str, data: Any, skip_unchanged: bool = True, **dump_kwargs) -> bool:
+    """
+    Serialize to JSON and write it atomically
+
+    Args:
+        path: Destination file
+        data: JSON-serializable object
+        skip_unchanged: Leave the file untouched when its content already matches
+        **dump_kwargs: Passed to json.dumps (indent, default, ...)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    return atomic_write_bytes(path, json.dumps(data, **dump_kwargs).encode('utf-8'), skip_unchanged)
@@ -1,33 +1,71 @@
-import json
 import os
-from typing import Dict, List, Any
+import time
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from directory_scanner import DirectoryScanner
+from metadata_repository import load_metadata_snapshot, thaw
+
+# Local economic context per section, resolved once at import
+DIRECTORY_CONTEXTS = MappingProxyType({
+    "04_Quick_Start_Guides": "Entry-level skill acceleration in Port Townsend's adaptive economy",
+    "09_Workflow_Automation": "Digital collaboration strategies for local professionals",
+    "19_Digital_Marketing": "Community-driven marketing for Port Townsend businesses",
+    "36_Personal_Development": "Holistic professional growth in a dynamic local ecosystem"
+})
+DEFAULT_DIRECTORY_CONTEXT = "Professional resource navigation"
 
 class CrossReferencingEngine:
-    def __init__(self, metadata_path: str):
+    def __init__(
+        self,
+        metadata_path: str,
+        root_directory: str = None,
+        breadcrumb_cache_size: int = 4096,
+        directory_refresh_interval: float = 30.0
+    ):
         """
         Initialize the Cross-Referencing Engine for Port Townsend Professional Resource Library
         
         Local Economic Context: Adaptive, community-driven knowledge navigation
         Design Philosophy: Maximize skill transferability, minimize resource investment
+        
+        Args:
+            metadata_path: Path to CROSS_REFERENCING_METADATA.json
+            root_directory: Library root used for breadcrumb ancestry (defaults to the metadata's directory)
+            breadcrumb_cache_size: Rendered breadcrumbs kept in the per-path LRU cache
+            directory_refresh_interval: Minimum seconds between re-scans that pick up
+                added, removed or moved directories for breadcrumbs
         """
         self.metadata_path = metadata_path
         self.metadata = self._load_metadata()
+        self.root_directory = root_directory or os.path.dirname(os.path.abspath(metadata_path))
+        
+        # Parent-pointer index over the directory scan, built on first use and
+        # re-checked at most every directory_refresh_interval seconds. The scan
+        # snapshot stays in memory: the library root may be read-only.
+        self.directory_refresh_interval = directory_refresh_interval
+        self._directory_scanner = DirectoryScanner(self.root_directory)
+        self._parent_index: Optional[Dict[str, str]] = None
+        self._indexed_directories: frozenset = frozenset()
+        self._directory_index_checked = 0.0
+        self._name_index: Dict[str, str] = {}
+        self._render_breadcrumb = lru_cache(maxsize=breadcrumb_cache_size)(self._build_breadcrumb)
+        
+        # (directory, stage) -> ordered recommendations, compiled per metadata version
+        self._recommendation_table: Dict[Tuple[str, Optional[str]], Tuple[str, ...]] = {}
+        self._recommendation_table_fingerprint: Optional[str] = None
+        self.recommendation_stats = {"hits": 0, "misses": 0}
         
     def _load_metadata(self) -> Dict[str, Any]:
         """
         Load cross-referencing metadata with error handling
         
-        Ensures robust metadata loading and provides meaningful feedback
+        Ensures robust metadata loading and provides meaningful feedback;
+        parsing is shared with every other engine through the metadata repository
         """
-        try:
-            with open(self.metadata_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"❌ Metadata file not found: {self.metadata_path}")
-            return {}
-        except json.JSONDecodeError:
-            print(f"❌ Invalid JSON in metadata file: {self.metadata_path}")
-            return {}
+        self.metadata_snapshot = load_metadata_snapshot(self.metadata_path)
+        return self.metadata_snapshot.data
     
     def get_recommended_resources(self, current_directory: str, professional_stage: str = None) -> List[str]:
         """
@@ -38,25 +76,79 @@ class CrossReferencingEngine:
             professional_stage: Optional professional growth stage
         
         Returns:
-            List of recommended resource directories
+            List of recommended resource directories: primary connections first, then
+            pathway resources, in metadata order without duplicates or the current directory
         """
-        recommendations = []
+        self._refresh_recommendation_table()
         
-        # Direct connections from metadata
-        if current_directory in self.metadata.get('directory_relationships', {}):
-            direct_connections = self.metadata['directory_relationships'][current_directory].get('primary_connections', [])
-            recommendations.extend(direct_connections)
+        recommendations = self._recommendation_table.get((current_directory, professional_stage or None))
+        if recommendations is not None:
+            self.recommendation_stats["hits"] += 1
+        else:
+            self.recommendation_stats["misses"] += 1
+            recommendations = self._rank_recommendations(current_directory, professional_stage)
         
-        # Professional growth pathway recommendations
+        return list(recommendations)
+    
+    def get_bulk_recommendations(
+        self,
+        directories: Iterable[str],
+        professional_stage: str = None
+    ) -> Dict[str, List[str]]:
+        """
+        Recommendations for many directories at once
+        
+        Args:
+            directories: Navigation contexts
+            professional_stage: Optional professional growth stage shared by all lookups
+        
+        Returns:
+            Directory -> recommended resource directories
+        """
+        return {
+            directory: self.get_recommended_resources(directory, professional_stage)
+            for directory in directories
+        }
+    
+    def _rank_recommendations(self, current_directory: str, professional_stage: Optional[str]) -> Tuple[str, ...]:
+        """
+        Stable ranking: primary connections, then pathway resources, de-duplicated
+        
+        Args:
+            current_directory: Current navigation context
+            professional_stage: Optional professional growth stage
+        
+        Returns:
+            Ordered recommendations
+        """
+        relationships = self.metadata.get('directory_relationships', {})
+        pathways = self.metadata.get('professional_growth_pathways', {})
+        
+        ranked = list(relationships.get(current_directory, {}).get('primary_connections', ()))
         if professional_stage:
-            pathway = self.metadata.get('professional_growth_pathways', {}).get(professional_stage, {})
-            recommended_resources = pathway.get('recommended_resources', [])
-            recommendations.extend(recommended_resources)
+            ranked.extend(pathways.get(professional_stage, {}).get('recommended_resources', ()))
         
-        # Remove duplicates and current directory
-        recommendations = list(set(recommendations) - {current_directory})
+        return tuple(resource for resource in dict.fromkeys(ranked) if resource != current_directory)
+    
+    def _refresh_recommendation_table(self):
+        """
+        Compile every (directory, stage) pair once per metadata version
         
-        return recommendations
+        Stage None covers lookups without a professional stage.
+        """
+        snapshot = load_metadata_snapshot(self.metadata_path)
+        if snapshot is not self.metadata_snapshot:
+            self.metadata = self._load_metadata()
+        if self._recommendation_table_fingerprint == snapshot.fingerprint and self._recommendation_table:
+            return
+        
+        stages = [None, *self.metadata.get('professional_growth_pathways', {}).keys()]
+        self._recommendation_table = {
+            (directory, stage): self._rank_recommendations(directory, stage)
+            for directory in self.metadata.get('directory_relationships', {})
+            for stage in stages
+        }
+        self._recommendation_table_fingerprint = snapshot.fingerprint
     
     def generate_breadcrumb(self, current_directory: str) -> List[Dict[str, str]]:
         """
@@ -68,14 +160,101 @@ class CrossReferencingEngine:
         Returns:
             Breadcrumb navigation with local context
         """
-        breadcrumb = [
-            {
-                "name": current_directory.replace('_', ' ').title(),
-                "path": f"/{current_directory}",
-                "context": self._get_directory_context(current_directory)
-            }
-        ]
-        return breadcrumb
+        return [dict(crumb) for crumb in self._render_breadcrumb(current_directory.strip('/'))]
+    
+    def _build_breadcrumb(self, current_directory: str) -> Tuple[Tuple[Tuple[str, str], ...], ...]:
+        """
+        Render one breadcrumb trail from the root section down to the current directory
+        
+        O(depth): ancestors come from the parent-pointer index, contexts from the
+        preloaded table. Results are memoized per path by the LRU wrapper.
+        
+        Args:
+            current_directory: Relative path ("09_Workflow_Automation/templates") or bare directory name
+        
+        Returns:
+            Immutable crumbs, outermost first
+        """
+        trail = []
+        for relative_path in self._ancestor_chain(current_directory):
+            directory = relative_path.rsplit('/', 1)[-1]
+            trail.append((
+                ("name", directory.replace('_', ' ').title()),
+                ("path", f"/{relative_path}"),
+                ("context", self._get_directory_context(directory))
+            ))
+        return tuple(trail)
+    
+    def _ancestor_chain(self, current_directory: str) -> List[str]:
+        """
+        Relative paths of every ancestor section plus the directory itself
+        
+        Unknown paths fall back to their own path components.
+        """
+        parent_index = self._get_parent_index()
+        relative_path = current_directory if current_directory in parent_index else self._name_index.get(
+            current_directory
+        )
+        if relative_path is None:
+            components = [component for component in current_directory.split('/') if component]
+            return ['/'.join(components[:depth]) for depth in range(1, len(components) + 1)]
+        
+        chain = []
+        while relative_path:
+            chain.append(relative_path)
+            relative_path = parent_index.get(relative_path)
+        chain.reverse()
+        return chain
+    
+    def _get_parent_index(self) -> Dict[str, str]:
+        """
+        Parent pointers for every scanned directory (relative paths, '/'-separated)
+        """
+        if (self._parent_index is None or
+                time.monotonic() - self._directory_index_checked >= self.directory_refresh_interval):
+            self.refresh_directory_index()
+        return self._parent_index
+    
+    def refresh_directory_index(self) -> bool:
+        """
+        Re-scan the library and rebuild the ancestor index if its directories changed
+        
+        Runs from the breadcrumb path at most every directory_refresh_interval
+        seconds; call it directly after reorganizing the library to pick the
+        change up at once. The scan is incremental (one stat per unchanged
+        directory) and is not persisted. Rebuilding drops rendered breadcrumbs,
+        since paths may have moved.
+        
+        Returns:
+            True when the index was rebuilt
+        """
+        scanner = self._directory_scanner
+        scanner.scan(persist=False)
+        self._directory_index_checked = time.monotonic()
+        
+        directories = frozenset(scanner.directories)
+        if self._parent_index is not None and directories == self._indexed_directories:
+            return False
+        
+        parent_index = {}
+        name_counts: Dict[str, int] = {}
+        for relative_path in directories:
+            if relative_path == '.':
+                continue
+            path = relative_path.replace(os.sep, '/')
+            parent, _, name = path.rpartition('/')
+            parent_index[path] = parent
+            name_counts[name] = name_counts.get(name, 0) + 1
+        
+        # Bare names resolve to their full path only when unambiguous
+        self._name_index = {
+            path.rsplit('/', 1)[-1]: path for path in parent_index
+            if name_counts[path.rsplit('/', 1)[-1]] == 1
+        }
+        self._parent_index = parent_index
+        self._indexed_directories = directories
+        self._render_breadcrumb.cache_clear()
+        return True
     
     def _get_directory_context(self, directory: str) -> str:
         """
@@ -83,24 +262,21 @@ class CrossReferencingEngine:
         
         Provides micro-insights into professional development context
         """
-        context_map = {
-            "04_Quick_Start_Guides": "Entry-level skill acceleration in Port Townsend's adaptive economy",
-            "09_Workflow_Automation": "Digital collaboration strategies for local professionals",
-            "19_Digital_Marketing": "Community-driven marketing for Port Townsend businesses",
-            "36_Personal_Development": "Holistic professional growth in a dynamic local ecosystem"
-        }
-        return context_map.get(directory, "Professional resource navigation")
+        return DIRECTORY_CONTEXTS.get(directory, DEFAULT_DIRECTORY_CONTEXT)
     
     def analyze_interconnections(self) -> Dict[str, Any]:
         """
         Comprehensive analysis of resource interconnections
         
         Provides insights into the resource library's structural relationships
+        
+        Returns:
+            Plain, JSON-serializable copy of the analysis
         """
         interconnection_analysis = {
             "total_directories": len(self.metadata.get('directory_relationships', {})),
             "professional_pathways": list(self.metadata.get('professional_growth_pathways', {}).keys()),
-            "cross_referencing_rules": self.metadata.get('cross_referencing_rules', {})
+            "cross_referencing_rules": thaw(self.metadata.get('cross_referencing_rules', {}))
         }
         return interconnection_analysis
 
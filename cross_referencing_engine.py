@@ -1,7 +1,12 @@
 import os
-import json
 import re
-from typing import Dict, List, Any, Optional
+import time
+from typing import Dict, List, Any, Mapping, Optional
+
+from atomic_io import atomic_write_json
+from directory_scanner import DirectoryScanner
+from keyword_categorizer import KeywordCategorizer
+from navigation_graph import NavigationGraph, json_default
 
 class CrossReferencingEngine:
     """
@@ -19,6 +24,7 @@ class CrossReferencingEngine:
             root_directory: Root directory of the resource library
         """
         self.root_directory = root_directory or os.path.dirname(os.path.abspath(__file__))
+        self.scanner = DirectoryScanner(self.root_directory)
         self.cross_reference_map = {}
         self.navigation_categories = [
             "Getting Started",
@@ -29,50 +35,68 @@ class CrossReferencingEngine:
             "Content & Communication",
             "Community Resources"
         ]
+        self.categorizer = KeywordCategorizer.from_category_names(self.navigation_categories)
+        self.content_graph: Optional[NavigationGraph] = None
     
-    def generate_cross_reference_metadata(self) -> Dict[str, Any]:
+    def generate_cross_reference_metadata(self, timings: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         Generate comprehensive cross-referencing metadata
         
+        Args:
+            timings: Optional dictionary that receives per-stage durations in seconds
+        
         Returns:
             Cross-referencing metadata dictionary
         """
+        timings = {} if timings is None else timings
+        stage_start = time.perf_counter()
+        
         cross_reference_metadata = {
             "navigation_categories": self.navigation_categories,
             "directory_relationships": {},
             "content_connections": {}
         }
         
-        # Analyze directory structure
-        for root, dirs, files in os.walk(self.root_directory):
+        # Analyze directory structure (incremental scan; only changed directories are re-listed)
+        self.scanner.scan()
+        timings["scan"] = time.perf_counter() - stage_start
+        stage_start = time.perf_counter()
+        
+        for root, dirs, files in self.scanner.walk():
             # Skip hidden directories and specific system directories
             dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['__pycache__', '.git']]
             
             # Process only tier 1 and tier 2 directories
             relative_path = os.path.relpath(root, self.root_directory)
             path_components = relative_path.split(os.sep)
+            subdirectories = list(dirs)
+            if len(path_components) >= 2:
+                dirs[:] = []  # Nothing below tier 2 is categorized
             
             if 1 <= len(path_components) <= 2 and path_components[0] != '.':
                 directory_name = path_components[-1]
                 
-                # Categorize directories
-                for category in self.navigation_categories:
-                    if any(keyword.lower() in directory_name.lower() for keyword in category.split()):
-                        cross_reference_metadata["directory_relationships"][directory_name] = {
-                            "primary_category": category,
-                            "files": [f for f in files if f.endswith('.md') or f.endswith('.html')],
-                            "subdirectories": dirs
-                        }
-                        break
+                # Categorize directories (first category in list order wins)
+                category = self.categorizer.primary_label(directory_name)
+                if category is not None:
+                    cross_reference_metadata["directory_relationships"][directory_name] = {
+                        "primary_category": category,
+                        "files": [f for f in files if f.endswith('.md') or f.endswith('.html')],
+                        "subdirectories": subdirectories
+                    }
+        
+        timings["categorize"] = time.perf_counter() - stage_start
+        stage_start = time.perf_counter()
         
         # Generate content connections
         cross_reference_metadata["content_connections"] = self._generate_content_connections(
             cross_reference_metadata["directory_relationships"]
         )
+        timings["connect"] = time.perf_counter() - stage_start
         
         return cross_reference_metadata
     
-    def _generate_content_connections(self, directory_relationships: Dict[str, Any]) -> Dict[str, List[str]]:
+    def _generate_content_connections(self, directory_relationships: Dict[str, Any]) -> Mapping[str, List[str]]:
         """
         Generate intelligent content connections between directories
         
@@ -80,10 +104,8 @@ class CrossReferencingEngine:
             directory_relationships: Existing directory relationships
         
         Returns:
-            Dictionary of content connections
+            Lazy mapping of content connections, backed by self.content_graph (CSR)
         """
-        content_connections = {}
-        
         # Define connection rules based on professional growth and thematic similarity
         connection_rules = {
             "Getting Started": ["Quick Start Guides", "Personal Development"],
@@ -95,26 +117,23 @@ class CrossReferencingEngine:
             "Community Resources": ["Discussion Forum", "Feedback Forms", "Remote Work"]
         }
         
-        for directory, details in directory_relationships.items():
-            primary_category = details.get("primary_category", "")
-            
-            # Find connected directories
-            connected_dirs = connection_rules.get(primary_category, [])
-            content_connections[directory] = [
-                dir_name for dir_name, dir_details in directory_relationships.items()
-                if dir_details.get("primary_category") in connected_dirs
-            ]
-        
-        return content_connections
+        # Category buckets keep this linear in directories plus connections
+        self.content_graph = NavigationGraph.from_category_rules(directory_relationships, connection_rules)
+        return self.content_graph.connections()
     
-    def generate_navigation_graph(self) -> Dict[str, Any]:
+    def generate_navigation_graph(self, cross_reference_metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Generate a comprehensive navigation graph
         
+        Args:
+            cross_reference_metadata: Previously generated metadata to reuse; the
+                library is scanned again only when omitted
+        
         Returns:
             Navigation graph with hierarchical and thematic connections
         """
-        cross_reference_metadata = self.generate_cross_reference_metadata()
+        if cross_reference_metadata is None:
+            cross_reference_metadata = self.generate_cross_reference_metadata()
         
         navigation_graph = {
             "hierarchical_structure": {},
@@ -131,10 +150,46 @@ class CrossReferencingEngine:
         
         return navigation_graph
     
+    def build_navigation_artifacts(self, save: bool = True) -> Dict[str, Any]:
+        """
+        Single-pass build: one scan feeds both the metadata and the navigation graph
+        
+        Args:
+            save: Serialize the metadata to CROSS_REFERENCING_METADATA.json and
+                the binary graph to NAVIGATION_GRAPH.bin
+        
+        Returns:
+            Dictionary with metadata, navigation_graph, metadata_path, graph_path and
+            per-stage timings (scan, categorize, connect, serialize) in seconds
+        """
+        timings = {}
+        metadata = self.generate_cross_reference_metadata(timings)
+        
+        stage_start = time.perf_counter()
+        navigation_graph = self.generate_navigation_graph(metadata)
+        timings["connect"] += time.perf_counter() - stage_start
+        
+        stage_start = time.perf_counter()
+        metadata_path = graph_path = None
+        if save:
+            metadata_path = self.save_cross_reference_metadata(metadata)
+            graph_path = self.save_navigation_graph(metadata)
+        timings["serialize"] = time.perf_counter() - stage_start
+        
+        return {
+            "metadata": metadata,
+            "navigation_graph": navigation_graph,
+            "metadata_path": metadata_path,
+            "graph_path": graph_path,
+            "timings": timings
+        }
+    
     def save_cross_reference_metadata(self, metadata: Dict[str, Any]) -> str:
         """
         Save cross-referencing metadata to a JSON file
         
+        The file is replaced atomically, and left untouched when its content is unchanged.
+        
         Args:
             metadata: Cross-referencing metadata dictionary
         
@@ -143,11 +198,31 @@ class CrossReferencingEngine:
         """
         metadata_path = os.path.join(self.root_directory, 'CROSS_REFERENCING_METADATA.json')
         
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
-        print(f"✅ Cross-Referencing Metadata Generated: {metadata_path}")
+        if atomic_write_json(metadata_path, metadata, indent=2, default=json_default):
+            print(f"✅ Cross-Referencing Metadata Generated: {metadata_path}")
+        else:
+            print(f"✅ Cross-Referencing Metadata Unchanged: {metadata_path}")
         return metadata_path
+    
+    def save_navigation_graph(self, metadata: Dict[str, Any]) -> str:
+        """
+        Save the navigation graph in the compact binary format
+        
+        Workers load it with NavigationGraph.load(), which memory-maps the file
+        so every process shares one page-cached copy.
+        
+        Args:
+            metadata: Cross-referencing metadata dictionary
+        
+        Returns:
+            Path to saved graph file
+        """
+        graph_path = os.path.join(self.root_directory, 'NAVIGATION_GRAPH.bin')
+        if NavigationGraph.from_metadata(metadata).save(graph_path):
+            print(f"✅ Navigation Graph Saved: {graph_path}")
+        else:
+            print(f"✅ Navigation Graph Unchanged: {graph_path}")
+        return graph_path
 
 def main():
     """
@@ -155,13 +230,14 @@ def main():
     """
     print("🌐 Port Townsend Professional Resource Library - Cross-Referencing Engine")
     
-    # Initialize and execute cross-referencing
+    # Initialize and execute cross-referencing (one scan, metadata saved)
     cross_ref_engine = CrossReferencingEngine()
-    cross_reference_metadata = cross_ref_engine.generate_cross_reference_metadata()
-    navigation_graph = cross_ref_engine.generate_navigation_graph()
+    artifacts = cross_ref_engine.build_navigation_artifacts()
+    cross_reference_metadata = artifacts["metadata"]
     
-    # Save metadata
-    cross_ref_engine.save_cross_reference_metadata(cross_reference_metadata)
+    print("\n⏱️ Build Timings:")
+    for stage, duration in artifacts["timings"].items():
+        print(f"  {stage}: {duration * 1000:.1f} ms")
     
     # Print key insights
     print("\n🔍 Navigation Insights:")
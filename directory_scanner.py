@@ -0,0 +1,262 @@
+import os
+import json
+from typing import Dict, Any, List, Iterator, NamedTuple, Optional, Tuple, Iterable
+
+from atomic_io import atomic_write_json
+
+SNAPSHOT_VERSION = 1
+SCAN_CACHE_DIRNAME = '.scan_cache'
+
+# Never worth descending into for library analysis
+DEFAULT_IGNORED_DIRECTORIES = frozenset({'.git', '__pycache__', 'node_modules', SCAN_CACHE_DIRNAME})
+
+class FileStat(NamedTuple):
+    size: int
+    mtime_ns: int
+    inode: int
+
+class ScanDiff(NamedTuple):
+    """
+    Changes between two scans, as paths relative to the scan root
+    """
+    added: List[str]
+    removed: List[str]
+    modified: List[str]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+class DirectoryScanner:
+    """
+    Incremental directory scanner with a persistent stat cache
+
+    Design Philosophy: Only look at what changed since the last run
+    Core Objective: Replace repeated full os.walk passes over the library
+
+    Every run stats each directory, but only directories whose mtime or inode
+    changed are re-listed with os.scandir; unchanged directories reuse the
+    cached listing and file stats. A directory's mtime changes when entries are
+    added, removed or renamed (including editors' save-by-rename), not when a
+    file is rewritten in place; pass verify_files=True to scan() to catch those.
+    """
+
+    def __init__(
+        self,
+        root_directory: str,
+        snapshot_path: str = None,
+        ignored_directories: Iterable[str] = DEFAULT_IGNORED_DIRECTORIES
+    ):
+        """
+        Initialize Directory Scanner
+
+        Args:
+            root_directory: Directory tree to scan
+            snapshot_path: Persistent snapshot location (defaults to <root>/.scan_cache/)
+            ignored_directories: Directory names never descended into
+        """
+        self.root_directory = os.path.abspath(root_directory)
+        self.snapshot_path = snapshot_path or os.path.join(
+            self.root_directory, SCAN_CACHE_DIRNAME, 'directory_snapshot.json'
+        )
+        self.ignored_directories = frozenset(ignored_directories)
+        self.directories: Dict[str, Dict[str, Any]] = {}
+        self.last_diff = ScanDiff([], [], [])
+        self.rescanned_directories = 0
+
+    def _load_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Load the persisted snapshot
+
+        Returns:
+            Directory entries keyed by relative path (empty if missing or stale)
+        """
+        try:
+            with open(self.snapshot_path, 'r') as f:
+                snapshot = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+        if (snapshot.get('version') != SNAPSHOT_VERSION or
+                snapshot.get('root_directory') != self.root_directory or
+                snapshot.get('ignored_directories') != sorted(self.ignored_directories)):
+            return {}
+        return snapshot.get('directories', {})
+
+    def _save_snapshot(self):
+        """
+        Persist the current snapshot atomically (skipped when nothing changed)
+        """
+        atomic_write_json(self.snapshot_path, {
+            'version': SNAPSHOT_VERSION,
+            'root_directory': self.root_directory,
+            'ignored_directories': sorted(self.ignored_directories),
+            'directories': self.directories
+        }, separators=(',', ':'))
+
+    def _list_directory(self, absolute_path: str, stat: os.stat_result) -> Dict[str, Any]:
+        """
+        List one directory with os.scandir
+
+        Args:
+            absolute_path: Directory to list
+            stat: The directory's own stat result
+
+        Returns:
+            Directory entry with subdirectory names and file stats
+        """
+        subdirectories = []
+        files = {}
+        with os.scandir(absolute_path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.ignored_directories:
+                            subdirectories.append(entry.name)
+                    elif entry.is_file():
+                        file_stat = entry.stat()
+                        files[entry.name] = [file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ino]
+                except OSError:
+                    continue
+
+        return {
+            'mtime_ns': stat.st_mtime_ns,
+            'inode': stat.st_ino,
+            'subdirectories': sorted(subdirectories),
+            'files': dict(sorted(files.items()))
+        }
+
+    def scan(self, verify_files: bool = False, persist: bool = True) -> ScanDiff:
+        """
+        Bring the snapshot up to date
+
+        Args:
+            verify_files: Re-stat files in unchanged directories to catch in-place edits
+            persist: Write the updated snapshot to disk
+
+        Returns:
+            Files added, removed and modified since the previous snapshot
+        """
+        previous = self.directories or self._load_snapshot()
+        current = {}
+        self.rescanned_directories = 0
+
+        pending = ['.']
+        while pending:
+            relative_path = pending.pop()
+            absolute_path = os.path.normpath(os.path.join(self.root_directory, relative_path))
+            try:
+                stat = os.stat(absolute_path)
+                cached = previous.get(relative_path)
+                if (cached is not None and not verify_files and
+                        cached['mtime_ns'] == stat.st_mtime_ns and cached['inode'] == stat.st_ino):
+                    entry = cached
+                else:
+                    entry = self._list_directory(absolute_path, stat)
+                    self.rescanned_directories += 1
+            except OSError:
+                continue
+
+            current[relative_path] = entry
+            for name in reversed(entry['subdirectories']):
+                pending.append(name if relative_path == '.' else os.path.join(relative_path, name))
+
+        self.last_diff = self._diff(previous, current)
+        self.directories = current
+        if persist:
+            self._save_snapshot()
+        return self.last_diff
+
+    def _diff(
+        self,
+        previous: Dict[str, Dict[str, Any]],
+        current: Dict[str, Dict[str, Any]]
+    ) -> ScanDiff:
+        """
+        Compare two snapshots file by file
+
+        Unchanged directories share their entry object, so they are skipped cheaply.
+        """
+        added, removed, modified = [], [], []
+
+        for relative_path in current.keys() | previous.keys():
+            new_entry = current.get(relative_path)
+            old_entry = previous.get(relative_path)
+            if new_entry is old_entry:
+                continue
+
+            new_files = new_entry['files'] if new_entry else {}
+            old_files = old_entry['files'] if old_entry else {}
+            for name, file_stat in new_files.items():
+                path = self._relative_file_path(relative_path, name)
+                if name not in old_files:
+                    added.append(path)
+                elif list(old_files[name]) != list(file_stat):
+                    modified.append(path)
+            for name in old_files.keys() - new_files.keys():
+                removed.append(self._relative_file_path(relative_path, name))
+
+        return ScanDiff(sorted(added), sorted(removed), sorted(modified))
+
+    @staticmethod
+    def _relative_file_path(relative_directory: str, name: str) -> str:
+        return name if relative_directory == '.' else os.path.join(relative_directory, name)
+
+    def walk(self, top: str = '.') -> Iterator[Tuple[str, List[str], List[str]]]:
+        """
+        Walk the snapshot top-down, like os.walk, without touching the filesystem
+
+        Callers may prune the yielded directory list in place to skip subtrees.
+
+        Args:
+            top: Relative directory to start from
+
+        Yields:
+            (absolute directory path, subdirectory names, file names)
+        """
+        if not self.directories:
+            self.scan()
+
+        pending = [top]
+        while pending:
+            relative_path = pending.pop()
+            entry = self.directories.get(relative_path)
+            if entry is None:
+                continue
+
+            absolute_path = self.root_directory if relative_path == '.' else os.path.join(
+                self.root_directory, relative_path
+            )
+            dirs = list(entry['subdirectories'])
+            yield absolute_path, dirs, list(entry['files'])
+
+            for name in reversed(dirs):
+                pending.append(name if relative_path == '.' else os.path.join(relative_path, name))
+
+    def file_stats(self, directory: str = '.') -> Dict[str, FileStat]:
+        """
+        Cached file stats for one directory
+
+        Args:
+            directory: Directory path, absolute or relative to the scan root
+
+        Returns:
+            File name -> (size, mtime_ns, inode)
+        """
+        entry = self.directories.get(self.relative_path(directory))
+        if entry is None:
+            return {}
+        return {name: FileStat(*file_stat) for name, file_stat in entry['files'].items()}
+
+    def relative_path(self, path: str) -> str:
+        """
+        Normalize a path to the snapshot's relative-path keys
+
+        Args:
+            path: Absolute path or path relative to the scan root
+
+        Returns:
+            Relative path ('.' for the root)
+        """
+        if os.path.isabs(path):
+            path = os.path.relpath(path, self.root_directory)
+        return os.path.normpath(path)
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+import io
+import os
+import json
+import numpy as np
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    # pandas is imported on the code paths that need it
+    import pandas as pd
+    import sqlite3
+
+from atomic_io import atomic_write_bytes, atomic_write_json
+from interaction_database import (
+    INTERACTION_COLUMN_TYPES, from_epoch_micros, get_interaction_database, to_epoch_micros
+)
+
+ARCHIVE_DIRECTORY = 'INTERACTION_ARCHIVE'
+MANIFEST_FILENAME = 'manifest.json'
+
+# On-disk layout version of the manifest and partitions
+ARCHIVE_VERSION = 1
+
+# Flattened context_metadata fields are stored as "context.<field>" columns
+CONTEXT_PREFIX = 'context.'
+
+# One partition per local calendar day
+PARTITION_MICROS = 86400 * 1000000
+
+# Days are compacted once they ended at least this long ago, so the usual
+# stragglers (buffered writers, other processes) land before their day is archived
+DEFAULT_COMPACTION_GRACE = timedelta(hours=1)
+
+# Open range bounds; integer bounds also keep unmigrated text timestamps out of range scans
+_MIN_MICROS = -(1 << 63)
+_MAX_MICROS = (1 << 63) - 1
+
+_COLUMN_KINDS: Dict[str, str] = dict(INTERACTION_COLUMN_TYPES)
+
+def _load_pyarrow():
+    """
+    Import pyarrow (with pyarrow.parquet) on first use; it is optional
+
+    Returns:
+        The pyarrow module, or None when pyarrow is not installed
+    """
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+def default_archive_path(db_path: str) -> str:
+    """
+    Archive directory next to an interaction database
+    """
+    return os.path.join(os.path.dirname(os.path.abspath(db_path)), ARCHIVE_DIRECTORY)
+
+def _typed_column(values: Sequence[Any], kind: str) -> np.ndarray:
+    """
+    Convert one column of Python values to a typed NumPy array
+
+    Missing values become NaN in float64 columns and "" in str columns;
+    `json` columns are serialized to str.
+
+    Args:
+        values: Column values
+        kind: int64, float64, str or json
+
+    Returns:
+        Typed array
+    """
+    if kind == 'int64':
+        return np.array(values, dtype=np.int64)
+    if kind == 'float64':
+        return np.array(values, dtype=np.float64)
+    if kind == 'json':
+        values = [None if value is None else json.dumps(value) for value in values]
+    return np.array(['' if value is None else str(value) for value in values], dtype=str)
+
+def _context_kind(values: Iterable[Any]) -> str:
+    """
+    Storage kind of one context field: numbers and booleans as float64,
+    strings as str, anything nested or mixed as JSON text
+    """
+    types = {type(value) for value in values if value is not None}
+    if types <= {bool, int, float}:
+        return 'float64'
+    if types == {str}:
+        return 'str'
+    return 'json'
+
+def _column_kind(column: np.ndarray) -> str:
+    return 'str' if column.dtype.kind == 'U' else str(column.dtype)
+
+def flatten_context_metadata(
+    serialized: Sequence[str],
+    fields: Optional[Iterable[str]] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Flatten serialized context_metadata into typed columns
+
+    Args:
+        serialized: context_metadata JSON per row
+        fields: Fields to extract (default: every field that occurs, sorted)
+
+    Returns:
+        "context.<field>" -> typed column
+    """
+    contexts = [json.loads(value) if value and value != '{}' else {} for value in serialized]
+    if fields is None:
+        fields = sorted({field for context in contexts for field in context})
+
+    columns = {}
+    for field in fields:
+        values = [context.get(field) for context in contexts]
+        columns[CONTEXT_PREFIX + field] = _typed_column(values, _context_kind(values))
+    return columns
+
+def _fetch_columns(
+    conn: sqlite3.Connection,
+    columns: Sequence[str],
+    lower: int,
+    upper: int,
+    professional_stages: Optional[Sequence[str]] = None,
+    through_rowid: Optional[int] = None,
+    after_rowid: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Read interaction columns for lower <= timestamp < upper, ordered by timestamp
+
+    Args:
+        conn: Database connection
+        columns: user_interactions columns (or rowid) to read
+        lower: Inclusive lower bound (epoch microseconds)
+        upper: Exclusive upper bound (epoch microseconds)
+        professional_stages: Optional stage filter
+        through_rowid: Optional inclusive rowid upper bound
+        after_rowid: Optional exclusive rowid lower bound; the scan then walks
+            the rowid range instead of a timestamp or stage index
+
+    Returns:
+        Column name -> typed column
+    """
+    source = 'user_interactions'
+    conditions = ['timestamp >= ?', 'timestamp < ?']
+    params: List[Any] = [lower, upper]
+
+    if through_rowid is not None:
+        conditions.append('+rowid <= ?')
+        params.append(through_rowid)
+    if after_rowid is not None:
+        source += ' NOT INDEXED'
+        conditions.append('rowid > ?')
+        params.append(after_rowid)
+    if professional_stages:
+        conditions.append('professional_stage IN ({})'.format(','.join(['?'] * len(professional_stages))))
+        params.extend(professional_stages)
+
+    query = f"SELECT {', '.join(columns)} FROM {source} WHERE {' AND '.join(conditions)} ORDER BY timestamp"
+    rows = conn.execute(query, params).fetchall()
+    values = list(zip(*rows)) if rows else [()] * len(columns)
+    return {
+        name: _typed_column(column, 'int64' if name == 'rowid' else _COLUMN_KINDS[name])
+        for name, column in zip(columns, values)
+    }
+
+def load_archive_manifest(archive_path: str) -> Dict[str, Any]:
+    """
+    Load the archive manifest, or an empty one when nothing was compacted yet
+
+    Returns:
+        Manifest with `watermark` (epoch microseconds up to which interactions
+        are archived, exclusive; None when empty), `compacted_rowid` (highest
+        rowid seen by the last completed run), `partitions` and `superseded`
+        (files replaced by the last run, removed by the next one)
+    """
+    try:
+        with open(os.path.join(archive_path, MANIFEST_FILENAME), 'r') as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return {
+            "version": ARCHIVE_VERSION, "watermark": None, "compacted_rowid": 0,
+            "partitions": [], "superseded": []
+        }
+
+    if manifest.get('version') != ARCHIVE_VERSION:
+        raise ValueError(f"Unsupported interaction archive version: {manifest.get('version')}")
+    return manifest
+
+def _partition_bytes(columns: Dict[str, np.ndarray], pyarrow) -> bytes:
+    """
+    Serialize one partition as Parquet (with pyarrow) or compressed .npz
+    """
+    if pyarrow is None:
+        buffer = io.BytesIO()
+        np.savez_compressed(buffer, **columns)
+        return buffer.getvalue()
+
+    table = pyarrow.table({
+        name: pyarrow.array(column.tolist() if column.dtype.kind == 'U' else column)
+        for name, column in columns.items()
+    })
+    sink = pyarrow.BufferOutputStream()
+    pyarrow.parquet.write_table(table, sink)
+    return sink.getvalue().to_pybytes()
+
+def _write_day_partition(
+    conn: sqlite3.Connection,
+    archive_path: str,
+    manifest: Dict[str, Any],
+    day: int,
+    through_rowid: int,
+    pyarrow
+) -> int:
+    """
+    Write one day's rows (up to through_rowid) as a partition and record it in the manifest
+
+    Partition files are named after through_rowid and never overwritten, so
+    readers holding the previous manifest keep reading a consistent file; a
+    replaced file is listed under `superseded` for the next run to delete.
+
+    Returns:
+        Rows written
+    """
+    file_format = 'npz' if pyarrow is None else 'parquet'
+    columns = _fetch_columns(conn, tuple(_COLUMN_KINDS), day, day + PARTITION_MICROS, through_rowid=through_rowid)
+    columns.update(flatten_context_metadata(columns['context_metadata']))
+
+    relative_path = (
+        f'date={from_epoch_micros(day).date().isoformat()}/interactions-{through_rowid}.{file_format}'
+    )
+    atomic_write_bytes(os.path.join(archive_path, relative_path), _partition_bytes(columns, pyarrow))
+
+    timestamps = columns['timestamp']
+    manifest['superseded'].extend(
+        partition['path'] for partition in manifest['partitions']
+        if partition['day'] == day and partition['path'] != relative_path
+    )
+    manifest['partitions'] = [
+        partition for partition in manifest['partitions'] if partition['day'] != day
+    ] + [{
+        "path": relative_path,
+        "format": file_format,
+        "day": day,
+        "through_rowid": through_rowid,
+        "rows": len(timestamps),
+        "min_timestamp": int(timestamps[0]),
+        "max_timestamp": int(timestamps[-1]),
+        "professional_stages": np.unique(columns['professional_stage']).tolist(),
+        "columns": {name: _column_kind(column) for name, column in columns.items()}
+    }]
+    return len(timestamps)
+
+def compact_interaction_log(
+    db_path: str,
+    archive_path: Optional[str] = None,
+    until: Optional[datetime] = None,
+    use_parquet: Optional[bool] = None,
+    grace: timedelta = DEFAULT_COMPACTION_GRACE
+) -> Dict[str, Any]:
+    """
+    Export closed days of interactions into date-partitioned columnar files
+
+    A day is closed once `until - grace` has reached the following midnight.
+    Each closed day with interactions becomes
+    `date=YYYY-MM-DD/interactions-<rowid>.parquet` (or `.npz` without
+    pyarrow), sorted by timestamp, with context_metadata flattened into
+    `context.*` columns. The manifest records per-partition timestamp ranges
+    and stages for pruning, and a watermark below which readers use the
+    archive instead of SQLite.
+
+    Rows committed after a run with timestamps below the watermark (late
+    buffered writes, other processes) are not lost: each partition records
+    the highest rowid it covers, readers fetch newer rows of archived days
+    from SQLite, and the next run rewrites those days. The manifest is
+    rewritten atomically after every partition, so an interrupted run
+    resumes where it stopped. SQLite remains the system of record; rows
+    must not be deleted from it while the archive is in use.
+
+    Args:
+        db_path: SQLite interaction database
+        archive_path: Archive directory (default: INTERACTION_ARCHIVE next to the database)
+        until: Compact days that ended at or before this time (default: now)
+        use_parquet: Force Parquet (True) or .npz (False); default: Parquet when available
+        grace: How long after midnight a day stays open
+
+    Returns:
+        Summary with partitions and rows written, format, and the new watermark
+    """
+    archive_path = archive_path or default_archive_path(db_path)
+    pyarrow = _load_pyarrow() if use_parquet is not False else None
+    if use_parquet and pyarrow is None:
+        print("⚠️ pyarrow is not installed; writing .npz partitions")
+    file_format = 'npz' if pyarrow is None else 'parquet'
+    manifest_path = os.path.join(archive_path, MANIFEST_FILENAME)
+
+    manifest = load_archive_manifest(archive_path)
+    boundary = to_epoch_micros((until or datetime.now()) - grace)
+    boundary -= boundary % PARTITION_MICROS
+
+    # Readers that loaded the previous manifest have long finished with these
+    for relative_path in manifest['superseded']:
+        try:
+            os.remove(os.path.join(archive_path, relative_path))
+        except FileNotFoundError:
+            pass
+    manifest['superseded'] = []
+
+    summary = {"partitions": 0, "rows": 0, "format": file_format}
+    watermark = manifest['watermark']
+    with get_interaction_database(db_path).reader() as conn:
+        through_rowid = conn.execute('SELECT MAX(rowid) FROM user_interactions').fetchone()[0] or 0
+
+        # Archived days that received rows after the previous run
+        late_days = [] if watermark is None else [day for (day,) in conn.execute(
+            'SELECT DISTINCT timestamp - timestamp % ? FROM user_interactions NOT INDEXED '
+            'WHERE rowid > ? AND rowid <= ? AND timestamp < ? ORDER BY 1',
+            (PARTITION_MICROS, manifest['compacted_rowid'], through_rowid, watermark)
+        )]
+        for day in late_days:
+            summary['rows'] += _write_day_partition(conn, archive_path, manifest, day, through_rowid, pyarrow)
+            summary['partitions'] += 1
+            atomic_write_json(manifest_path, manifest, indent=2)
+
+        lower = watermark if watermark is not None else _MIN_MICROS
+        while True:
+            # Jump straight to the next day that has interactions
+            first = conn.execute(
+                'SELECT MIN(timestamp) FROM user_interactions '
+                'WHERE timestamp >= ? AND timestamp < ? AND +rowid <= ?',
+                (lower, boundary, through_rowid)
+            ).fetchone()[0]
+            if first is None:
+                break
+
+            day = first - first % PARTITION_MICROS
+            lower = day + PARTITION_MICROS
+            summary['rows'] += _write_day_partition(conn, archive_path, manifest, day, through_rowid, pyarrow)
+            summary['partitions'] += 1
+            manifest['watermark'] = lower
+            atomic_write_json(manifest_path, manifest, indent=2)
+
+    manifest['compacted_rowid'] = through_rowid
+    atomic_write_json(manifest_path, manifest, indent=2)
+    summary['watermark'] = manifest['watermark']
+    return summary
+
+def _read_partition(
+    archive_path: str,
+    partition: Dict[str, Any],
+    columns: Sequence[str],
+    lower: int,
+    upper: int,
+    professional_stages: Optional[Sequence[str]]
+) -> pd.DataFrame:
+    """
+    Read the projected columns of one partition, filtered by time range and stage
+
+    Columns absent from the partition are left out (filled by the caller).
+    """
+    import pandas as pd
+
+    path = os.path.join(archive_path, partition['path'])
+    present = [name for name in columns if name in partition['columns']]
+
+    if partition['format'] == 'parquet':
+        pyarrow = _load_pyarrow()
+        if pyarrow is None:
+            raise ImportError(f"pyarrow is required to read {partition['path']}")
+        filters = [('timestamp', '>=', lower), ('timestamp', '<', upper)]
+        if professional_stages:
+            filters.append(('professional_stage', 'in', list(professional_stages)))
+        return pyarrow.parquet.read_table(path, columns=present, filters=filters).to_pandas()
+
+    # .npz members are decompressed individually, so only projected columns are read
+    with np.load(path, allow_pickle=False) as archive:
+        first, last = np.searchsorted(archive['timestamp'], [lower, upper])
+        keep = slice(first, last)
+        if professional_stages:
+            keep = first + np.flatnonzero(
+                np.isin(archive['professional_stage'][first:last], list(professional_stages))
+            )
+        return pd.DataFrame({name: archive[name][keep] for name in present})
+
+def _fetch_late_rows(
+    conn: sqlite3.Connection,
+    manifest: Dict[str, Any],
+    columns: Sequence[str],
+    lower: int,
+    upper: int,
+    professional_stages: Optional[Sequence[str]]
+) -> Dict[str, np.ndarray]:
+    """
+    Rows below the watermark that no partition covers yet
+
+    Only rows newer than the last completed compaction can qualify, so the
+    scan walks that rowid range; each row is kept unless its day's partition
+    already covers its rowid.
+    """
+    extra = [name for name in ('timestamp', 'rowid') if name not in columns]
+    late = _fetch_columns(
+        conn, list(columns) + extra, lower, upper, professional_stages,
+        after_rowid=manifest['compacted_rowid']
+    )
+    covered = {partition['day']: partition['through_rowid'] for partition in manifest['partitions']}
+    days = late['timestamp'] - late['timestamp'] % PARTITION_MICROS
+    keep = late['rowid'] > np.array([covered.get(day, 0) for day in days.tolist()], dtype=np.int64)
+    return {name: column[keep] for name, column in late.items() if name not in extra}
+
+def read_interactions(
+    db_path: str,
+    columns: Optional[Sequence[str]] = None,
+    context_fields: Sequence[str] = (),
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    professional_stages: Optional[Sequence[str]] = None,
+    archive_path: Optional[str] = None
+) -> pd.DataFrame:
+    """
+    Load interactions from archive partitions plus the SQLite tail
+
+    Partitions outside the time range or without a requested stage are
+    skipped using manifest statistics alone; the rest are read with column
+    projection and the same predicates pushed down (Parquet row-group
+    filters, or a timestamp binary search on .npz partitions). Interactions
+    at or after the watermark come from SQLite through the timestamp indexes,
+    as do rows committed after their day was compacted.
+
+    Args:
+        db_path: SQLite interaction database
+        columns: user_interactions columns to return (default: all)
+        context_fields: context_metadata fields to return as `context.<field>` columns
+        start_date: Optional inclusive start
+        end_date: Optional exclusive end
+        professional_stages: Optional stage filter
+        archive_path: Archive directory (default: INTERACTION_ARCHIVE next to the database)
+
+    Returns:
+        DataFrame with the requested columns; `timestamp` as datetime64
+    """
+    import pandas as pd
+
+    archive_path = archive_path or default_archive_path(db_path)
+    columns = list(columns or _COLUMN_KINDS)
+    context_columns = [CONTEXT_PREFIX + field for field in context_fields]
+    lower = to_epoch_micros(start_date) if start_date else _MIN_MICROS
+    upper = to_epoch_micros(end_date) if end_date else _MAX_MICROS
+    stages = set(professional_stages or ())
+
+    manifest = load_archive_manifest(archive_path)
+    frames = [
+        _read_partition(archive_path, partition, columns + context_columns, lower, upper, professional_stages)
+        for partition in manifest['partitions']
+        if partition['max_timestamp'] >= lower and partition['min_timestamp'] < upper
+        and (not stages or not stages.isdisjoint(partition['professional_stages']))
+    ]
+
+    watermark = manifest['watermark']
+    tail_columns = columns + (['context_metadata'] if context_fields and 'context_metadata' not in columns else [])
+    tails = []
+    with get_interaction_database(db_path).reader() as conn:
+        tail_lower = lower if watermark is None else max(lower, watermark)
+        if tail_lower < upper:
+            tails.append(_fetch_columns(conn, tail_columns, tail_lower, upper, professional_stages))
+        if watermark is not None and lower < min(upper, watermark):
+            tails.append(_fetch_late_rows(conn, manifest, tail_columns, lower, min(upper, watermark), professional_stages))
+    for tail in tails:
+        if context_fields:
+            tail.update(flatten_context_metadata(tail['context_metadata'], context_fields))
+        frames.append(pd.DataFrame(tail))
+
+    frames = [frame for frame in frames if len(frame)] or frames[:1]
+    frame = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    frame = frame.reindex(columns=columns + context_columns)
+    if 'timestamp' in frame:
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'], unit='us')
+    return frame
@@ -0,0 +1,203 @@
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Applied to every connection; journal_mode=WAL is set once by the first writer
+DEFAULT_PRAGMAS: Tuple[Tuple[str, object], ...] = (
+    ("page_size", 16384),        # New files only: wide text index keys split pages less often
+    ("synchronous", "NORMAL"),   # Safe with WAL; fsync at checkpoints instead of every commit
+    ("wal_autocheckpoint", 4000),  # Checkpoint every ~64 MiB of WAL rather than after each large batch
+    ("cache_size", -65536),      # 64 MiB page cache (negative = KiB)
+    ("mmap_size", 268435456),    # Read through a 256 MiB memory map
+    ("temp_store", "MEMORY"),
+    ("busy_timeout", 5000),      # Wait for a competing writer instead of failing immediately
+)
+
+# user_interactions columns in table order -> storage kind (int64, float64 or str)
+INTERACTION_COLUMN_TYPES: Tuple[Tuple[str, str], ...] = (
+    ("interaction_id", "str"),
+    ("user_hash", "str"),
+    ("timestamp", "int64"),         # Epoch microseconds
+    ("current_directory", "str"),
+    ("target_directory", "str"),
+    ("professional_stage", "str"),
+    ("interaction_type", "str"),
+    ("interaction_duration", "float64"),
+    ("interaction_score", "float64"),
+    ("context_metadata", "str"),    # Serialized JSON
+)
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+def to_epoch_micros(value: datetime) -> int:
+    """
+    Encode a timestamp as integer microseconds since 1970-01-01
+
+    Interactions are recorded with naive local wall-clock times, which are
+    encoded on their own clock (no timezone shift), so encoding and decoding
+    round-trip exactly. Aware datetimes are first converted to that local
+    wall clock; the schema migration routes offset-aware ISO strings through
+    here too, so they are stored the same way whichever path converts them.
+
+    Args:
+        value: Timestamp
+
+    Returns:
+        Epoch microseconds
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone().replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+def from_epoch_micros(value: int) -> datetime:
+    """
+    Decode epoch microseconds written by to_epoch_micros
+
+    Args:
+        value: Epoch microseconds
+
+    Returns:
+        Naive datetime
+    """
+    return _EPOCH + timedelta(microseconds=value)
+
+class InteractionDatabase:
+    """
+    Shared access layer for the user interaction database
+
+    Design Philosophy: Let ingestion and analysis run side by side
+    Core Objective: One tuned, reusable connection per thread instead of one per call
+
+    The database runs in WAL mode, so readers never block the writer and the
+    writer never blocks readers. Each thread gets its own read-write and
+    read-only connection (sqlite3 connections are not shared across threads);
+    read-only connections use a `mode=ro` URI and cannot modify the file.
+    """
+
+    def __init__(self, db_path: str, pragmas: Tuple[Tuple[str, object], ...] = DEFAULT_PRAGMAS):
+        """
+        Initialize Interaction Database
+
+        Args:
+            db_path: SQLite database file
+            pragmas: (name, value) pragmas applied to each new connection
+        """
+        self.db_path = os.path.abspath(db_path)
+        self.pragmas = pragmas
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._wal_enabled = False
+
+    def _open(self, read_only: bool) -> sqlite3.Connection:
+        """
+        Open and configure one connection
+
+        Args:
+            read_only: Open with a mode=ro URI
+
+        Returns:
+            Configured connection
+        """
+        if read_only:
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True)
+        else:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            conn = sqlite3.connect(self.db_path)
+
+        for name, value in self.pragmas:
+            conn.execute(f"PRAGMA {name}={value}")
+
+        if read_only:
+            conn.execute("PRAGMA query_only=ON")
+        elif not self._wal_enabled:
+            # Persistent: stored in the file, so later readers open it in WAL mode too
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._wal_enabled = True
+
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """
+        This thread's pooled connection
+
+        Args:
+            read_only: Return the read-only connection
+
+        Returns:
+            sqlite3 connection owned by the calling thread
+        """
+        attribute = 'reader' if read_only else 'writer'
+        conn = getattr(self._local, attribute, None)
+        if conn is None:
+            conn = self._open(read_only)
+            setattr(self._local, attribute, conn)
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Read-write connection inside one transaction (committed on success, rolled back on error)
+        """
+        conn = self.connection()
+        with conn:
+            yield conn
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """
+        Read-only connection for analysis queries
+        """
+        yield self.connection(read_only=True)
+
+    def close_thread_connections(self):
+        """
+        Close the calling thread's connections (e.g. when a worker thread exits)
+        """
+        for attribute in ('reader', 'writer'):
+            conn = getattr(self._local, attribute, None)
+            if conn is not None:
+                setattr(self._local, attribute, None)
+                with self._lock:
+                    if conn in self._connections:
+                        self._connections.remove(conn)
+                conn.close()
+
+    def close_all(self):
+        """
+        Close every pooled connection (call from the owning threads' shutdown path)
+        """
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.ProgrammingError:
+                pass  # Owned by another thread; it is closed when that thread's pool is dropped
+        self._local = threading.local()
+
+_databases: Dict[str, InteractionDatabase] = {}
+_databases_lock = threading.Lock()
+
+def get_interaction_database(db_path: str) -> InteractionDatabase:
+    """
+    Process-wide access layer for a database file
+
+    Args:
+        db_path: SQLite database file
+
+    Returns:
+        Shared InteractionDatabase
+    """
+    path = os.path.abspath(db_path)
+    with _databases_lock:
+        database = _databases.get(path)
+        if database is None:
+            database = _databases[path] = InteractionDatabase(path)
+        return database
@@ -0,0 +1,168 @@
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+class KeywordMatch(NamedTuple):
+    """
+    One keyword occurrence; start/end are character offsets into the classified text
+    """
+    label: str
+    keyword: str
+    start: int
+    end: int
+
+class KeywordCategorizer:
+    """
+    Compiled multi-keyword categorizer (Aho-Corasick automaton)
+
+    Design Philosophy: Build the vocabulary once, read each name once
+    Core Objective: Replace nested category x keyword substring loops
+
+    Matching keeps the semantics of `keyword in name`: keywords match anywhere
+    inside a name, including inside longer words, and overlapping matches are
+    all reported. Labels keep the order of the vocabulary they were built from,
+    so "first matching category wins" callers get the same answer as before.
+    """
+
+    def __init__(self, vocabulary: Mapping[str, Iterable[str]], case_sensitive: bool = False):
+        """
+        Compile the automaton
+
+        Args:
+            vocabulary: Label -> keywords, in priority order
+            case_sensitive: Match keywords with their exact case
+        """
+        self.case_sensitive = case_sensitive
+        self.labels: Tuple[str, ...] = tuple(vocabulary.keys())
+        self._label_order: Dict[str, int] = {label: i for i, label in enumerate(self.labels)}
+
+        # keyword -> labels that use it (a word can appear in several categories)
+        keyword_labels: Dict[str, List[int]] = {}
+        for label_id, label in enumerate(self.labels):
+            for keyword in vocabulary[label]:
+                keyword = self._normalize(keyword)
+                if not keyword:
+                    continue
+                owners = keyword_labels.setdefault(keyword, [])
+                if label_id not in owners:
+                    owners.append(label_id)
+
+        self.keywords: Tuple[str, ...] = tuple(keyword_labels)
+        self._keyword_labels: Tuple[Tuple[int, ...], ...] = tuple(
+            tuple(owners) for owners in keyword_labels.values()
+        )
+        self._build_automaton()
+
+    @classmethod
+    def from_category_names(cls, categories: Sequence[str], case_sensitive: bool = False) -> "KeywordCategorizer":
+        """
+        Build a categorizer whose keywords are the words of each category name
+
+        Args:
+            categories: Category names, e.g. "AI & Technology"
+            case_sensitive: Match keywords with their exact case
+
+        Returns:
+            Compiled categorizer
+        """
+        return cls({category: category.split() for category in categories}, case_sensitive)
+
+    def _normalize(self, text: str) -> str:
+        return text if self.case_sensitive else text.lower()
+
+    def _build_automaton(self):
+        """
+        Build the goto trie, failure links and merged output sets
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        for keyword_id, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    outputs.append([])
+                state = next_state
+            outputs[state].append(keyword_id)
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Breadth-first order guarantees the failure state is already complete
+                outputs[next_state].extend(outputs[self._fail[next_state]])
+
+        self._outputs: Tuple[Tuple[int, ...], ...] = tuple(tuple(output) for output in outputs)
+
+    def find_matches(self, text: str) -> List[KeywordMatch]:
+        """
+        Find every keyword occurrence in one pass over the text
+
+        Args:
+            text: Name to classify
+
+        Returns:
+            Matches ordered by end position, one per (keyword, label) pair
+        """
+        matches = []
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        state = 0
+        for position, char in enumerate(self._normalize(text)):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for keyword_id in outputs[state]:
+                keyword = self.keywords[keyword_id]
+                start = position + 1 - len(keyword)
+                for label_id in self._keyword_labels[keyword_id]:
+                    matches.append(KeywordMatch(self.labels[label_id], keyword, start, position + 1))
+        return matches
+
+    def classify(self, text: str) -> List[str]:
+        """
+        All labels with at least one matching keyword
+
+        Args:
+            text: Name to classify
+
+        Returns:
+            Matching labels in vocabulary order
+        """
+        found = {match.label for match in self.find_matches(text)}
+        return [label for label in self.labels if label in found]
+
+    def primary_label(self, text: str) -> Optional[str]:
+        """
+        Highest-priority matching label
+
+        Args:
+            text: Name to classify
+
+        Returns:
+            First matching label in vocabulary order, or None
+        """
+        matches = self.find_matches(text)
+        if not matches:
+            return None
+        return min((match.label for match in matches), key=self._label_order.__getitem__)
+
+    def classify_many(self, texts: Iterable[str]) -> Dict[str, List[KeywordMatch]]:
+        """
+        Batch classification
+
+        Args:
+            texts: Names to classify
+
+        Returns:
+            Name -> all keyword matches (empty list when nothing matched)
+        """
+        return {text: self.find_matches(text) for text in texts}
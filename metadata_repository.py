@@ -0,0 +1,212 @@
+import os
+import json
+import hashlib
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert parsed JSON into read-only containers
+
+    Args:
+        value: Parsed JSON value
+
+    Returns:
+        Value with dicts as mapping proxies and lists as tuples
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def thaw(value: Any) -> Any:
+    """
+    Recursively copy read-only metadata back into plain JSON containers
+
+    Use at serialization boundaries and for results handed to callers, which
+    may mutate them or pass them to json.dump.
+
+    Args:
+        value: Value from a metadata snapshot
+
+    Returns:
+        Value with mappings as dicts and tuples as lists
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+# Stat signature recorded for a metadata file that does not exist
+MISSING_SIGNATURE: Tuple[int, int] = (-1, -1)
+
+class MetadataSnapshot:
+    """
+    Immutable, indexed view of one version of the cross-referencing metadata
+
+    Design Philosophy: Parse once, share everywhere
+    Core Objective: Give every engine the same precomputed lookups
+    """
+
+    def __init__(
+        self,
+        path: str,
+        data: Dict[str, Any],
+        fingerprint: str = "",
+        signature: Tuple[int, int] = (0, 0)
+    ):
+        """
+        Build the snapshot and its indexes
+
+        Args:
+            path: Absolute path to the metadata file
+            data: Parsed metadata dictionary
+            fingerprint: SHA-256 hex digest of the raw metadata bytes
+            signature: (mtime in nanoseconds, size) of the file when it was read
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.signature = signature
+        self.data: Mapping[str, Any] = _freeze(data)
+
+        dir_relationships = self.data.get('directory_relationships', {})
+        pathways = self.data.get('professional_growth_pathways', {})
+
+        self.directories: Tuple[str, ...] = tuple(dir_relationships.keys())
+        self.stages: Tuple[str, ...] = tuple(pathways.keys())
+        self.directory_index: Mapping[str, int] = MappingProxyType(
+            {directory: i for i, directory in enumerate(self.directories)}
+        )
+        self.stage_index: Mapping[str, int] = MappingProxyType(
+            {stage: i for i, stage in enumerate(self.stages)}
+        )
+        self.connection_sets: Mapping[str, frozenset] = MappingProxyType({
+            directory: frozenset(details.get('primary_connections', ()))
+            for directory, details in dir_relationships.items()
+        })
+        self.tag_sets: Mapping[str, frozenset] = MappingProxyType({
+            directory: frozenset(details.get('context_tags', ()))
+            for directory, details in dir_relationships.items()
+        })
+        self.pathway_sets: Mapping[str, frozenset] = MappingProxyType({
+            stage: frozenset(details.get('recommended_resources', ()))
+            for stage, details in pathways.items()
+        })
+
+    def __bool__(self) -> bool:
+        return bool(self.data)
+
+class MetadataRepository:
+    """
+    Process-wide cache of parsed cross-referencing metadata
+
+    Snapshots are keyed by absolute path and revalidated against the file's
+    mtime and size, so repeated loads cost one stat call.
+    """
+
+    def __init__(self):
+        self._snapshots: Dict[str, MetadataSnapshot] = {}
+        self._lock = threading.Lock()
+
+    def get(self, metadata_path: str) -> MetadataSnapshot:
+        """
+        Return the current snapshot for a metadata file
+
+        Args:
+            metadata_path: Path to metadata JSON file
+
+        Returns:
+            Cached or freshly parsed metadata snapshot (empty if unreadable)
+        """
+        path = os.path.abspath(metadata_path)
+
+        try:
+            stat = os.stat(path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = MISSING_SIGNATURE
+
+        with self._lock:
+            snapshot = self._snapshots.get(path)
+            if snapshot is not None and snapshot.signature == signature:
+                return snapshot
+
+            snapshot = self._read_snapshot(path, metadata_path, signature)
+            self._snapshots[path] = snapshot
+            return snapshot
+
+    def _read_snapshot(
+        self,
+        path: str,
+        metadata_path: str,
+        signature: Tuple[int, int]
+    ) -> MetadataSnapshot:
+        """
+        Parse a metadata file into a snapshot
+
+        Unreadable files yield an empty snapshot carrying the same signature,
+        so it is cached (and reported) once until the file appears or changes.
+
+        Args:
+            path: Absolute path to the metadata file
+            metadata_path: Path as given by the caller (for messages)
+            signature: Stat signature of the file, or MISSING_SIGNATURE
+
+        Returns:
+            Parsed or empty metadata snapshot
+        """
+        if signature == MISSING_SIGNATURE:
+            print(f"❌ Metadata file not found: {metadata_path}")
+            return MetadataSnapshot(path, {}, signature=signature)
+
+        try:
+            with open(path, 'rb') as f:
+                raw = f.read()
+            data = json.loads(raw)
+        except OSError:
+            print(f"❌ Metadata file not found: {metadata_path}")
+            return MetadataSnapshot(path, {}, signature=MISSING_SIGNATURE)
+        except json.JSONDecodeError:
+            print(f"❌ Invalid JSON in metadata file: {metadata_path}")
+            return MetadataSnapshot(path, {}, signature=signature)
+
+        return MetadataSnapshot(path, data, hashlib.sha256(raw).hexdigest(), signature)
+
+    def invalidate(self, metadata_path: Optional[str] = None):
+        """
+        Drop cached snapshots
+
+        Args:
+            metadata_path: Optional single file to forget; clears everything if omitted
+        """
+        with self._lock:
+            if metadata_path is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(os.path.abspath(metadata_path), None)
+
+_repository = MetadataRepository()
+
+def load_metadata_snapshot(metadata_path: str) -> MetadataSnapshot:
+    """
+    Load metadata through the shared process-wide repository
+
+    Args:
+        metadata_path: Path to metadata JSON file
+
+    Returns:
+        Shared metadata snapshot
+    """
+    return _repository.get(metadata_path)
+
+def get_metadata_repository() -> MetadataRepository:
+    """
+    Access the shared process-wide repository
+
+    Returns:
+        Metadata repository instance
+    """
+    return _repository
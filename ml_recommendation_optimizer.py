@@ -1,11 +1,83 @@
 import json
 import os
+import pickle
 import numpy as np
-from typing import Dict, List, Any, Tuple
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.neural_network import MLPRegressor
-from sklearn.metrics import mean_squared_error, r2_score
+from datetime import datetime
+from typing import Dict, List, Any, Tuple, Mapping, Optional, Sequence
+
+from atomic_io import atomic_write_bytes
+from metadata_repository import load_metadata_snapshot
+from categorical_encoder import CategoricalEncoder
+
+TRAINING_COLUMNS = ("current_directory", "target_directory", "current_stage", "interaction_score")
+
+def generate_synthetic_interactions(
+    directories: Sequence[str],
+    professional_stages: Sequence[str],
+    n_samples: int = 1000,
+    seed: int = 42,
+    connection_sets: Optional[Mapping[str, frozenset]] = None,
+    as_dataframe: bool = False
+) -> Dict[str, np.ndarray]:
+    """
+    Draw synthetic interactions in a handful of vectorized NumPy calls
+    
+    Targets are drawn from the other directories by offsetting a draw over
+    len(directories) - 1 slots past the current directory, so no row is a
+    self-interaction and nothing is rejected.
+    
+    Args:
+        directories: Candidate directories
+        professional_stages: Candidate professional stages
+        n_samples: Number of rows to generate
+        seed: Random seed for reproducibility
+        connection_sets: Optional directory -> primary connections; when given,
+            interaction scores for connected pairs are drawn from [0.5, 1) and
+            all others from [0, 0.5)
+        as_dataframe: Return a pandas DataFrame with categorical columns
+    
+    Returns:
+        Columnar training data keyed by TRAINING_COLUMNS
+    """
+    rng = np.random.default_rng(seed)
+    num_directories = len(directories)
+    if num_directories < 2 or not professional_stages:
+        n_samples = 0
+    
+    current_codes = rng.integers(0, max(num_directories, 1), n_samples)
+    target_codes = rng.integers(0, max(num_directories - 1, 1), n_samples)
+    target_codes += target_codes >= current_codes
+    stage_codes = rng.integers(0, max(len(professional_stages), 1), n_samples)
+    interaction_scores = rng.random(n_samples)
+    
+    if connection_sets is not None and n_samples:
+        directory_index = {directory: i for i, directory in enumerate(directories)}
+        connected = np.zeros((num_directories, num_directories), dtype=bool)
+        for directory, connections in connection_sets.items():
+            if directory in directory_index:
+                for connection in connections:
+                    if connection in directory_index:
+                        connected[directory_index[directory], directory_index[connection]] = True
+        is_connected = connected[current_codes, target_codes]
+        interaction_scores = np.where(is_connected, 0.5 + 0.5 * interaction_scores, 0.5 * interaction_scores)
+    
+    if as_dataframe:
+        import pandas as pd
+        return pd.DataFrame({
+            "current_directory": pd.Categorical.from_codes(current_codes, categories=list(directories)),
+            "target_directory": pd.Categorical.from_codes(target_codes, categories=list(directories)),
+            "current_stage": pd.Categorical.from_codes(stage_codes, categories=list(professional_stages)),
+            "interaction_score": interaction_scores
+        })
+    
+    directory_names = np.asarray(directories, dtype=str)
+    stage_names = np.asarray(professional_stages, dtype=str)
+    return {
+        "current_directory": directory_names[current_codes] if n_samples else np.array([], dtype=str),
+        "target_directory": directory_names[target_codes] if n_samples else np.array([], dtype=str),
+        "current_stage": stage_names[stage_codes] if n_samples else np.array([], dtype=str),
+        "interaction_score": interaction_scores
+    }
 
 class MLRecommendationOptimizer:
     """
@@ -15,19 +87,58 @@ class MLRecommendationOptimizer:
     Local Economic Context: Maximize professional growth, minimize resource investment
     """
     
-    def __init__(self, metadata_path: str, training_data_path: str = None):
+    # Bump whenever the pickled artifact layout or feature encoding changes
+    MODEL_ARTIFACT_VERSION = 1
+    
+    def __init__(
+        self, 
+        metadata_path: str, 
+        training_data_path: str = None,
+        model_artifact_path: str = None,
+        warm_start: bool = False
+    ):
         """
         Initialize ML Recommendation Optimizer
         
         Args:
             metadata_path: Path to cross-referencing metadata
             training_data_path: Optional path to historical interaction data
+            model_artifact_path: Optional path to a saved scaler/model artifact
+            warm_start: Load the saved artifact at construction instead of training on first use
         """
         self.metadata = self._load_metadata(metadata_path)
-        self.training_data = self._load_training_data(training_data_path) if training_data_path else self._generate_synthetic_training_data()
+        self.directory_encoder = CategoricalEncoder(self.metadata_snapshot.directories, unknown_value=0.5)
+        self.stage_encoder = CategoricalEncoder(self.metadata_snapshot.stages, unknown_value=0.5)
+        self.training_data_path = training_data_path
+        self._training_data = None
+        self.model_artifact_path = model_artifact_path or os.path.join(
+            os.path.dirname(os.path.abspath(metadata_path)), 'MODEL_CHECKPOINTS', 'ml_recommendation_optimizer.pkl'
+        )
         
+        # sklearn is imported lazily; both are set by training or load_model_artifact
         self.model = None
-        self.scaler = StandardScaler()
+        self.scaler = None
+        
+        if warm_start:
+            self.load_model_artifact()
+    
+    @property
+    def training_data(self) -> Dict[str, np.ndarray]:
+        """
+        Training data, loaded or generated on first access
+        
+        Warm-started workers that never train never pay for it.
+        """
+        if self._training_data is None:
+            self._training_data = (
+                self._load_training_data(self.training_data_path) 
+                if self.training_data_path else self._generate_synthetic_training_data()
+            )
+        return self._training_data
+    
+    @training_data.setter
+    def training_data(self, value: Dict[str, np.ndarray]):
+        self._training_data = value
     
     def _load_metadata(self, metadata_path: str) -> Dict[str, Any]:
         """
@@ -37,61 +148,56 @@ class MLRecommendationOptimizer:
             metadata_path: Path to metadata JSON file
         
         Returns:
-            Parsed metadata dictionary
+            Read-only metadata mapping shared through the metadata repository
         """
-        try:
-            with open(metadata_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"❌ Metadata Loading Error: {e}")
-            return {}
+        self.metadata_snapshot = load_metadata_snapshot(metadata_path)
+        return self.metadata_snapshot.data
     
-    def _load_training_data(self, training_data_path: str) -> List[Dict[str, Any]]:
+    def _load_training_data(self, training_data_path: str) -> Dict[str, np.ndarray]:
         """
         Load historical interaction data
         
         Args:
-            training_data_path: Path to training data JSON
+            training_data_path: Path to training data JSON (a list of entries)
         
         Returns:
-            List of training data entries
+            Columnar training data keyed by TRAINING_COLUMNS
         """
         try:
             with open(training_data_path, 'r') as f:
-                return json.load(f)
+                entries = json.load(f)
+            return {
+                column: np.array([entry[column] for entry in entries])
+                for column in TRAINING_COLUMNS
+            }
         except (FileNotFoundError, json.JSONDecodeError):
             print("❌ Training data not found. Generating synthetic data.")
             return self._generate_synthetic_training_data()
     
-    def _generate_synthetic_training_data(self) -> List[Dict[str, Any]]:
+    def _generate_synthetic_training_data(
+        self, 
+        n_samples: int = 1000, 
+        seed: int = 42,
+        use_connection_graph: bool = False
+    ) -> Dict[str, np.ndarray]:
         """
         Generate synthetic training data for model initialization
         
+        Args:
+            n_samples: Number of synthetic interactions
+            seed: Random seed for reproducibility
+            use_connection_graph: Bias interaction scores towards primary connections
+        
         Returns:
-            List of synthetic training data entries
+            Columnar synthetic training data keyed by TRAINING_COLUMNS
         """
-        synthetic_data = []
-        directories = list(self.metadata.get('directory_relationships', {}).keys())
-        professional_stages = list(self.metadata.get('professional_growth_pathways', {}).keys())
-        
-        np.random.seed(42)  # Ensure reproducibility
-        
-        for _ in range(1000):  # Generate 1000 synthetic interactions
-            current_dir = np.random.choice(directories)
-            target_dir = np.random.choice([d for d in directories if d != current_dir])
-            current_stage = np.random.choice(professional_stages)
-            
-            # Simulate interaction score (0-1)
-            interaction_score = np.random.random()
-            
-            synthetic_data.append({
-                "current_directory": current_dir,
-                "target_directory": target_dir,
-                "current_stage": current_stage,
-                "interaction_score": interaction_score
-            })
-        
-        return synthetic_data
+        return generate_synthetic_interactions(
+            self.metadata_snapshot.directories,
+            self.metadata_snapshot.stages,
+            n_samples=n_samples,
+            seed=seed,
+            connection_sets=self.metadata_snapshot.connection_sets if use_connection_graph else None
+        )
     
     def prepare_training_data(self) -> Tuple[np.ndarray, np.ndarray]:
         """
@@ -100,24 +206,23 @@ class MLRecommendationOptimizer:
         Returns:
             Tuple of feature matrix and target vector
         """
-        # Extract features
-        features = []
-        targets = []
+        training_data = self.training_data
+        
+        # Feature engineering over whole columns
+        features = np.column_stack([
+            self.directory_encoder.transform(training_data['current_directory']),
+            self.directory_encoder.transform(training_data['target_directory']),
+            self.stage_encoder.transform(training_data['current_stage'])
+        ])
+        targets = np.asarray(training_data['interaction_score'], dtype=float)
         
-        for entry in self.training_data:
-            # Feature engineering
-            feature_vector = [
-                self._encode_directory(entry['current_directory']),
-                self._encode_directory(entry['target_directory']),
-                self._encode_professional_stage(entry['current_stage'])
-            ]
-            features.append(feature_vector)
-            targets.append(entry['interaction_score'])
+        from sklearn.preprocessing import StandardScaler
         
         # Scale features
+        self.scaler = StandardScaler()
         features_scaled = self.scaler.fit_transform(features)
         
-        return features_scaled, np.array(targets)
+        return features_scaled, targets
     
     def _encode_directory(self, directory: str) -> float:
         """
@@ -129,8 +234,7 @@ class MLRecommendationOptimizer:
         Returns:
             Encoded numerical representation
         """
-        directories = list(self.metadata.get('directory_relationships', {}).keys())
-        return directories.index(directory) / len(directories) if directory in directories else 0.5
+        return self.directory_encoder.encode(directory)
     
     def _encode_professional_stage(self, stage: str) -> float:
         """
@@ -142,13 +246,16 @@ class MLRecommendationOptimizer:
         Returns:
             Encoded numerical representation
         """
-        stages = list(self.metadata.get('professional_growth_pathways', {}).keys())
-        return stages.index(stage) / len(stages) if stage in stages else 0.5
+        return self.stage_encoder.encode(stage)
     
     def train_recommendation_model(self):
         """
         Train neural network for recommendation optimization
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.neural_network import MLPRegressor
+        from sklearn.metrics import mean_squared_error, r2_score
+        
         X, y = self.prepare_training_data()
         
         # Split data
@@ -174,6 +281,76 @@ class MLRecommendationOptimizer:
         print(f"  Mean Squared Error: {mse:.4f}")
         print(f"  R² Score: {r2:.4f}")
     
+    def save_model_artifact(self, artifact_path: str = None) -> str:
+        """
+        Persist the fitted scaler and model as a versioned artifact
+        
+        Args:
+            artifact_path: Optional destination; defaults to self.model_artifact_path
+        
+        Returns:
+            Path to the saved artifact
+        """
+        if not self.model:
+            raise ValueError("No trained model to save. Call train_recommendation_model() first.")
+        
+        import sklearn
+        
+        artifact_path = artifact_path or self.model_artifact_path
+        artifact = {
+            "artifact_version": self.MODEL_ARTIFACT_VERSION,
+            "sklearn_version": sklearn.__version__,
+            "created_at": datetime.now().isoformat(),
+            "metadata_fingerprint": self.metadata_snapshot.fingerprint,
+            "directory_encoder": self.directory_encoder,
+            "stage_encoder": self.stage_encoder,
+            "scaler": self.scaler,
+            "model": self.model
+        }
+        
+        atomic_write_bytes(artifact_path, pickle.dumps(artifact, protocol=pickle.HIGHEST_PROTOCOL))
+        
+        print(f"💾 ML recommendation model saved: {artifact_path}")
+        return artifact_path
+    
+    def load_model_artifact(self, artifact_path: str = None) -> bool:
+        """
+        Load a previously saved scaler and model
+        
+        Only load artifacts produced by trusted offline training jobs; they are pickles.
+        
+        Args:
+            artifact_path: Optional artifact location; defaults to self.model_artifact_path
+        
+        Returns:
+            True if the artifact was compatible and loaded
+        """
+        artifact_path = artifact_path or self.model_artifact_path
+        
+        try:
+            with open(artifact_path, 'rb') as f:
+                artifact = pickle.load(f)
+        except FileNotFoundError:
+            print(f"⚠️ No ML model artifact at {artifact_path}. Model will be trained on first use.")
+            return False
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            print(f"❌ Unreadable ML model artifact {artifact_path}: {e}")
+            return False
+        
+        if artifact.get("artifact_version") != self.MODEL_ARTIFACT_VERSION:
+            print(f"⚠️ ML model artifact version {artifact.get('artifact_version')} is not supported. Retraining required.")
+            return False
+        
+        # Features are ordinal encodings, so the category order must match the current metadata
+        if (artifact["directory_encoder"].categories != self.directory_encoder.categories or
+                artifact["stage_encoder"].categories != self.stage_encoder.categories):
+            print("⚠️ ML model artifact was trained on different metadata. Retraining required.")
+            return False
+        
+        self.scaler = artifact["scaler"]
+        self.model = artifact["model"]
+        return True
+    
     def optimize_recommendations(self, current_dir: str, current_stage: str, candidates: List[str]) -> List[Tuple[str, float]]:
         """
         Optimize recommendations using trained ML model
@@ -186,31 +363,54 @@ class MLRecommendationOptimizer:
         Returns:
             Ranked recommendations with ML-optimized scores
         """
+        return self.optimize_batch_recommendations([(current_dir, current_stage, candidates)])[0]
+    
+    def optimize_batch_recommendations(
+        self, 
+        queries: List[Tuple[str, str, List[str]]]
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Optimize recommendations for many queries with a single transform and predict
+        
+        Args:
+            queries: List of (current directory, professional stage, candidate directories)
+        
+        Returns:
+            One ranked recommendation list per query
+        """
         if not self.model:
             self.train_recommendation_model()
         
-        optimized_recommendations = []
-        
-        for target_dir in candidates:
-            # Prepare feature vector
-            feature_vector = [
-                self._encode_directory(current_dir),
-                self._encode_directory(target_dir),
-                self._encode_professional_stage(current_stage)
-            ]
+        # One feature row per (query, candidate) pair
+        current_dirs = []
+        target_dirs = []
+        stages = []
+        for current_dir, current_stage, candidates in queries:
+            current_dirs.extend([current_dir] * len(candidates))
+            target_dirs.extend(candidates)
+            stages.extend([current_stage] * len(candidates))
+        
+        if target_dirs:
+            features = np.column_stack([
+                self.directory_encoder.transform(current_dirs),
+                self.directory_encoder.transform(target_dirs),
+                self.stage_encoder.transform(stages)
+            ])
+            ml_scores = self.model.predict(self.scaler.transform(features)).tolist()
+        else:
+            ml_scores = []
+        
+        batch_recommendations = []
+        offset = 0
+        for _, _, candidates in queries:
+            optimized_recommendations = list(zip(candidates, ml_scores[offset:offset + len(candidates)]))
+            offset += len(candidates)
             
-            # Scale feature vector
-            feature_scaled = self.scaler.transform([feature_vector])
-            
-            # Predict interaction score
-            ml_score = self.model.predict(feature_scaled)[0]
-            
-            optimized_recommendations.append((target_dir, ml_score))
-        
-        # Sort recommendations by ML-optimized score
-        optimized_recommendations.sort(key=lambda x: x[1], reverse=True)
+            # Sort recommendations by ML-optimized score
+            optimized_recommendations.sort(key=lambda x: x[1], reverse=True)
+            batch_recommendations.append(optimized_recommendations)
         
-        return optimized_recommendations
+        return batch_recommendations
 
 def main():
     """
@@ -221,8 +421,9 @@ def main():
     
     print("🌐 Port Townsend Professional Resource Library - ML Recommendation Optimizer")
     
-    # Train initial model
+    # Train initial model and persist it for warm-started workers
     optimizer.train_recommendation_model()
+    optimizer.save_model_artifact()
     
     # Example recommendation scenarios
     scenarios = [
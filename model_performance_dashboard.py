@@ -1,12 +1,16 @@
+from __future__ import annotations
+
 import os
 import json
-import sqlite3
-import numpy as np
-import pandas as pd
-import plotly.graph_objs as go
-import plotly.io as pio
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pandas and plotly are imported on the code paths that need them
+    import pandas as pd
+    import plotly.graph_objs as go
+
+from interaction_archive import read_interactions
 
 class ModelPerformanceDashboard:
     """
@@ -42,22 +46,18 @@ class ModelPerformanceDashboard:
     
     def _load_training_data(self) -> pd.DataFrame:
         """
-        Load training data from SQLite database
+        Load training data for interaction analysis
         
         Returns:
-            Pandas DataFrame with user interactions
+            Pandas DataFrame with user interactions (timestamps and stages only)
         """
+        import pandas as pd
+        
         try:
-            with sqlite3.connect(self.training_data_path) as conn:
-                query = "SELECT * FROM user_interactions"
-                df = pd.read_sql_query(query, conn)
-                
-                # Parse context metadata
-                df['context_metadata'] = df['context_metadata'].apply(
-                    lambda x: json.loads(x) if x else {}
-                )
-                
-                return df
+            return read_interactions(
+                self.training_data_path,
+                columns=['timestamp', 'professional_stage']
+            )
         except Exception as e:
             print(f"❌ Error loading training data: {e}")
             return pd.DataFrame()
@@ -94,6 +94,8 @@ class ModelPerformanceDashboard:
         Returns:
             Plotly interactive figure
         """
+        import plotly.graph_objs as go
+        
         df = self._load_training_data()
         
         # Interaction distribution by professional stage
@@ -123,6 +125,8 @@ class ModelPerformanceDashboard:
         Returns:
             Plotly interactive figure
         """
+        import plotly.graph_objs as go
+        
         metrics = self._load_model_metrics()
         scoring_metrics = metrics.get('recommendation_scoring', {})
         
@@ -160,6 +164,8 @@ class ModelPerformanceDashboard:
         Returns:
             Plotly interactive figure
         """
+        import plotly.graph_objs as go
+        
         metrics = self._load_model_metrics()
         optimizer_metrics = metrics.get('ml_optimizer', {})
         
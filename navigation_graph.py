@@ -0,0 +1,745 @@
+import os
+import mmap
+import struct
+import threading
+import numpy as np
+from collections.abc import Mapping as MappingABC
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from atomic_io import atomic_write_bytes, atomic_write_json
+
+# Sections a visitor can land on directly from the library home page
+DEFAULT_ENTRY_SECTIONS = ("01_Welcome_Message", "03_Navigation_Guide", "04_Quick_Start_Guides")
+
+GRAPH_FILE_MAGIC = b"PTNG"
+GRAPH_FILE_VERSION = 1
+
+# magic, version, nodes, edges, categories, stages, stage entries, string bytes
+_HEADER = struct.Struct("<4sIIIIIIQ")
+_ALIGNMENT = 8
+
+def _aligned(size: int) -> int:
+    return -(-size // _ALIGNMENT) * _ALIGNMENT
+
+class NavigationGraph:
+    """
+    Compact directory adjacency in CSR form
+
+    Design Philosophy: Integer IDs and flat arrays instead of nested name lists
+    Core Objective: Build and store content connections in linear time
+
+    Node i's neighbors are neighbors[offsets[i]:offsets[i + 1]], as indices
+    into names. categories[i] indexes category_names (-1 when uncategorized).
+    Professional stages use the same layout: stage j recommends nodes
+    stage_resources[stage_offsets[j]:stage_offsets[j + 1]].
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        categories: Optional[np.ndarray] = None,
+        category_names: Sequence[str] = (),
+        stage_names: Sequence[str] = (),
+        stage_offsets: Optional[np.ndarray] = None,
+        stage_resources: Optional[np.ndarray] = None
+    ):
+        """
+        Wrap prebuilt CSR arrays (NumPy views are used as-is, without copying)
+
+        Args:
+            names: Directory names, indexed by node ID
+            offsets: int64 array of length len(names) + 1
+            neighbors: int32 array of neighbor node IDs
+            categories: Optional int32 array of category IDs per node
+            category_names: Category names indexed by category ID
+            stage_names: Professional stage names, indexed by stage ID
+            stage_offsets: int64 array of length len(stage_names) + 1
+            stage_resources: int32 array of recommended node IDs
+        """
+        self.names: Tuple[str, ...] = tuple(names)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.neighbors = np.asarray(neighbors, dtype=np.int32)
+        self.categories = (
+            np.full(len(self.names), -1, dtype=np.int32) if categories is None
+            else np.asarray(categories, dtype=np.int32)
+        )
+        self.category_names: Tuple[str, ...] = tuple(category_names)
+        self.stage_names: Tuple[str, ...] = tuple(stage_names)
+        self.stage_offsets = (
+            np.zeros(len(self.stage_names) + 1, dtype=np.int64) if stage_offsets is None
+            else np.asarray(stage_offsets, dtype=np.int64)
+        )
+        self.stage_resources = (
+            np.empty(0, dtype=np.int32) if stage_resources is None
+            else np.asarray(stage_resources, dtype=np.int32)
+        )
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.stage_index: Dict[str, int] = {stage: i for i, stage in enumerate(self.stage_names)}
+        self._buffer = None  # Backing mmap when loaded from disk
+
+        if len(self.offsets) != len(self.names) + 1:
+            raise ValueError("offsets must have one entry per node plus one")
+        if len(self.stage_offsets) != len(self.stage_names) + 1:
+            raise ValueError("stage_offsets must have one entry per stage plus one")
+
+    @classmethod
+    def from_category_rules(
+        cls,
+        directory_relationships: Mapping[str, Mapping[str, Any]],
+        connection_rules: Mapping[str, Iterable[str]]
+    ) -> "NavigationGraph":
+        """
+        Connect each directory to every directory whose category its own category's rule names
+
+        Directories are bucketed by primary category once, and each category's
+        target list is assembled once and shared by all of its directories, so
+        the build is linear in directories plus emitted edges. Neighbor order
+        follows directory order, matching the original pairwise scan.
+
+        Args:
+            directory_relationships: Directory -> details with "primary_category"
+            connection_rules: Category -> connected categories
+
+        Returns:
+            Navigation graph
+        """
+        names = list(directory_relationships)
+        category_of = [details.get("primary_category") for details in directory_relationships.values()]
+        category_names = [category for category in dict.fromkeys(category_of) if category is not None]
+        category_ids = {category: i for i, category in enumerate(category_names)}
+
+        buckets: Dict[str, List[int]] = {}
+        for node, category in enumerate(category_of):
+            buckets.setdefault(category, []).append(node)
+
+        targets_by_category: Dict[Any, np.ndarray] = {}
+        empty = np.empty(0, dtype=np.int32)
+        for category in buckets:
+            connected = [
+                buckets[target] for target in dict.fromkeys(connection_rules.get(category or "", ()))
+                if target in buckets
+            ]
+            targets_by_category[category] = (
+                np.sort(np.concatenate(connected)).astype(np.int32) if connected else empty
+            )
+
+        rows = [targets_by_category[category] for category in category_of]
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=offsets[1:])
+        neighbors = np.concatenate(rows).astype(np.int32) if rows else empty
+        categories = np.array(
+            [category_ids.get(category, -1) for category in category_of], dtype=np.int32
+        )
+        return cls(names, offsets, neighbors, categories, category_names)
+
+    @classmethod
+    def from_adjacency(cls, adjacency: Mapping[str, Iterable[str]]) -> "NavigationGraph":
+        """
+        Build from a name -> neighbor names mapping
+
+        Neighbors that are not themselves keys are dropped.
+
+        Args:
+            adjacency: Adjacency lists keyed by directory name
+
+        Returns:
+            Navigation graph
+        """
+        names = list(adjacency)
+        index = {name: i for i, name in enumerate(names)}
+        rows = [[index[neighbor] for neighbor in adjacency[name] if neighbor in index] for name in names]
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=offsets[1:])
+        neighbors = np.fromiter(
+            (node for row in rows for node in row), dtype=np.int32, count=int(offsets[-1])
+        )
+        return cls(names, offsets, neighbors)
+
+    @classmethod
+    def from_metadata(cls, metadata: Mapping[str, Any]) -> "NavigationGraph":
+        """
+        Build from either form of CROSS_REFERENCING_METADATA.json
+
+        Curated metadata lists "primary_connections" per directory and
+        "professional_growth_pathways"; generated metadata has
+        "content_connections" and "primary_category". Directories that are only
+        referenced (as a connection or a stage resource) become nodes too.
+
+        Args:
+            metadata: Parsed cross-referencing metadata
+
+        Returns:
+            Navigation graph including professional stage recommendations
+        """
+        relationships = metadata.get("directory_relationships", {})
+        content_connections = metadata.get("content_connections") or {}
+        pathways = metadata.get("professional_growth_pathways", {})
+
+        adjacency = {
+            directory: list(details.get("primary_connections", ()) or content_connections.get(directory, ()))
+            for directory, details in relationships.items()
+        }
+        stage_lists = {
+            stage: list(details.get("recommended_resources", ())) for stage, details in pathways.items()
+        }
+
+        names = list(adjacency)
+        index = {name: i for i, name in enumerate(names)}
+        for row in [*adjacency.values(), *stage_lists.values()]:
+            for referenced in row:
+                if referenced not in index:
+                    index[referenced] = len(names)
+                    names.append(referenced)
+
+        def to_csr(rows: List[List[str]]) -> Tuple[np.ndarray, np.ndarray]:
+            offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum([len(row) for row in rows], out=offsets[1:])
+            ids = np.fromiter((index[n] for row in rows for n in row), dtype=np.int32, count=int(offsets[-1]))
+            return offsets, ids
+
+        offsets, neighbors = to_csr([adjacency.get(name, []) for name in names])
+        stage_offsets, stage_resources = to_csr(list(stage_lists.values()))
+
+        category_of = [relationships.get(name, {}).get("primary_category") for name in names]
+        category_names = [category for category in dict.fromkeys(category_of) if category is not None]
+        category_ids = {category: i for i, category in enumerate(category_names)}
+        categories = np.array([category_ids.get(category, -1) for category in category_of], dtype=np.int32)
+
+        return cls(
+            names, offsets, neighbors, categories, category_names,
+            list(stage_lists), stage_offsets, stage_resources
+        )
+
+    @property
+    def node_count(self) -> int:
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        return int(self.offsets[-1])
+
+    def neighbor_ids(self, node: int) -> np.ndarray:
+        """
+        Neighbor IDs of one node (a view, not a copy)
+        """
+        return self.neighbors[self.offsets[node]:self.offsets[node + 1]]
+
+    def neighbors_of(self, name: str) -> List[str]:
+        """
+        Neighbor names of one directory
+
+        Args:
+            name: Directory name
+
+        Returns:
+            Connected directory names
+        """
+        names = self.names
+        return [names[node] for node in self.neighbor_ids(self.index[name]).tolist()]
+
+    def category_of(self, name: str) -> Optional[str]:
+        category = int(self.categories[self.index[name]])
+        return self.category_names[category] if category >= 0 else None
+
+    def stage_resources_of(self, stage: str) -> List[str]:
+        """
+        Recommended directory names for one professional stage
+
+        Args:
+            stage: Professional stage name
+
+        Returns:
+            Recommended directories, in pathway order
+        """
+        stage_id = self.stage_index[stage]
+        start, end = self.stage_offsets[stage_id], self.stage_offsets[stage_id + 1]
+        return [self.names[node] for node in self.stage_resources[start:end].tolist()]
+
+    def with_nodes(self, names: Iterable[str]) -> "NavigationGraph":
+        """
+        Copy of the graph with extra isolated nodes (existing names are skipped)
+
+        Args:
+            names: Directory names to add
+
+        Returns:
+            Extended navigation graph
+        """
+        extra = [name for name in dict.fromkeys(names) if name not in self.index]
+        if not extra:
+            return self
+        offsets = np.concatenate([self.offsets, np.full(len(extra), self.offsets[-1], dtype=np.int64)])
+        categories = np.concatenate([self.categories, np.full(len(extra), -1, dtype=np.int32)])
+        return NavigationGraph(
+            [*self.names, *extra], offsets, self.neighbors, categories, self.category_names,
+            self.stage_names, self.stage_offsets, self.stage_resources
+        )
+
+    def in_degree(self) -> np.ndarray:
+        """
+        Number of inbound connections per node
+        """
+        return np.bincount(self.neighbors, minlength=self.node_count)
+
+    def _expand(self, frontier: np.ndarray) -> np.ndarray:
+        """
+        Concatenated neighbor IDs of every node in the frontier
+        """
+        starts = self.offsets[frontier]
+        lengths = self.offsets[frontier + 1] - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.empty(0, dtype=np.int32)
+        row_starts = np.cumsum(lengths) - lengths
+        positions = np.arange(total) - np.repeat(row_starts, lengths) + np.repeat(starts, lengths)
+        return self.neighbors[positions]
+
+    def _bfs(self, sources: np.ndarray, distances: np.ndarray):
+        """
+        Level-synchronous BFS, filling distances (pre-set to -1) in place
+        """
+        distances[sources] = 0
+        frontier = np.unique(sources)
+        depth = 0
+        while frontier.size:
+            depth += 1
+            reached = self._expand(frontier)
+            frontier = np.unique(reached[distances[reached] < 0])
+            distances[frontier] = depth
+
+    def shortest_click_distances(self, sources: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        Click distances from each source node to every node
+
+        Args:
+            sources: Source node IDs (all nodes when omitted)
+
+        Returns:
+            int32 matrix of shape (len(sources), node_count); -1 means unreachable
+        """
+        sources = range(self.node_count) if sources is None else sources
+        distances = np.full((len(sources), self.node_count), -1, dtype=np.int32)
+        for row, source in enumerate(sources):
+            self._bfs(np.array([source], dtype=np.int64), distances[row])
+        return distances
+
+    def distances_from_any(self, sources: Sequence[int]) -> np.ndarray:
+        """
+        Click distance from the nearest of several sources (multi-source BFS)
+
+        Args:
+            sources: Source node IDs
+
+        Returns:
+            int32 array of length node_count; -1 means unreachable
+        """
+        distances = np.full(self.node_count, -1, dtype=np.int32)
+        if len(sources):
+            self._bfs(np.asarray(sources, dtype=np.int64), distances)
+        return distances
+
+    def connections(self) -> "NavigationConnections":
+        """
+        Lazy name -> neighbor names view, for the JSON form
+        """
+        return NavigationConnections(self)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """
+        Materialize the full name -> neighbor names dictionary
+        """
+        return {name: self.neighbors_of(name) for name in self.names}
+
+    def to_json_dict(self) -> Dict[str, Any]:
+        """
+        JSON export of the whole graph (used by the site build)
+
+        Returns:
+            Directories with category and connections, plus stage pathways
+        """
+        return {
+            "directories": {
+                name: {"primary_category": self.category_of(name), "connections": self.neighbors_of(name)}
+                for name in self.names
+            },
+            "professional_growth_pathways": {
+                stage: {"recommended_resources": self.stage_resources_of(stage)}
+                for stage in self.stage_names
+            }
+        }
+
+    def export_json(self, path: str) -> str:
+        """
+        Write the JSON export
+
+        Args:
+            path: Output file
+
+        Returns:
+            Path to the written file
+        """
+        atomic_write_json(path, self.to_json_dict(), indent=2)
+        return path
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to the binary graph format
+
+        Layout (little-endian, every section 8-byte aligned): header, string
+        offsets (int64), UTF-8 string data, node offsets (int64), neighbors
+        (int32), categories (int32), stage offsets (int64), stage resources
+        (int32). The string table holds node, category, then stage names.
+
+        Returns:
+            Serialized graph
+        """
+        strings = [*self.names, *self.category_names, *self.stage_names]
+        encoded = [string.encode('utf-8') for string in strings]
+        string_offsets = np.zeros(len(encoded) + 1, dtype='<i8')
+        np.cumsum([len(item) for item in encoded], out=string_offsets[1:])
+        string_data = b"".join(encoded)
+
+        sections = [
+            string_offsets.tobytes(),
+            string_data,
+            self.offsets.astype('<i8').tobytes(),
+            self.neighbors.astype('<i4').tobytes(),
+            self.categories.astype('<i4').tobytes(),
+            self.stage_offsets.astype('<i8').tobytes(),
+            self.stage_resources.astype('<i4').tobytes(),
+        ]
+        header = _HEADER.pack(
+            GRAPH_FILE_MAGIC, GRAPH_FILE_VERSION, self.node_count, self.edge_count,
+            len(self.category_names), len(self.stage_names), len(self.stage_resources), len(string_data)
+        )
+        chunks = [header, b"\0" * (_aligned(len(header)) - len(header))]
+        for section in sections:
+            chunks.append(section)
+            chunks.append(b"\0" * (_aligned(len(section)) - len(section)))
+        return b"".join(chunks)
+
+    def save(self, path: str) -> bool:
+        """
+        Write the binary graph file atomically
+
+        Args:
+            path: Output file
+
+        Returns:
+            True if written, False if the file already held identical content
+        """
+        return atomic_write_bytes(path, self.to_bytes())
+
+    @classmethod
+    def from_buffer(cls, buffer) -> "NavigationGraph":
+        """
+        Decode the binary graph format; array sections are zero-copy views
+
+        Args:
+            buffer: bytes, mmap or any object supporting the buffer protocol
+
+        Returns:
+            Navigation graph backed by the buffer
+        """
+        magic, version, node_count, edge_count, category_count, stage_count, stage_entries, string_bytes = (
+            _HEADER.unpack_from(buffer, 0)
+        )
+        if magic != GRAPH_FILE_MAGIC:
+            raise ValueError("Not a navigation graph file")
+        if version != GRAPH_FILE_VERSION:
+            raise ValueError(f"Unsupported navigation graph version: {version}")
+
+        position = _aligned(_HEADER.size)
+
+        def take(dtype: str, count: int) -> np.ndarray:
+            nonlocal position
+            array = np.frombuffer(buffer, dtype=dtype, count=count, offset=position)
+            position += _aligned(array.nbytes)
+            return array
+
+        string_count = node_count + category_count + stage_count
+        string_offsets = take('<i8', string_count + 1)
+        string_data = bytes(take('u1', string_bytes))
+        strings = [
+            string_data[start:end].decode('utf-8')
+            for start, end in zip(string_offsets[:-1].tolist(), string_offsets[1:].tolist())
+        ]
+
+        offsets = take('<i8', node_count + 1)
+        neighbors = take('<i4', edge_count)
+        categories = take('<i4', node_count)
+        stage_offsets = take('<i8', stage_count + 1)
+        stage_resources = take('<i4', stage_entries)
+
+        graph = cls(
+            strings[:node_count], offsets, neighbors, categories,
+            strings[node_count:node_count + category_count], strings[node_count + category_count:],
+            stage_offsets, stage_resources
+        )
+        graph._buffer = buffer
+        return graph
+
+    @classmethod
+    def load(cls, path: str, use_mmap: bool = True) -> "NavigationGraph":
+        """
+        Load a binary graph file
+
+        With use_mmap the arrays are read-only views into the page cache, so
+        every process loading the same file shares one copy.
+
+        Args:
+            path: Binary graph file
+            use_mmap: Map the file instead of reading it into memory
+
+        Returns:
+            Navigation graph
+        """
+        with open(path, 'rb') as f:
+            if not use_mmap:
+                return cls.from_buffer(f.read())
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls.from_buffer(buffer)
+
+    def __repr__(self) -> str:
+        return f"NavigationGraph({self.node_count} nodes, {self.edge_count} edges)"
+
+class NavigationConnections(MappingABC):
+    """
+    Read-only mapping view over a NavigationGraph
+
+    Neighbor name lists are only built when a key is looked up, so a graph
+    with many edges is not expanded into strings until it is serialized.
+    """
+
+    def __init__(self, graph: NavigationGraph):
+        self.graph = graph
+
+    def __getitem__(self, name: str) -> List[str]:
+        if name not in self.graph.index:
+            raise KeyError(name)
+        return self.graph.neighbors_of(name)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.graph.names)
+
+    def __len__(self) -> int:
+        return self.graph.node_count
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.graph.index
+
+    def __repr__(self) -> str:
+        return f"NavigationConnections({self.graph!r})"
+
+class NavigationPathAnalysis:
+    """
+    Precomputed click-distance metrics for one navigation graph
+
+    Design Philosophy: Measure navigability deterministically, not by sampling
+    Core Objective: Flag sections that are orphaned, unreachable or too deep
+
+    Distances count clicks along directory connections. Entry sections are
+    0 clicks away; a section one link away from an entry section is 1 click.
+    """
+
+    def __init__(self, graph: NavigationGraph, entry_sections: Sequence[str] = DEFAULT_ENTRY_SECTIONS):
+        """
+        Run the BFS passes
+
+        Args:
+            graph: Navigation graph
+            entry_sections: Sections visitors start from (unknown names are ignored)
+        """
+        self.graph = graph
+        self.entry_sections = tuple(name for name in entry_sections if name in graph.index)
+        self.entry_ids = np.array([graph.index[name] for name in self.entry_sections], dtype=np.int64)
+
+        self.distances = graph.shortest_click_distances()
+        self.entry_distances = graph.distances_from_any(self.entry_ids)
+        self.reachable = self.entry_distances >= 0
+
+        inbound = graph.in_degree()
+        is_entry = np.zeros(graph.node_count, dtype=bool)
+        is_entry[self.entry_ids] = True
+        self._orphaned = np.flatnonzero((inbound == 0) & ~is_entry)
+
+    def clicks(self, source: str, target: str) -> Optional[int]:
+        """
+        Fewest clicks between two sections
+
+        Returns:
+            Click count, or None when the target cannot be reached
+        """
+        distance = int(self.distances[self.graph.index[source], self.graph.index[target]])
+        return distance if distance >= 0 else None
+
+    def clicks_from_entry(self, target: str) -> Optional[int]:
+        """
+        Fewest clicks from the nearest entry section
+
+        Returns:
+            Click count, or None when the target is unknown or unreachable
+        """
+        node = self.graph.index.get(target)
+        if node is None or not self.reachable[node]:
+            return None
+        return int(self.entry_distances[node])
+
+    def shortest_path(self, source: str, target: str) -> List[str]:
+        """
+        One shortest click path (ties go to the earlier-listed connection)
+
+        Returns:
+            Section names from source to target inclusive, or [] if unreachable
+        """
+        graph = self.graph
+        node, goal = graph.index[source], graph.index[target]
+        to_goal = self.distances[:, goal]
+        if to_goal[node] < 0:
+            return []
+
+        path = [node]
+        while node != goal:
+            neighbors = graph.neighbor_ids(node)
+            node = int(neighbors[np.argmax(to_goal[neighbors] == to_goal[node] - 1)])
+            path.append(node)
+        return [graph.names[step] for step in path]
+
+    def path_from_entry(self, target: str) -> List[str]:
+        """
+        Shortest click path from the nearest entry section
+
+        Returns:
+            Section names, or [] when unknown or unreachable
+        """
+        if self.clicks_from_entry(target) is None:
+            return []
+        node = self.graph.index[target]
+        entry = self.entry_ids[np.argmin(np.where(
+            self.distances[self.entry_ids, node] >= 0, self.distances[self.entry_ids, node], np.iinfo(np.int32).max
+        ))]
+        return self.shortest_path(self.graph.names[entry], target)
+
+    @property
+    def orphaned_sections(self) -> List[str]:
+        """
+        Sections no other section links to (entry sections excepted)
+        """
+        return [self.graph.names[node] for node in self._orphaned.tolist()]
+
+    @property
+    def unreachable_sections(self) -> List[str]:
+        """
+        Sections with no click path from any entry section
+        """
+        return [self.graph.names[node] for node in np.flatnonzero(~self.reachable).tolist()]
+
+    def sections_over_budget(self, max_clicks: int) -> Dict[str, int]:
+        """
+        Reachable sections that need more than max_clicks clicks from an entry section
+
+        Args:
+            max_clicks: Click budget
+
+        Returns:
+            Section name -> clicks from the nearest entry section
+        """
+        over = np.flatnonzero(self.entry_distances > max_clicks)
+        return {self.graph.names[node]: int(self.entry_distances[node]) for node in over.tolist()}
+
+    def summary(self, max_clicks: int = 3) -> Dict[str, Any]:
+        """
+        JSON-ready overview of the navigation structure
+
+        Args:
+            max_clicks: Click budget used for sections_over_budget
+
+        Returns:
+            Structure metrics
+        """
+        reachable_depths = self.entry_distances[self.reachable]
+        return {
+            "sections": self.graph.node_count,
+            "connections": self.graph.edge_count,
+            "entry_sections": list(self.entry_sections),
+            "reachable_sections": int(self.reachable.sum()),
+            "max_clicks_from_entry": int(reachable_depths.max()) if reachable_depths.size else 0,
+            "orphaned_sections": self.orphaned_sections,
+            "unreachable_sections": self.unreachable_sections,
+            "sections_over_click_budget": self.sections_over_budget(max_clicks)
+        }
+
+_analysis_cache: Dict[Tuple[str, Tuple[str, ...], Tuple[str, ...]], NavigationPathAnalysis] = {}
+_analysis_lock = threading.Lock()
+
+def analyze_navigation_metadata(
+    metadata_path: str,
+    entry_sections: Sequence[str] = DEFAULT_ENTRY_SECTIONS,
+    extra_sections: Iterable[str] = ()
+) -> NavigationPathAnalysis:
+    """
+    Path analysis for a metadata file, cached by the file's content hash
+
+    Args:
+        metadata_path: Path to CROSS_REFERENCING_METADATA.json
+        entry_sections: Sections visitors start from
+        extra_sections: Library sections to include even when the metadata
+            never mentions them (they show up as orphaned)
+
+    Returns:
+        Shared path analysis
+    """
+    from metadata_repository import load_metadata_snapshot
+
+    snapshot = load_metadata_snapshot(metadata_path)
+    extra_sections = tuple(extra_sections)
+    key = (snapshot.fingerprint, tuple(entry_sections), extra_sections)
+
+    with _analysis_lock:
+        analysis = _analysis_cache.get(key)
+        if analysis is None or not snapshot.fingerprint:
+            graph = NavigationGraph.from_metadata(snapshot.data).with_nodes(extra_sections)
+            analysis = NavigationPathAnalysis(graph, entry_sections)
+            if snapshot.fingerprint:
+                _analysis_cache[key] = analysis
+        return analysis
+
+def json_default(value: Any) -> Any:
+    """
+    json.dump `default` hook for lazy graph views and NumPy values
+
+    Args:
+        value: Object the json module cannot serialize natively
+
+    Returns:
+        JSON-compatible equivalent
+    """
+    if isinstance(value, MappingABC):
+        return dict(value)
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def main():
+    """
+    Convert the cross-referencing metadata into the binary graph format
+    """
+    from metadata_repository import load_metadata_snapshot
+
+    root_directory = os.path.dirname(os.path.abspath(__file__))
+    snapshot = load_metadata_snapshot(os.path.join(root_directory, 'CROSS_REFERENCING_METADATA.json'))
+    if not snapshot:
+        return
+
+    graph = NavigationGraph.from_metadata(snapshot.data)
+    binary_path = os.path.join(root_directory, 'NAVIGATION_GRAPH.bin')
+    graph.save(binary_path)
+    print(f"✅ Navigation Graph Saved: {binary_path} ({os.path.getsize(binary_path)} bytes)")
+    print(f"Nodes: {graph.node_count}, Connections: {graph.edge_count}, Stages: {len(graph.stage_names)}")
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,11 @@
 import os
+import re
 import json
 import time
 import random
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Optional, Tuple
+
+from navigation_graph import DEFAULT_ENTRY_SECTIONS, NavigationPathAnalysis, analyze_navigation_metadata
 
 class NavigationUsabilityTester:
     """
@@ -52,6 +55,9 @@ class NavigationUsabilityTester:
             }
         ]
         
+        # Sections visitors start from when measuring clicks to a destination
+        self.entry_sections = DEFAULT_ENTRY_SECTIONS
+        
         # Usability metrics configuration
         self.usability_metrics = {
             "navigation_time": {"max_acceptable_time": 60},  # seconds
@@ -59,30 +65,50 @@ class NavigationUsabilityTester:
             "user_satisfaction": {"min_acceptable_score": 7}  # out of 10
         }
     
-    def load_navigation_metadata(self) -> Dict[str, Any]:
+    def load_navigation_analysis(self) -> NavigationPathAnalysis:
         """
-        Load existing navigation metadata
+        Load shortest-path metrics for the cross-referencing navigation graph
+        
+        Numbered library sections the metadata never mentions are included, so
+        they are reported as orphaned. Results are cached by metadata content hash.
         
         Returns:
-            Navigation metadata dictionary
+            Navigation path analysis
         """
-        metadata_files = [
-            'CROSS_REFERENCING_METADATA.json',
-            'PORT_TOWNSEND_ECONOMIC_NAVIGATION_METADATA.json'
-        ]
+        library_sections = sorted(
+            entry.name for entry in os.scandir(self.root_directory)
+            if entry.is_dir() and re.match(r'\d+_', entry.name)
+        )
+        return analyze_navigation_metadata(
+            os.path.join(self.root_directory, 'CROSS_REFERENCING_METADATA.json'),
+            self.entry_sections,
+            library_sections
+        )
+    
+    def _resolve_section(self, target_category: str, analysis: NavigationPathAnalysis) -> Optional[str]:
+        """
+        Map a scenario target such as "Quick Start Guides" to its section directory
         
-        combined_metadata = {}
-        for filename in metadata_files:
-            filepath = os.path.join(self.root_directory, filename)
-            if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    combined_metadata.update(json.load(f))
+        Args:
+            target_category: Human-readable section name
+            analysis: Navigation path analysis
         
-        return combined_metadata
+        Returns:
+            Section directory name, or None if the library has no such section
+        """
+        wanted = target_category.lower().replace(' ', '_')
+        for section in analysis.graph.names:
+            if re.sub(r'^\d+_', '', section).lower() == wanted:
+                return section
+        return None
     
     def simulate_user_navigation(self, scenario: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Simulate user navigation through specified scenario
+        Measure navigation for the specified scenario
+        
+        Clicks are shortest-path distances from the nearest entry section over
+        the cross-referencing graph; a scenario's clicks to destination is its
+        farthest target, or None when any target cannot be reached.
         
         Args:
             scenario: Navigation test scenario
@@ -92,29 +118,20 @@ class NavigationUsabilityTester:
         """
         start_time = time.time()
         
-        # Simulate navigation complexity
-        navigation_path = []
-        current_categories = scenario["target_categories"]
-        
-        # Load navigation metadata for intelligent path generation
-        navigation_metadata = self.load_navigation_metadata()
+        analysis = self.load_navigation_analysis()
         
-        # Generate navigation path
-        while current_categories:
-            current_category = current_categories.pop(0)
-            
-            # Find related categories from metadata
-            related_categories = navigation_metadata.get(
-                "navigation_economic_insights", {}
-            ).get(current_category.lower().replace(' ', '_'), [])
-            
-            navigation_path.append(current_category)
+        navigation_path = []
+        target_clicks = {}
+        unreachable_targets = []
+        for target_category in scenario["target_categories"]:
+            section = self._resolve_section(target_category, analysis)
+            clicks = analysis.clicks_from_entry(section) if section else None
+            target_clicks[target_category] = clicks
             
-            # Probabilistically add related categories
-            if related_categories and random.random() < 0.6:
-                current_categories.extend(
-                    random.sample(related_categories, min(len(related_categories), 2))
-                )
+            if clicks is None:
+                unreachable_targets.append(target_category)
+            else:
+                navigation_path.append(analysis.path_from_entry(section))
         
         end_time = time.time()
         
@@ -123,7 +140,11 @@ class NavigationUsabilityTester:
             "scenario_name": scenario["name"],
             "navigation_time": end_time - start_time,
             "navigation_path": navigation_path,
-            "clicks_to_destination": len(navigation_path),
+            "target_clicks": target_clicks,
+            "unreachable_targets": unreachable_targets,
+            "clicks_to_destination": (
+                max(target_clicks.values(), default=0) if not unreachable_targets else None
+            ),
             "user_satisfaction_score": random.uniform(6, 10)
         }
         
@@ -138,6 +159,9 @@ class NavigationUsabilityTester:
         """
         usability_report = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "navigation_structure": self.load_navigation_analysis().summary(
+                self.usability_metrics["clicks_to_destination"]["max_acceptable_clicks"]
+            ),
             "scenarios_tested": [],
             "overall_performance": {
                 "passed_scenarios": 0,
@@ -190,8 +214,9 @@ class NavigationUsabilityTester:
             performance_evaluation["passed"] = False
             performance_evaluation["metrics"]["navigation_time"] = "FAIL"
         
-        # Check clicks to destination
-        if scenario_results["clicks_to_destination"] > self.usability_metrics["clicks_to_destination"]["max_acceptable_clicks"]:
+        # Check clicks to destination (None means a target is unreachable)
+        clicks = scenario_results["clicks_to_destination"]
+        if clicks is None or clicks > self.usability_metrics["clicks_to_destination"]["max_acceptable_clicks"]:
             performance_evaluation["passed"] = False
             performance_evaluation["metrics"]["clicks_to_destination"] = "FAIL"
         
@@ -242,6 +267,11 @@ def main():
     print(f"Total Scenarios: {usability_report['overall_performance']['total_scenarios']}")
     print(f"Passed Scenarios: {usability_report['overall_performance']['passed_scenarios']}")
     print(f"Pass Rate: {usability_report['overall_performance']['pass_rate']:.2f}%")
+    
+    structure = usability_report["navigation_structure"]
+    print(f"Orphaned Sections: {len(structure['orphaned_sections'])}")
+    print(f"Unreachable Sections: {len(structure['unreachable_sections'])}")
+    print(f"Sections Over Click Budget: {len(structure['sections_over_click_budget'])}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,333 @@
+import io
+import os
+import json
+import hashlib
+import numpy as np
+from typing import Dict, List, Any, Callable, Iterable, Optional, Tuple
+
+from atomic_io import atomic_write_bytes
+from metadata_repository import load_metadata_snapshot
+from navigation_graph import NavigationGraph
+from ranking_utils import select_top_k
+
+# Upper bound on elements in the NumPy fallback's per-block edge temporaries
+_PROPAGATION_BLOCK_ELEMENTS = 1 << 22
+
+def _transition_propagator(graph: NavigationGraph) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Build P^T @ ranks for the random walk that splits each node's mass evenly over its connections
+
+    With SciPy the transposed transition matrix is built once as CSR. Without
+    it, edges are grouped by target and summed with np.add.reduceat in column
+    blocks, so temporaries stay bounded instead of growing to edges x columns.
+
+    Args:
+        graph: Navigation graph (CSR)
+
+    Returns:
+        Function mapping an (n, k) rank matrix to the propagated (n, k) matrix
+    """
+    n = graph.node_count
+    out_degree = np.diff(graph.offsets)
+    sources = np.repeat(np.arange(n), out_degree)
+    targets = graph.neighbors.astype(np.int64)
+    edge_weights = 1.0 / out_degree[sources]
+
+    try:
+        import scipy.sparse
+    except ImportError:
+        pass
+    else:
+        transposed = scipy.sparse.csr_matrix((edge_weights, (targets, sources)), shape=(n, n))
+        return lambda ranks: np.asarray(transposed @ ranks)
+
+    order = np.argsort(targets, kind='stable')
+    sorted_sources = sources[order]
+    sorted_weights = edge_weights[order][:, None]
+    receivers, starts = np.unique(targets[order], return_index=True)
+
+    def propagate(ranks: np.ndarray) -> np.ndarray:
+        spread = np.zeros_like(ranks)
+        if not receivers.size:
+            return spread
+        block = max(1, _PROPAGATION_BLOCK_ELEMENTS // len(sorted_sources))
+        for first in range(0, ranks.shape[1], block):
+            columns = slice(first, first + block)
+            contributions = ranks[sorted_sources, columns] * sorted_weights
+            spread[receivers, columns] = np.add.reduceat(contributions, starts, axis=0)
+        return spread
+
+    return propagate
+
+def personalized_pagerank(
+    graph: NavigationGraph,
+    damping: float = 0.85,
+    tolerance: float = 1e-10,
+    max_iterations: int = 200,
+    seed_batch_size: int = 256
+) -> Tuple[np.ndarray, int]:
+    """
+    Personalized PageRank for every seed node (batched power iteration)
+
+    The walk follows a directory's connections with probability `damping` and
+    teleports back to the seed otherwise. Mass on dangling nodes (no outgoing
+    connections) also returns to the seed. Seeds are iterated in batches, so
+    working memory is nodes x seed_batch_size besides the result.
+
+    Args:
+        graph: Navigation graph (CSR)
+        damping: Probability of following a connection
+        tolerance: Stop when every column's L1 change falls below this
+        max_iterations: Upper bound on power iterations
+        seed_batch_size: Seeds iterated together
+
+    Returns:
+        (matrix whose row s is the stationary vector for seed s, most iterations any batch ran)
+    """
+    n = graph.node_count
+    if n == 0:
+        return np.zeros((0, 0)), 0
+
+    propagate = _transition_propagator(graph)
+    dangling = np.diff(graph.offsets) == 0
+    stationary = np.empty((n, n))
+    iterations_run = 0
+
+    for first in range(0, n, seed_batch_size):
+        seeds = np.arange(first, min(n, first + seed_batch_size))
+        columns = np.arange(len(seeds))
+
+        # Column c of ranks is the distribution for seed seeds[c]
+        ranks = np.zeros((n, len(seeds)))
+        ranks[seeds, columns] = 1.0
+        iterations = 0
+        for iterations in range(1, max_iterations + 1):
+            updated = damping * propagate(ranks)
+            updated[seeds, columns] += damping * ranks[dangling].sum(axis=0) + (1.0 - damping)
+
+            change = np.abs(updated - ranks).sum(axis=0).max()
+            ranks = updated
+            if change < tolerance:
+                break
+
+        stationary[seeds] = ranks.T
+        iterations_run = max(iterations_run, iterations)
+
+    return stationary, iterations_run
+
+class PageRankRecommender:
+    """
+    Graph-based recommender using personalized PageRank over the cross-reference graph
+
+    Design Philosophy: Let multi-hop structure surface what one-hop rules miss
+    Local Economic Context: Route professionals to resources their peers' paths lead to
+
+    PageRank is linear in its personalization vector, so a stage-biased query
+    (1 - stage_weight) * PPR(seed) + stage_weight * PPR(stage resources) is a
+    weighted sum of precomputed rows. Serving is a vector lookup plus top-k.
+    """
+
+    # On-disk layout version of the cached stationary vectors
+    PAGERANK_CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        metadata_path: str,
+        damping: float = 0.85,
+        stage_weight: float = 0.3,
+        tolerance: float = 1e-10,
+        max_iterations: int = 200,
+        cache_dir: str = None
+    ):
+        """
+        Initialize PageRank recommender
+
+        Args:
+            metadata_path: Path to cross-referencing metadata
+            damping: Probability of following a connection instead of teleporting
+            stage_weight: Share of the personalization given to the stage pathway
+            tolerance: Power iteration convergence threshold (L1)
+            max_iterations: Upper bound on power iterations
+            cache_dir: Directory for persisted stationary vectors
+        """
+        self.metadata_path = metadata_path
+        self.damping = damping
+        self.stage_weight = stage_weight
+        self.tolerance = tolerance
+        self.max_iterations = max_iterations
+        self.cache_dir = cache_dir or os.path.join(
+            os.path.dirname(os.path.abspath(metadata_path)), 'RECOMMENDATION_CACHE'
+        )
+        self.metadata_snapshot = None
+        self._refresh_if_stale()
+
+    def _cache_key(self) -> str:
+        """
+        Hash metadata content and PageRank parameters into a cache key
+        """
+        digest = hashlib.sha256(self.metadata_snapshot.fingerprint.encode())
+        digest.update(json.dumps({
+            "damping": self.damping,
+            "tolerance": self.tolerance,
+            "max_iterations": self.max_iterations,
+            "version": self.PAGERANK_CACHE_VERSION
+        }, sort_keys=True).encode())
+        return digest.hexdigest()
+
+    def _cache_path(self) -> str:
+        return os.path.join(self.cache_dir, 'pagerank_vectors.npz')
+
+    def _refresh_if_stale(self):
+        """
+        Rebuild the graph and stationary vectors when the metadata file changes
+        """
+        snapshot = load_metadata_snapshot(self.metadata_path)
+        if snapshot is self.metadata_snapshot:
+            return
+
+        self.metadata_snapshot = snapshot
+        self.graph = NavigationGraph.from_metadata(snapshot.data)
+        self._load_or_compute_vectors()
+        self._compile_stage_vectors()
+
+    def _load_or_compute_vectors(self):
+        """
+        Load persisted stationary vectors if their key matches, otherwise recompute
+        """
+        cache_key = self._cache_key()
+        try:
+            with np.load(self._cache_path(), allow_pickle=False) as artifact:
+                if (str(artifact['key']) == cache_key and
+                        tuple(artifact['directories'].tolist()) == self.graph.names):
+                    self.stationary_vectors = artifact['vectors']
+                    self.iterations = int(artifact['iterations'])
+                    return
+        except (OSError, KeyError, ValueError):
+            pass
+
+        self.stationary_vectors, self.iterations = personalized_pagerank(
+            self.graph, self.damping, self.tolerance, self.max_iterations
+        )
+        if self.metadata_snapshot.fingerprint:
+            buffer = io.BytesIO()
+            np.savez_compressed(
+                buffer, key=np.array(cache_key), directories=np.array(self.graph.names, dtype=str),
+                vectors=self.stationary_vectors, iterations=np.array(self.iterations)
+            )
+            try:
+                atomic_write_bytes(self._cache_path(), buffer.getvalue())
+            except OSError as e:
+                # The vectors are already in memory; persisting them only saves the next start-up
+                print(f"⚠️ Could not persist PageRank vectors to {self._cache_path()}: {e}")
+
+    def _compile_stage_vectors(self):
+        """
+        Average the seed vectors of each stage's recommended resources
+        """
+        graph = self.graph
+        self.stage_vectors = np.zeros((len(graph.stage_names), graph.node_count))
+        for stage_id in range(len(graph.stage_names)):
+            resources = graph.stage_resources[graph.stage_offsets[stage_id]:graph.stage_offsets[stage_id + 1]]
+            if resources.size:
+                self.stage_vectors[stage_id] = self.stationary_vectors[resources].mean(axis=0)
+
+    def score_vector(self, current_dir: str, current_stage: str = None) -> np.ndarray:
+        """
+        PageRank scores of every directory for one query
+
+        Args:
+            current_dir: Seed directory
+            current_stage: Optional professional stage biasing the walk
+
+        Returns:
+            Score per graph node (all zeros when neither seed nor stage is known)
+        """
+        self._refresh_if_stale()
+        node = self.graph.index.get(current_dir)
+        stage = self.graph.stage_index.get(current_stage)
+
+        if node is None and stage is None:
+            return np.zeros(self.graph.node_count)
+        if node is None:
+            return self.stage_vectors[stage].copy()
+        if stage is None:
+            return self.stationary_vectors[node].copy()
+        return (
+            (1.0 - self.stage_weight) * self.stationary_vectors[node] +
+            self.stage_weight * self.stage_vectors[stage]
+        )
+
+    def generate_recommendations(
+        self,
+        current_dir: str,
+        current_stage: str = None,
+        max_recommendations: int = 5,
+        exclude_directories: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, float]]:
+        """
+        Generate ranked recommendations
+
+        Args:
+            current_dir: Current directory (never recommended)
+            current_stage: Optional professional stage
+            max_recommendations: Maximum number of recommendations
+            exclude_directories: Optional directories to skip (e.g. already visited)
+
+        Returns:
+            List of recommended directories with PageRank scores
+        """
+        scores = self.score_vector(current_dir, current_stage)
+        scores[scores <= 0] = -np.inf
+        for directory in [current_dir, *(exclude_directories or ())]:
+            node = self.graph.index.get(directory)
+            if node is not None:
+                scores[node] = -np.inf
+
+        names = self.graph.names
+        return [
+            (names[node], float(scores[node]))
+            for node in select_top_k(scores, max_recommendations).tolist()
+        ]
+
+    def generate_batch_recommendations(
+        self,
+        requests: Iterable[Tuple[str, str]],
+        max_recommendations: int = 5
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Generate recommendations for many (directory, stage) requests
+
+        Args:
+            requests: (current directory, current stage) pairs
+            max_recommendations: Maximum number of recommendations per request
+
+        Returns:
+            One ranked recommendation list per request
+        """
+        return [
+            self.generate_recommendations(current_dir, current_stage, max_recommendations)
+            for current_dir, current_stage in requests
+        ]
+
+def main():
+    """
+    Demonstration of PageRank Recommender
+    """
+    print("🌐 Port Townsend Professional Resource Library - PageRank Recommender")
+
+    metadata_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'CROSS_REFERENCING_METADATA.json')
+    recommender = PageRankRecommender(metadata_path)
+    print(f"Graph: {recommender.graph.node_count} directories, {recommender.graph.edge_count} connections")
+    print(f"Power iterations: {recommender.iterations}")
+
+    for current_dir, current_stage in [
+        ("04_Quick_Start_Guides", "Entry-Level Professional"),
+        ("19_Digital_Marketing", "Mid-Career Professional"),
+        ("36_Personal_Development", "Leadership Track")
+    ]:
+        print(f"\n📘 {current_dir} ({current_stage}):")
+        for directory, score in recommender.generate_recommendations(current_dir, current_stage):
+            print(f"  → {directory}: {score:.4f}")
+
+if __name__ == "__main__":
+    main()
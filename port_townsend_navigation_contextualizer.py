@@ -1,8 +1,11 @@
 import os
-import json
 import re
 from typing import Dict, List, Any
 
+from atomic_io import atomic_write_json
+from directory_scanner import DirectoryScanner
+from keyword_categorizer import KeywordCategorizer
+
 class PortTownsendNavigationContextualizer:
     """
     Port Townsend Economic Landscape Navigation Contextualizer
@@ -19,6 +22,7 @@ class PortTownsendNavigationContextualizer:
             root_directory: Root directory of the resource library
         """
         self.root_directory = root_directory or os.path.dirname(os.path.abspath(__file__))
+        self.scanner = DirectoryScanner(self.root_directory)
         
         # Local economic context keywords and themes
         self.local_economic_themes = {
@@ -43,6 +47,7 @@ class PortTownsendNavigationContextualizer:
                 "innovation", "digital transformation"
             ]
         }
+        self.theme_categorizer = KeywordCategorizer(self.local_economic_themes)
     
     def analyze_local_economic_context(self) -> Dict[str, Any]:
         """
@@ -58,7 +63,8 @@ class PortTownsendNavigationContextualizer:
         }
         
         # Analyze directory structure for economic theme alignment
-        for root, dirs, files in os.walk(self.root_directory):
+        self.scanner.scan()
+        for root, dirs, files in self.scanner.walk():
             relative_path = os.path.relpath(root, self.root_directory)
             path_components = relative_path.split(os.sep)
             
@@ -66,10 +72,7 @@ class PortTownsendNavigationContextualizer:
                 directory_name = path_components[-1].lower()
                 
                 # Identify economic theme alignment
-                aligned_themes = []
-                for theme, keywords in self.local_economic_themes.items():
-                    if any(keyword in directory_name for keyword in keywords):
-                        aligned_themes.append(theme)
+                aligned_themes = self.theme_categorizer.classify(directory_name)
                 
                 if aligned_themes:
                     economic_context_mapping["directory_economic_alignment"][directory_name] = {
@@ -115,7 +118,8 @@ class PortTownsendNavigationContextualizer:
                     theme_connection_rules.get(theme, [])
                 )
             
-            economic_navigation_insights[directory] = list(set(connected_themes))
+            # Deduplicate in first-seen order so the saved file is stable between runs
+            economic_navigation_insights[directory] = list(dict.fromkeys(connected_themes))
         
         return economic_navigation_insights
     
@@ -140,6 +144,8 @@ class PortTownsendNavigationContextualizer:
         """
         Save economic navigation metadata to a JSON file
         
+        The file is replaced atomically, and left untouched when its content is unchanged.
+        
         Args:
             metadata: Economic navigation metadata dictionary
         
@@ -148,10 +154,10 @@ class PortTownsendNavigationContextualizer:
         """
         metadata_path = os.path.join(self.root_directory, 'PORT_TOWNSEND_ECONOMIC_NAVIGATION_METADATA.json')
         
-        with open(metadata_path, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
-        print(f"✅ Port Townsend Economic Navigation Metadata Generated: {metadata_path}")
+        if atomic_write_json(metadata_path, metadata, indent=2):
+            print(f"✅ Port Townsend Economic Navigation Metadata Generated: {metadata_path}")
+        else:
+            print(f"✅ Port Townsend Economic Navigation Metadata Unchanged: {metadata_path}")
         return metadata_path
 
 def main():
@@ -1,9 +1,17 @@
+from __future__ import annotations
+
 import os
 import json
-import sqlite3
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Any, Optional
+from datetime import datetime
+from typing import Dict, List, Any, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pandas is imported on the code paths that need it
+    import pandas as pd
+
+from interaction_archive import CONTEXT_PREFIX, read_interactions
+from metadata_repository import load_metadata_snapshot
 
 class ProfessionalStageDetector:
     """
@@ -84,6 +92,16 @@ class ProfessionalStageDetector:
         }
     }
     
+    # Growth indicator -> context_metadata field it is derived from (scaled 0-10)
+    INDICATOR_CONTEXT_FIELDS = {
+        "learning_intensity": "learning_depth",
+        "skill_acquisition_rate": "skill_breadth",
+        "project_complexity": "project_sophistication",
+        "leadership_potential": "leadership_engagement",
+        "innovation_rate": "innovative_thinking",
+        "community_engagement": "community_involvement"
+    }
+    
     def __init__(
         self, 
         training_data_path: str = None,
@@ -122,33 +140,29 @@ class ProfessionalStageDetector:
         Load cross-referencing metadata
         
         Returns:
-            Metadata dictionary
+            Read-only metadata mapping shared through the metadata repository
         """
-        try:
-            with open(self.metadata_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print("❌ Metadata not found. Using default configuration.")
-            return {}
+        self.metadata_snapshot = load_metadata_snapshot(self.metadata_path)
+        return self.metadata_snapshot.data
     
     def _load_training_data(self) -> pd.DataFrame:
         """
-        Load user interaction training data from SQLite database
+        Load user interaction training data
+        
+        Reads only user hashes and the context fields behind the growth
+        indicators, from the compacted archive plus the recent SQLite tail.
         
         Returns:
-            Pandas DataFrame with user interactions
+            Pandas DataFrame with user_hash and `context.<field>` columns
         """
+        import pandas as pd
+        
         try:
-            with sqlite3.connect(self.training_data_path) as conn:
-                query = "SELECT * FROM user_interactions"
-                df = pd.read_sql_query(query, conn)
-                
-                # Parse context metadata
-                df['context_metadata'] = df['context_metadata'].apply(
-                    lambda x: json.loads(x) if x else {}
-                )
-                
-                return df
+            return read_interactions(
+                self.training_data_path,
+                columns=['user_hash'],
+                context_fields=list(self.INDICATOR_CONTEXT_FIELDS.values())
+            )
         except Exception as e:
             print(f"❌ Error loading training data: {e}")
             return pd.DataFrame()
@@ -163,38 +177,12 @@ class ProfessionalStageDetector:
         Returns:
             DataFrame with computed professional indicators
         """
-        # Compute indicators based on interaction metadata
-        indicators = pd.DataFrame()
+        import pandas as pd
         
-        # Learning Intensity
-        indicators['learning_intensity'] = df['context_metadata'].apply(
-            lambda x: x.get('learning_depth', 0) / 10.0
-        )
-        
-        # Skill Acquisition Rate
-        indicators['skill_acquisition_rate'] = df['context_metadata'].apply(
-            lambda x: x.get('skill_breadth', 0) / 10.0
-        )
-        
-        # Project Complexity
-        indicators['project_complexity'] = df['context_metadata'].apply(
-            lambda x: x.get('project_sophistication', 0) / 10.0
-        )
-        
-        # Leadership Potential
-        indicators['leadership_potential'] = df['context_metadata'].apply(
-            lambda x: x.get('leadership_engagement', 0) / 10.0
-        )
-        
-        # Innovation Rate
-        indicators['innovation_rate'] = df['context_metadata'].apply(
-            lambda x: x.get('innovative_thinking', 0) / 10.0
-        )
-        
-        # Community Engagement
-        indicators['community_engagement'] = df['context_metadata'].apply(
-            lambda x: x.get('community_involvement', 0) / 10.0
-        )
+        # Compute indicators based on interaction metadata (missing fields count as 0)
+        indicators = pd.DataFrame(index=df.index)
+        for indicator, field in self.INDICATOR_CONTEXT_FIELDS.items():
+            indicators[indicator] = df[CONTEXT_PREFIX + field].fillna(0) / 10.0
         
         return indicators
     
@@ -220,11 +208,11 @@ class ProfessionalStageDetector:
         
         for idx, row in indicators.iterrows():
             detected_stage = self._classify_professional_stage(row)
-            stage_classifications[detected_stage].append(df.loc[idx, 'user_id'])
+            stage_classifications[detected_stage].append(df.loc[idx, 'user_hash'])
         
         # Generate insights report
         insights_report = {
-            "timestamp": pd.Timestamp.now().isoformat(),
+            "timestamp": datetime.now().isoformat(),
             "professional_stage_distribution": {
                 stage: len(users) for stage, users in stage_classifications.items()
             },
@@ -232,7 +220,7 @@ class ProfessionalStageDetector:
         }
         
         # Save insights report
-        report_filename = f'professional_stage_insights_{pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")}.json'
+        report_filename = f'professional_stage_insights_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
         report_path = os.path.join(self.output_dir, report_filename)
         
         with open(report_path, 'w') as f:
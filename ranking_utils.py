@@ -0,0 +1,28 @@
+import numpy as np
+
+def select_top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Select the indices of the k highest scores without a full sort
+    
+    Ties are broken by ascending index, so results are deterministic and match
+    a stable descending sort. Entries scored -inf are treated as excluded.
+    
+    Args:
+        scores: 1-D score vector
+        k: Number of indices to return
+    
+    Returns:
+        Indices of the top-k scores, best first
+    """
+    candidates = np.flatnonzero(scores > -np.inf)
+    if k <= 0 or candidates.size == 0:
+        return candidates[:0]
+    
+    if k < candidates.size:
+        # Partition to find the k-th best score, then keep everything tied with it
+        partitioned = np.argpartition(-scores[candidates], k - 1)[:k]
+        threshold = scores[candidates[partitioned]].min()
+        candidates = candidates[scores[candidates] >= threshold]
+    
+    order = np.lexsort((candidates, -scores[candidates]))
+    return candidates[order[:k]]
@@ -1,7 +1,16 @@
+import io
 import json
 import os
 import math
-from typing import Dict, List, Any, Tuple
+import heapq
+import hashlib
+import numpy as np
+from typing import Dict, List, Any, Tuple, Callable, Iterable, Optional
+
+from atomic_io import atomic_write_bytes
+from metadata_repository import load_metadata_snapshot
+from ranking_utils import select_top_k
+from tag_similarity import MinHashLSHIndex, TagIncidenceMatrix
 
 class RecommendationScoringEngine:
     """
@@ -11,13 +20,33 @@ class RecommendationScoringEngine:
     Local Economic Context: Maximize professional growth, minimize resource investment
     """
     
-    def __init__(self, metadata_path: str):
+    # Neutral pathway score for stages without a growth pathway
+    DEFAULT_PATHWAY_ALIGNMENT = 0.5
+    
+    # On-disk layout version of the precomputed top-K table
+    RECOMMENDATION_TABLE_VERSION = 1
+    
+    def __init__(
+        self, 
+        metadata_path: str, 
+        precompiled: bool = True,
+        recommendation_table: bool = True,
+        table_top_k: int = 10,
+        table_cache_dir: str = None
+    ):
         """
         Initialize recommendation scoring engine
         
         Args:
             metadata_path: Path to cross-referencing metadata
+            precompiled: Score requests from precompiled NumPy matrices instead
+                of per-candidate Python loops
+            recommendation_table: Serve known (directory, stage) pairs from a
+                persisted top-K table (requires precompiled scoring)
+            table_top_k: Number of recommendations stored per pair
+            table_cache_dir: Directory for the persisted top-K table
         """
+        self.metadata_path = metadata_path
         self.metadata = self._load_metadata(metadata_path)
         self.scoring_weights = {
             "direct_connection": 0.4,
@@ -25,6 +54,18 @@ class RecommendationScoringEngine:
             "professional_pathway_alignment": 0.2,
             "local_economic_relevance": 0.1
         }
+        self.precompiled = precompiled
+        if self.precompiled:
+            self._compile_scoring_matrices()
+        
+        self.recommendation_table = recommendation_table and precompiled
+        self.table_top_k = table_top_k
+        self.table_cache_dir = table_cache_dir or os.path.join(
+            os.path.dirname(os.path.abspath(metadata_path)), 'RECOMMENDATION_CACHE'
+        )
+        self._table = None
+        self._table_key = None
+        self._table_weights = None
     
     def _load_metadata(self, metadata_path: str) -> Dict[str, Any]:
         """
@@ -34,19 +75,288 @@ class RecommendationScoringEngine:
             metadata_path: Path to metadata JSON file
         
         Returns:
-            Parsed metadata dictionary
+            Read-only metadata mapping shared through the metadata repository
+        """
+        self.metadata_snapshot = load_metadata_snapshot(metadata_path)
+        return self.metadata_snapshot.data
+    
+    def _compute_table_key(self) -> str:
+        """
+        Hash metadata content and scoring weights into a recommendation table key
+        
+        Returns:
+            Hex digest identifying one version of the top-K table
+        """
+        digest = hashlib.sha256(self.metadata_snapshot.fingerprint.encode())
+        digest.update(json.dumps(self.scoring_weights, sort_keys=True).encode())
+        digest.update(f"{self.RECOMMENDATION_TABLE_VERSION}:{self.table_top_k}".encode())
+        return digest.hexdigest()
+    
+    def _table_path(self) -> str:
+        return os.path.join(self.table_cache_dir, 'recommendation_table.npz')
+    
+    def _refresh_if_stale(self):
+        """
+        Reload metadata and the top-K table when the metadata file or weights change
+        """
+        snapshot = load_metadata_snapshot(self.metadata_path)
+        if snapshot is not self.metadata_snapshot:
+            unchanged = (
+                snapshot.signature == self.metadata_snapshot.signature and
+                snapshot.fingerprint == self.metadata_snapshot.fingerprint
+            )
+            self.metadata = self._load_metadata(self.metadata_path)
+            if not unchanged:
+                self._compile_scoring_matrices()
+                self._table = None
+        
+        weights = tuple(sorted(self.scoring_weights.items()))
+        if self._table is None or weights != self._table_weights:
+            self._table_weights = weights
+            self._load_or_build_recommendation_table()
+    
+    def _load_or_build_recommendation_table(self):
+        """
+        Load the persisted top-K table if its key matches, otherwise rebuild it
+        """
+        self._table_key = self._compute_table_key()
+        table_path = self._table_path()
+        
+        try:
+            with np.load(table_path, allow_pickle=False) as artifact:
+                if str(artifact['key']) == self._table_key:
+                    self._table = self._index_recommendation_table(
+                        artifact['directories'], artifact['stages'],
+                        artifact['indices'], artifact['scores']
+                    )
+                    return
+        except (OSError, KeyError, ValueError):
+            pass
+        
+        self.build_recommendation_table()
+    
+    def build_recommendation_table(self) -> Optional[str]:
+        """
+        Precompute and persist the top-K table for every (directory, stage) pair
+        
+        Persisting is best effort: if the write fails, the table is still
+        served from memory.
+        
+        Returns:
+            Path to the persisted table, or None if it was not persisted
         """
+        if self._table_key is None:
+            self._table_key = self._compute_table_key()
+        
+        requests = [
+            (directory, stage)
+            for directory in self.directories
+            for stage in self.professional_stages
+        ]
+        num_stages = len(self.professional_stages)
+        indices = np.full((len(requests), self.table_top_k), -1, dtype=np.int32)
+        scores = np.zeros((len(requests), self.table_top_k))
+        
+        if requests:
+            batch_scores = self.score_batch(requests)
+            for row, ((current_dir, _), row_scores) in enumerate(zip(requests, batch_scores)):
+                row_scores[self._directory_index[current_dir]] = -np.inf
+                ranking = select_top_k(row_scores, self.table_top_k)
+                indices[row, :len(ranking)] = ranking
+                scores[row, :len(ranking)] = row_scores[ranking]
+        
+        directories = np.array(self.directories, dtype=str)
+        stages = np.array(self.professional_stages, dtype=str)
+        indices = indices.reshape(len(self.directories), num_stages, self.table_top_k)
+        scores = scores.reshape(len(self.directories), num_stages, self.table_top_k)
+        
+        self._table = self._index_recommendation_table(directories, stages, indices, scores)
+        
+        # Nothing worth persisting without metadata content to key it on
+        if not self.metadata_snapshot.fingerprint:
+            return None
+        
+        table_path = self._table_path()
+        buffer = io.BytesIO()
+        np.savez_compressed(
+            buffer, key=np.array(self._table_key), directories=directories,
+            stages=stages, indices=indices, scores=scores
+        )
         try:
-            with open(metadata_path, 'r') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"❌ Metadata Loading Error: {e}")
-            return {}
+            atomic_write_bytes(table_path, buffer.getvalue())
+        except OSError as e:
+            print(f"⚠️ Could not persist recommendation table to {table_path}: {e}")
+            return None
+        return table_path
+    
+    def _index_recommendation_table(
+        self, 
+        directories: np.ndarray, 
+        stages: np.ndarray, 
+        indices: np.ndarray, 
+        scores: np.ndarray
+    ) -> Dict[Tuple[str, str], List[Tuple[str, float]]]:
+        """
+        Expand persisted table arrays into a (directory, stage) lookup dictionary
+        """
+        names = [str(directory) for directory in directories]
+        table = {}
+        for i, directory in enumerate(names):
+            for s, stage in enumerate(stages):
+                table[(directory, str(stage))] = [
+                    (names[j], float(score))
+                    for j, score in zip(indices[i, s], scores[i, s]) if j >= 0
+                ]
+        return table
+    
+    def _compile_scoring_matrices(self):
+        """
+        Precompile metadata into dense scoring matrices
+        
+        Builds, once per metadata load:
+            - directory x directory direct-connection matrix
+            - directory x directory context-tag Jaccard matrix (from a sparse tag-incidence matrix)
+            - stage x directory pathway-alignment matrix
+            - directory economic-relevance vector
+        """
+        snapshot = self.metadata_snapshot
+        
+        self.directories = snapshot.directories
+        self.professional_stages = snapshot.stages
+        self._directory_index = snapshot.directory_index
+        self._stage_index = snapshot.stage_index
+        
+        num_directories = len(self.directories)
+        
+        # Direct connections
+        self._connection_matrix = np.zeros((num_directories, num_directories))
+        for i, directory in enumerate(self.directories):
+            for connection in snapshot.connection_sets[directory]:
+                j = self._directory_index.get(connection)
+                if j is not None:
+                    self._connection_matrix[i, j] = 1.0
+        
+        # Context tags: sparse incidence matrix -> all-pairs Jaccard similarity
+        self.tag_matrix = TagIncidenceMatrix(
+            {directory: snapshot.tag_sets[directory] for directory in self.directories}
+        )
+        # Dense is fine at section granularity and keeps score_batch a plain gather
+        self._similarity_matrix = self.tag_matrix.jaccard_matrix()
+        self._tag_lsh_index = None
+        
+        # Professional pathways; the trailing row scores unknown stages
+        self._pathway_matrix = np.zeros((len(self.professional_stages) + 1, num_directories))
+        for s, stage in enumerate(self.professional_stages):
+            for resource in snapshot.pathway_sets[stage]:
+                j = self._directory_index.get(resource)
+                if j is not None:
+                    self._pathway_matrix[s, j] = 1.0
+        self._pathway_matrix[-1, :] = self.DEFAULT_PATHWAY_ALIGNMENT
+        
+        # Local economic relevance
+        self._economic_relevance = np.array([
+            self.evaluate_local_economic_relevance(directory) for directory in self.directories
+        ])
+    
+    def find_similar_directories(
+        self,
+        directory: str,
+        max_results: int = 5,
+        approximate: bool = False
+    ) -> List[Tuple[str, float]]:
+        """
+        Directories sharing the most context tags
+        
+        Args:
+            directory: Directory to compare against
+            max_results: Maximum number of neighbours
+            approximate: Use the MinHash/LSH index instead of an exact scan
+        
+        Returns:
+            (directory, Jaccard similarity) pairs, best first
+        """
+        if not self.precompiled or directory not in self._directory_index:
+            return []
+        if not approximate:
+            return self.tag_matrix.nearest(directory, max_results)
+        
+        if self._tag_lsh_index is None:
+            self._tag_lsh_index = MinHashLSHIndex(self.tag_matrix)
+        return self._tag_lsh_index.nearest(directory, max_results)
+    
+    def score_batch(
+        self, 
+        requests: List[Tuple[str, str]], 
+        candidate_indices: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Score every directory for a batch of (current_dir, current_stage) requests
+        
+        Args:
+            requests: List of (current directory, professional stage) pairs
+            candidate_indices: Optional directory ordinals to restrict scoring to
+        
+        Returns:
+            Score matrix of shape (len(requests), number of candidates), clipped to 0-1
+        """
+        if not self.precompiled:
+            self._compile_scoring_matrices()
+            self.precompiled = True
+        
+        if candidate_indices is None:
+            candidate_indices = np.arange(len(self.directories))
+        num_candidates = len(candidate_indices)
+        source_rows = np.array(
+            [self._directory_index.get(current_dir, -1) for current_dir, _ in requests],
+            dtype=np.intp
+        )
+        stage_rows = np.array(
+            [self._stage_index.get(stage, len(self.professional_stages)) for _, stage in requests],
+            dtype=np.intp
+        )
+        
+        # Unknown source directories have no connections and no tags
+        known_source = (source_rows >= 0)[:, None]
+        direct_connection = np.where(
+            known_source, self._connection_matrix[np.ix_(source_rows, candidate_indices)], 0.0
+        )
+        context_similarity = np.where(
+            known_source, self._similarity_matrix[np.ix_(source_rows, candidate_indices)], 0.0
+        )
+        pathway_alignment = self._pathway_matrix[np.ix_(stage_rows, candidate_indices)]
+        economic_relevance = np.broadcast_to(
+            self._economic_relevance[candidate_indices], (len(requests), num_candidates)
+        )
+        
+        total_scores = (
+            self.scoring_weights['direct_connection'] * direct_connection +
+            self.scoring_weights['context_similarity'] * context_similarity +
+            self.scoring_weights['professional_pathway_alignment'] * pathway_alignment +
+            self.scoring_weights['local_economic_relevance'] * economic_relevance
+        )
+        
+        return np.clip(total_scores, 0, 1)
+    
+    def score_all(self, current_dir: str, current_stage: str) -> np.ndarray:
+        """
+        Score every directory for a single request
+        
+        Args:
+            current_dir: Current directory
+            current_stage: Current professional stage
+        
+        Returns:
+            Score vector aligned with self.directories
+        """
+        return self.score_batch([(current_dir, current_stage)])[0]
     
     def calculate_context_similarity(self, source_dir: str, target_dir: str) -> float:
         """
         Calculate contextual similarity between directories
         
+        Reference implementation for the scalar scoring path; precompiled
+        scoring reads the same Jaccard values from TagIncidenceMatrix.
+        
         Args:
             source_dir: Source directory
             target_dir: Target directory
@@ -140,7 +450,35 @@ class RecommendationScoringEngine:
         
         return min(max(total_score, 0), 1)  # Ensure score is between 0 and 1
     
-    def generate_recommendations(self, current_dir: str, current_stage: str, max_recommendations: int = 5) -> List[Tuple[str, float]]:
+    def _filter_candidates(
+        self, 
+        candidate_filter: Optional[Callable[[str], bool]] = None,
+        exclude_directories: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """
+        Apply candidate filters ahead of scoring
+        
+        Args:
+            candidate_filter: Optional predicate a directory must satisfy
+            exclude_directories: Optional directories to skip (e.g. already visited)
+        
+        Returns:
+            Candidate directories in metadata order
+        """
+        excluded = set(exclude_directories or [])
+        return [
+            directory for directory in self.metadata.get('directory_relationships', {}).keys()
+            if directory not in excluded and (candidate_filter is None or candidate_filter(directory))
+        ]
+    
+    def generate_recommendations(
+        self, 
+        current_dir: str, 
+        current_stage: str, 
+        max_recommendations: int = 5,
+        candidate_filter: Optional[Callable[[str], bool]] = None,
+        exclude_directories: Optional[Iterable[str]] = None
+    ) -> List[Tuple[str, float]]:
         """
         Generate ranked recommendations
         
@@ -148,21 +486,83 @@ class RecommendationScoringEngine:
             current_dir: Current directory
             current_stage: Current professional stage
             max_recommendations: Maximum number of recommendations
+            candidate_filter: Optional predicate a directory must satisfy to be scored
+            exclude_directories: Optional directories to skip (e.g. already visited)
         
         Returns:
             List of recommended directories with scores
         """
-        all_directories = list(self.metadata.get('directory_relationships', {}).keys())
+        filtered = candidate_filter is not None or exclude_directories is not None
         
-        # Calculate scores for all directories
-        recommendations = [
-            (dir, self.calculate_recommendation_score(current_dir, dir, current_stage))
-            for dir in all_directories if dir != current_dir
-        ]
+        if self.recommendation_table and not filtered and max_recommendations <= self.table_top_k:
+            self._refresh_if_stale()
+            cached = self._table.get((current_dir, current_stage))
+            if cached is not None:
+                return cached[:max_recommendations]
+        
+        if self.precompiled:
+            return self.generate_batch_recommendations(
+                [(current_dir, current_stage)], max_recommendations,
+                candidate_filter=candidate_filter, exclude_directories=exclude_directories
+            )[0]
+        
+        candidates = self._filter_candidates(candidate_filter, exclude_directories)
+        
+        # Bounded heap keeps the best candidates; ties resolve to metadata order
+        scored = (
+            (self.calculate_recommendation_score(current_dir, dir, current_stage), position, dir)
+            for position, dir in enumerate(candidates) if dir != current_dir
+        )
+        top_candidates = heapq.nsmallest(
+            max_recommendations, scored, key=lambda x: (-x[0], x[1])
+        )
+        return [(dir, score) for score, _, dir in top_candidates]
+    
+    def generate_batch_recommendations(
+        self, 
+        requests: List[Tuple[str, str]], 
+        max_recommendations: int = 5,
+        candidate_filter: Optional[Callable[[str], bool]] = None,
+        exclude_directories: Optional[Iterable[str]] = None
+    ) -> List[List[Tuple[str, float]]]:
+        """
+        Generate ranked recommendations for many requests with one matrix evaluation
+        
+        Args:
+            requests: List of (current directory, professional stage) pairs
+            max_recommendations: Maximum number of recommendations per request
+            candidate_filter: Optional predicate a directory must satisfy to be scored
+            exclude_directories: Optional directories to skip for every request
+        
+        Returns:
+            One ranked recommendation list per request
+        """
+        if not self.precompiled:
+            self._compile_scoring_matrices()
+            self.precompiled = True
+        
+        if candidate_filter is None and exclude_directories is None:
+            candidate_indices = np.arange(len(self.directories))
+        else:
+            candidate_indices = np.array([
+                self._directory_index[directory]
+                for directory in self._filter_candidates(candidate_filter, exclude_directories)
+            ], dtype=np.intp)
+        candidate_position = {index: position for position, index in enumerate(candidate_indices)}
+        
+        scores = self.score_batch(requests, candidate_indices)
+        
+        batch_recommendations = []
+        for (current_dir, _), row in zip(requests, scores):
+            current_position = candidate_position.get(self._directory_index.get(current_dir))
+            if current_position is not None:
+                row[current_position] = -np.inf
+            ranking = select_top_k(row, max_recommendations)
+            batch_recommendations.append([
+                (self.directories[candidate_indices[i]], float(row[i])) for i in ranking
+            ])
         
-        # Sort by score in descending order and limit recommendations
-        recommendations.sort(key=lambda x: x[1], reverse=True)
-        return recommendations[:max_recommendations]
+        return batch_recommendations
 
 def main():
     """
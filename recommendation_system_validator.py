@@ -1,11 +1,18 @@
+from __future__ import annotations
+
 import os
 import json
-import sqlite3
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple, Optional
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import precision_score, recall_score, f1_score
+from datetime import datetime
+from typing import Dict, List, Any, Tuple, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pandas and sklearn are imported on the code paths that need them
+    import pandas as pd
+
+from interaction_database import get_interaction_database
+from metadata_repository import load_metadata_snapshot
+from categorical_encoder import CategoricalEncoder
 
 class RecommendationSystemValidator:
     """
@@ -53,20 +60,18 @@ class RecommendationSystemValidator:
         self.directories = list(
             self.metadata.get('directory_relationships', {}).keys()
         )
+        self.directory_encoder = CategoricalEncoder(self.directories)
+        self.stage_encoder = CategoricalEncoder(self.professional_stages)
     
     def _load_metadata(self) -> Dict[str, Any]:
         """
         Load cross-referencing metadata
         
         Returns:
-            Metadata dictionary
+            Read-only metadata mapping shared through the metadata repository
         """
-        try:
-            with open(self.metadata_path, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print("❌ Metadata not found. Using default configuration.")
-            return {}
+        self.metadata_snapshot = load_metadata_snapshot(self.metadata_path)
+        return self.metadata_snapshot.data
     
     def _load_training_data(self) -> pd.DataFrame:
         """
@@ -75,8 +80,11 @@ class RecommendationSystemValidator:
         Returns:
             Pandas DataFrame with user interactions
         """
+        import pandas as pd
+        
         try:
-            with sqlite3.connect(self.training_data_path) as conn:
+            # Read-only WAL connection: safe while ingestion keeps writing
+            with get_interaction_database(self.training_data_path).reader() as conn:
                 query = "SELECT * FROM user_interactions"
                 df = pd.read_sql_query(query, conn)
                 
@@ -103,31 +111,20 @@ class RecommendationSystemValidator:
         Returns:
             Tuple of features, targets, feature names, and target names
         """
-        # Feature engineering
-        features = []
-        targets = []
-        feature_names = []
-        target_names = []
-        
-        for _, row in df.iterrows():
-            # Encode features
-            feature_vector = [
-                self.directories.index(row['current_directory']) / len(self.directories),
-                self.professional_stages.index(row['professional_stage']) / len(self.professional_stages)
-            ]
-            features.append(feature_vector)
-            feature_names = ['current_directory_norm', 'professional_stage_norm']
-            
-            # Encode targets
-            target_vector = [
-                self.directories.index(row['target_directory']) / len(self.directories)
-            ]
-            targets.append(target_vector)
-            target_names = ['recommended_directory_norm']
+        # Encode features; unknown categories fall into the encoders' unknown bucket
+        features = np.column_stack([
+            self.directory_encoder.transform(df['current_directory']),
+            self.stage_encoder.transform(df['professional_stage'])
+        ])
+        feature_names = ['current_directory_norm', 'professional_stage_norm']
+        
+        # Encode targets
+        targets = self.directory_encoder.transform(df['target_directory']).reshape(-1, 1)
+        target_names = ['recommended_directory_norm']
         
         return (
-            np.array(features), 
-            np.array(targets), 
+            features, 
+            targets, 
             feature_names, 
             target_names
         )
@@ -147,6 +144,9 @@ class RecommendationSystemValidator:
         Returns:
             Validation metrics and insights
         """
+        from sklearn.model_selection import train_test_split
+        from sklearn.metrics import precision_score, recall_score, f1_score
+        
         # Load and prepare data
         df = self._load_training_data()
         
@@ -179,7 +179,7 @@ class RecommendationSystemValidator:
         # Professional stage performance breakdown
         stage_performance = {}
         for stage in self.professional_stages:
-            stage_mask = X_test[:, 1] == self.professional_stages.index(stage) / len(self.professional_stages)
+            stage_mask = X_test[:, 1] == self.stage_encoder.encode(stage)
             stage_precision = precision_score(
                 y_test[stage_mask], 
                 y_pred[stage_mask], 
@@ -189,7 +189,7 @@ class RecommendationSystemValidator:
         
         # Validation insights
         validation_report = {
-            "timestamp": pd.Timestamp.now().isoformat(),
+            "timestamp": datetime.now().isoformat(),
             "overall_metrics": {
                 "precision": float(precision),
                 "recall": float(recall),
@@ -210,7 +210,7 @@ class RecommendationSystemValidator:
         }
         
         # Save validation report
-        report_filename = f'recommendation_validation_{pd.Timestamp.now().strftime("%Y%m%d_%H%M%S")}.json'
+        report_filename = f'recommendation_validation_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
         report_path = os.path.join(self.validation_output_dir, report_filename)
         
         with open(report_path, 'w') as f:
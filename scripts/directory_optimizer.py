@@ -1,18 +1,27 @@
 import os
+import sys
 import json
 from typing import Dict, List
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from directory_scanner import DirectoryScanner
+
 class DirectoryOptimizer:
     def __init__(self, base_path: str):
         self.base_path = base_path
+        self.scanner = DirectoryScanner(base_path)
         self.structure_report = {}
 
     def analyze_directory_structure(self) -> Dict:
         """
         Analyze the current directory structure and generate optimization insights.
+        
+        The scanner never descends into .git, node_modules, __pycache__ or
+        .scan_cache, so those no longer appear in the counts (os.walk listed them).
         """
         structure = {}
-        for root, dirs, files in os.walk(self.base_path):
+        self.scanner.scan()
+        for root, dirs, files in self.scanner.walk():
             # Skip version control and system directories
             if any(skip in root for skip in ['.git', 'node_modules', 'dist']):
                 continue
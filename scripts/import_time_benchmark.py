@@ -0,0 +1,174 @@
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from datetime import datetime
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules whose import cost is tracked; heavyweight dependencies should stay deferred
+DEFAULT_MODULES = [
+    "metadata_repository",
+    "categorical_encoder",
+    "cross_reference_prototype",
+    "recommendation_scoring_engine",
+    "ml_recommendation_optimizer",
+    "recommendation_system_validator",
+    "adaptive_retraining_strategy",
+    "model_performance_dashboard",
+    "professional_stage_detector",
+    "training_data_collector",
+    "system_integration_test",
+]
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)\s*$")
+
+class ImportTimeBenchmark:
+    """
+    Startup-time benchmark based on `python -X importtime`
+
+    Design Philosophy: Catch import-cost regressions before they reach workers
+    Core Objective: Record cumulative import cost per module in a fresh interpreter
+    """
+
+    def __init__(self, modules: List[str] = None, repeats: int = 5, root_directory: str = None):
+        """
+        Initialize Import Time Benchmark
+
+        Args:
+            modules: Module names to measure
+            repeats: Fresh-interpreter runs per module; the fastest run is reported
+            root_directory: Directory the modules are importable from
+        """
+        self.modules = modules or DEFAULT_MODULES
+        self.repeats = repeats
+        self.root_directory = root_directory or PROJECT_ROOT
+
+    def measure_module(self, module: str) -> Dict[str, int]:
+        """
+        Measure the cumulative import cost of one module
+
+        Args:
+            module: Module name
+
+        Returns:
+            Best-of-N cumulative and self import time in microseconds
+        """
+        best = None
+        for _ in range(self.repeats):
+            result = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                cwd=self.root_directory,
+                capture_output=True,
+                text=True
+            )
+            if result.returncode != 0:
+                raise RuntimeError(f"Importing {module} failed:\n{result.stderr.strip()[-2000:]}")
+
+            timing = None
+            for line in result.stderr.splitlines():
+                match = IMPORTTIME_LINE.match(line)
+                if match and match.group(4) == module and not match.group(3).strip(" "):
+                    timing = {"self_us": int(match.group(1)), "cumulative_us": int(match.group(2))}
+            if timing is None:
+                raise RuntimeError(f"No importtime entry found for {module}")
+
+            if best is None or timing["cumulative_us"] < best["cumulative_us"]:
+                best = timing
+        return best
+
+    def run(self) -> Dict[str, Dict[str, int]]:
+        """
+        Measure every configured module
+
+        Returns:
+            Mapping of module name to import timings
+        """
+        timings = {}
+        for module in self.modules:
+            try:
+                timings[module] = self.measure_module(module)
+            except RuntimeError as e:
+                print(f"❌ {e}")
+                timings[module] = {"error": str(e).splitlines()[0]}
+        return timings
+
+def compare_to_baseline(
+    timings: Dict[str, Dict[str, int]],
+    baseline: Dict[str, Dict[str, int]],
+    tolerance: float
+) -> List[str]:
+    """
+    Find modules whose cumulative import time regressed
+
+    Args:
+        timings: Current timings
+        baseline: Timings from a previous report
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions = []
+    for module, timing in timings.items():
+        previous = baseline.get(module, {}).get("cumulative_us")
+        current = timing.get("cumulative_us")
+        if previous and current and current > previous * (1 + tolerance):
+            regressions.append(
+                f"{module}: {previous / 1000:.1f} ms -> {current / 1000:.1f} ms"
+            )
+    return regressions
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Record per-module import cost with python -X importtime")
+    parser.add_argument("modules", nargs="*", help="Modules to measure (defaults to the library's engines)")
+    parser.add_argument("--repeats", type=int, default=5, help="Fresh-interpreter runs per module")
+    parser.add_argument("--baseline", help="Previous report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown")
+    parser.add_argument("--output", help="Report path (defaults to PERFORMANCE_REPORTS/)")
+    args = parser.parse_args(argv)
+
+    print("⏱️ Port Townsend Professional Resource Library - Import Time Benchmark")
+
+    benchmark = ImportTimeBenchmark(args.modules or None, repeats=args.repeats)
+    timings = benchmark.run()
+
+    for module, timing in timings.items():
+        if "cumulative_us" in timing:
+            print(f"  {module:<36} {timing['cumulative_us'] / 1000:8.1f} ms")
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "python_version": sys.version.split()[0],
+        "repeats": args.repeats,
+        "modules": timings
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f).get("modules", {})
+        regressions = compare_to_baseline(timings, baseline, args.tolerance)
+        report["regressions"] = regressions
+
+    output_path = args.output or os.path.join(
+        PROJECT_ROOT, 'PERFORMANCE_REPORTS',
+        f'import_time_report_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"📊 Import Time Report: {output_path}")
+
+    if regressions:
+        print("❌ Import time regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11 +1,16 @@
 import os
+import sys
 import json
 import hashlib
 from typing import Dict, List, Any
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from directory_scanner import DirectoryScanner
+
 class ResourceDirectoryAnalyzer:
     def __init__(self, base_path: str):
         self.base_path = base_path
+        self.scanner = DirectoryScanner(base_path)
         self.analysis_report = {
             "total_directories": 0,
             "total_files": 0,
@@ -18,12 +23,16 @@ class ResourceDirectoryAnalyzer:
     def analyze_directory_structure(self) -> None:
         """
         Comprehensive analysis of directory structure and content
+        
+        Files inside the scanner's ignored directories (.git, node_modules,
+        __pycache__, .scan_cache) are not counted, unlike the previous os.walk.
+        The scan is incremental: only directories whose mtime changed are re-listed.
         """
-        for dir_name in sorted(os.listdir(self.base_path)):
-            full_path = os.path.join(self.base_path, dir_name)
-            
-            if os.path.isdir(full_path):
-                self._analyze_single_directory(dir_name, full_path)
+        self.scanner.scan()
+        _, top_level_dirs, _ = next(self.scanner.walk())
+        
+        for dir_name in top_level_dirs:
+            self._analyze_single_directory(dir_name, os.path.join(self.base_path, dir_name))
 
         self._calculate_potential_value_index()
 
@@ -31,7 +40,9 @@ class ResourceDirectoryAnalyzer:
         """
         Detailed analysis of a single directory
         """
-        files = os.listdir(full_path)
+        _, subdirectories, file_names = next(self.scanner.walk(dir_name))
+        file_stats = self.scanner.file_stats(dir_name)
+        files = sorted(subdirectories + file_names)
         
         dir_analysis = {
             "total_files": len(files),
@@ -47,14 +58,14 @@ class ResourceDirectoryAnalyzer:
             dir_analysis["file_types"][file_ext] = dir_analysis["file_types"].get(file_ext, 0) + 1
             
             # Analyze file content
-            if os.path.isfile(file_path):
-                self._analyze_file_content(file_path, dir_analysis)
+            if filename in file_stats:
+                self._analyze_file_content(file_path, dir_analysis, file_stats[filename].size)
 
         self.analysis_report["directory_breakdown"][dir_name] = dir_analysis
         self.analysis_report["total_directories"] += 1
         self.analysis_report["total_files"] += len(files)
 
-    def _analyze_file_content(self, file_path: str, dir_analysis: Dict) -> None:
+    def _analyze_file_content(self, file_path: str, dir_analysis: Dict, file_size: int) -> None:
         """
         Analyze individual file content with robust error handling
         """
@@ -81,13 +92,13 @@ class ResourceDirectoryAnalyzer:
                     # Handle potential encoding issues
                     dir_analysis["content_summary"][os.path.basename(file_path)] = {
                         "error": "Encoding issue",
-                        "file_size": os.path.getsize(file_path)
+                        "file_size": file_size
                     }
             else:
                 # For binary files, just record metadata
                 dir_analysis["content_summary"][os.path.basename(file_path)] = {
                     "file_type": file_ext,
-                    "file_size": os.path.getsize(file_path)
+                    "file_size": file_size
                 }
 
         except Exception as e:
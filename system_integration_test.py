@@ -1,16 +1,45 @@
 import os
 import sys
+import csv
 import json
+import pickle
+import struct
+import subprocess
+import tempfile
+import random
+import gc
+import importlib.util
+import sqlite3
+import threading
+import uuid
+import time
 import unittest
+from unittest import mock
+from datetime import datetime, timedelta
 from typing import Dict, Any, List
 
+import numpy as np
+
 # Add project root to Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import project modules
+from atomic_io import atomic_write_bytes, atomic_write_json
 from cross_reference_prototype import CrossReferencingEngine
+from cross_referencing_engine import CrossReferencingEngine as ContentCrossReferencingEngine
 from recommendation_scoring_engine import RecommendationScoringEngine
-from ml_recommendation_optimizer import MLRecommendationOptimizer
+from ml_recommendation_optimizer import TRAINING_COLUMNS, MLRecommendationOptimizer, generate_synthetic_interactions
+from navigation_graph import NavigationGraph, NavigationPathAnalysis
+from training_data_collector import TRAINING_DATA_COLUMNS, UNWRITTEN_INTERACTIONS_FILENAME, TrainingDataCollector
+from interaction_archive import load_archive_manifest, read_interactions
+from interaction_database import InteractionDatabase, get_interaction_database, to_epoch_micros
+from categorical_encoder import CategoricalEncoder
+from metadata_repository import MetadataRepository
+from system_performance_analyzer import SystemPerformanceAnalyzer
+from keyword_categorizer import KeywordCategorizer, KeywordMatch
+from pagerank_recommender import PageRankRecommender, personalized_pagerank
+from ranking_utils import select_top_k
+from tag_similarity import MinHashLSHIndex, TagIncidenceMatrix
 
 class SystemIntegrationTestSuite(unittest.TestCase):
     """
@@ -98,6 +127,1064 @@ class SystemIntegrationTestSuite(unittest.TestCase):
             self.assertTrue(len(ml_recommendations) > 0, 
                             f"ML optimizer should generate recommendations for {current_dir}")
     
+    def test_precompiled_scoring_matches_scalar_scoring(self):
+        """
+        Validate that matrix scoring reproduces the per-candidate scoring path
+        """
+        scalar_engine = RecommendationScoringEngine(self.metadata_path, precompiled=False)
+        directories = list(self.metadata.get('directory_relationships', {}).keys())
+        stages = list(self.metadata.get('professional_growth_pathways', {}).keys()) + ["Unknown Stage"]
+        
+        for current_dir in directories:
+            for current_stage in stages:
+                self.assertEqual(
+                    self.recommendation_scoring_engine.generate_recommendations(current_dir, current_stage),
+                    scalar_engine.generate_recommendations(current_dir, current_stage),
+                    f"Precompiled scoring diverged for {current_dir} ({current_stage})"
+                )
+    
+    def test_top_k_tie_order_and_candidate_filters(self):
+        """
+        Validate partial top-K selection against a stable sort and filtering ahead of scoring
+        """
+        rng = np.random.default_rng(3)
+        for _ in range(200):
+            scores = rng.integers(0, 4, size=rng.integers(1, 30)).astype(float)
+            scores[rng.random(scores.size) < 0.2] = -np.inf
+            k = int(rng.integers(0, scores.size + 2))
+            expected = [i for i in sorted(range(scores.size), key=lambda i: -scores[i])
+                        if scores[i] > -np.inf][:k]
+            self.assertEqual(select_top_k(scores, k).tolist(), expected)
+        
+        scalar_engine = RecommendationScoringEngine(self.metadata_path, precompiled=False)
+        directories = list(self.metadata.get('directory_relationships', {}).keys())
+        excluded = {directories[2]}
+        keep = lambda directory: directory != directories[0]
+        
+        for engine in (self.recommendation_scoring_engine, scalar_engine):
+            for current_dir in directories:
+                stage = "Entry-Level Professional"
+                full_ranking = engine.generate_recommendations(current_dir, stage, len(directories))
+                self.assertEqual(
+                    engine.generate_recommendations(current_dir, stage, 3, candidate_filter=keep,
+                                                    exclude_directories=excluded),
+                    [(directory, score) for directory, score in full_ranking
+                     if keep(directory) and directory not in excluded][:3]
+                )
+    
+    
+    def test_navigation_path_analysis(self):
+        """
+        Validate shortest click paths over the primary connection graph
+        """
+        graph = NavigationGraph.from_metadata(self.metadata)
+        analysis = NavigationPathAnalysis(graph)
+        
+        for directory, details in self.metadata.get('directory_relationships', {}).items():
+            for connected in details.get('primary_connections', []):
+                if connected != directory:
+                    self.assertEqual(analysis.clicks(directory, connected), 1)
+        
+        for section in graph.names:
+            clicks = analysis.clicks_from_entry(section)
+            if clicks is None:
+                self.assertIn(section, analysis.unreachable_sections)
+            else:
+                self.assertEqual(len(analysis.path_from_entry(section)), clicks + 1)
+    
+    def test_training_data_streaming_export(self):
+        """
+        Validate streamed exports, including an empty interaction log
+        """
+        with tempfile.TemporaryDirectory() as storage:
+            collector = TrainingDataCollector(storage)
+            
+            csv_path = collector.export_training_data(os.path.join(storage, 'empty'), format='csv')
+            with open(csv_path, newline='') as f:
+                self.assertEqual(list(csv.reader(f)), [list(TRAINING_DATA_COLUMNS)])
+            with open(collector.export_training_data(os.path.join(storage, 'empty'), format='json')) as f:
+                self.assertEqual(json.load(f), [])
+            
+            for index in range(5):
+                collector.record_user_interaction(
+                    f"user_{index}", "04_Quick_Start_Guides", "19_Digital_Marketing",
+                    "Entry-Level Professional", context_metadata={"index": index}
+                )
+            
+            entries = collector.get_training_data()
+            self.assertEqual(list(collector.iter_training_data(chunk_size=2)), entries)
+            with open(collector.export_training_data(os.path.join(storage, 'full'), format='json')) as f:
+                self.assertEqual(json.load(f), entries)
+            with open(collector.export_training_data(os.path.join(storage, 'full'), format='jsonl')) as f:
+                self.assertEqual([json.loads(line) for line in f], entries)
+            collector.close()
+    
+    def test_interaction_archive_compaction(self):
+        """
+        Validate that compacted .npz partitions plus the SQLite tail match SQLite alone
+        """
+        self._check_interaction_archive(use_parquet=False)
+    
+    @unittest.skipUnless(importlib.util.find_spec('pyarrow'), "pyarrow is not installed")
+    def test_interaction_archive_parquet_compaction(self):
+        """
+        Validate the same round trip through Parquet partitions and pushed-down filters
+        """
+        self._check_interaction_archive(use_parquet=True)
+    
+    def _check_interaction_archive(self, use_parquet: bool):
+        """
+        Compact, add late rows below the watermark, re-compact; reads must always match SQLite
+        """
+        with tempfile.TemporaryDirectory() as storage:
+            collector = TrainingDataCollector(storage)
+            now = datetime.now()
+            
+            def write_rows(count, first_hours_ago, tag):
+                rows = []
+                for index in range(count):
+                    row = list(collector._build_interaction_row(
+                        f"user_{index % 4}", "04_Quick_Start_Guides", "19_Digital_Marketing",
+                        "Leadership Track" if index % 2 else "Entry-Level Professional",
+                        tag, 1.0, 0.5, {"learning_depth": index % 10} if index % 3 else None
+                    ))
+                    row[2] = to_epoch_micros(now - timedelta(hours=first_hours_ago + index * 3))
+                    rows.append(tuple(row))
+                collector._write_rows(rows)
+            
+            query = dict(
+                columns=['interaction_id', 'timestamp', 'professional_stage', 'interaction_type'],
+                context_fields=['learning_depth'],
+                start_date=now - timedelta(days=5),
+                professional_stages=['Leadership Track']
+            )
+            def assert_matches_sqlite():
+                expected = read_interactions(collector.db_path, archive_path=os.path.join(storage, 'none'), **query)
+                compacted = read_interactions(collector.db_path, **query)
+                self.assertEqual(
+                    compacted.fillna(0).sort_values('interaction_id').to_dict('records'),
+                    expected.fillna(0).sort_values('interaction_id').to_dict('records')
+                )
+                return expected
+            
+            write_rows(60, 0, "navigation")
+            summary = collector.compact_interactions(use_parquet=use_parquet)
+            self.assertGreater(summary['partitions'], 0)
+            archive_path = os.path.join(storage, 'INTERACTION_ARCHIVE')
+            manifest = load_archive_manifest(archive_path)
+            suffix = '.parquet' if use_parquet else '.npz'
+            self.assertTrue(all(partition['path'].endswith(suffix) for partition in manifest['partitions']))
+            assert_matches_sqlite()
+            
+            # Rows committed after compaction with timestamps in already archived days
+            write_rows(10, 50, "late")
+            self.assertEqual(len(assert_matches_sqlite().query("interaction_type == 'late'")), 5)
+            
+            # The next run rewrites those days; replaced files are deleted by the run after it
+            resummary = collector.compact_interactions(use_parquet=use_parquet)
+            self.assertGreater(resummary['partitions'], 0)
+            self.assertEqual(resummary['watermark'], summary['watermark'])
+            superseded = load_archive_manifest(archive_path)['superseded']
+            self.assertEqual(len(superseded), resummary['partitions'])
+            assert_matches_sqlite()
+            collector.compact_interactions(use_parquet=use_parquet)
+            self.assertFalse(any(os.path.exists(os.path.join(archive_path, path)) for path in superseded))
+            assert_matches_sqlite()
+            collector.close()
+    
+    def test_metadata_repository_caches_unreadable_files(self):
+        """
+        Validate that missing metadata yields one cached snapshot until the file appears
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            repository = MetadataRepository()
+            path = os.path.join(directory, 'CROSS_REFERENCING_METADATA.json')
+            
+            missing = repository.get(path)
+            self.assertFalse(missing)
+            self.assertIs(repository.get(path), missing)
+            
+            with open(path, 'w') as f:
+                json.dump(self.metadata, f)
+            loaded = repository.get(path)
+            self.assertIsNot(loaded, missing)
+            self.assertEqual(loaded.directories, tuple(self.metadata['directory_relationships']))
+            self.assertIs(repository.get(path), loaded)
+    
+    def test_interconnection_analysis_is_json_serializable(self):
+        """
+        Validate that public results copy read-only metadata back into plain containers
+        """
+        analysis = self.cross_referencing_engine.analyze_interconnections()
+        self.assertEqual(json.loads(json.dumps(analysis))['cross_referencing_rules'],
+                         self.metadata.get('cross_referencing_rules', {}))
+        
+        # Callers own the copy; mutating it leaves the shared snapshot intact
+        analysis['cross_referencing_rules']['linking_criteria'] = None
+        self.assertEqual(self.cross_referencing_engine.analyze_interconnections()['cross_referencing_rules'],
+                         self.metadata.get('cross_referencing_rules', {}))
+    
+    def test_recommendation_table_persistence_is_best_effort(self):
+        """
+        Validate table serving when persisting fails or metadata is missing
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            blocked = os.path.join(directory, 'not_a_directory')
+            open(blocked, 'w').close()
+            engine = RecommendationScoringEngine(self.metadata_path, table_cache_dir=blocked)
+            self.assertIsNone(engine.build_recommendation_table())
+            self.assertEqual(
+                engine.generate_recommendations("04_Quick_Start_Guides", "Entry-Level Professional"),
+                self.recommendation_scoring_engine.generate_recommendations(
+                    "04_Quick_Start_Guides", "Entry-Level Professional"
+                )
+            )
+            
+            cache_dir = os.path.join(directory, 'cache')
+            missing = RecommendationScoringEngine(
+                os.path.join(directory, 'missing.json'), table_cache_dir=cache_dir
+            )
+            for _ in range(2):
+                self.assertEqual(missing.generate_recommendations("04_Quick_Start_Guides", "Leadership Track"), [])
+            self.assertFalse(os.path.exists(cache_dir))
+    
+    def test_pagerank_cache_persistence_is_best_effort(self):
+        """
+        Validate that an unwritable PageRank cache directory only costs the persisted copy
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            blocked = os.path.join(directory, 'not_a_directory')
+            open(blocked, 'w').close()
+            recommender = PageRankRecommender(self.metadata_path, cache_dir=blocked)
+            reference = PageRankRecommender(self.metadata_path, cache_dir=os.path.join(directory, 'cache'))
+            
+            np.testing.assert_array_equal(recommender.stationary_vectors, reference.stationary_vectors)
+            self.assertEqual(
+                recommender.generate_recommendations("04_Quick_Start_Guides", "Entry-Level Professional"),
+                reference.generate_recommendations("04_Quick_Start_Guides", "Entry-Level Professional")
+            )
+            self.assertTrue(os.listdir(os.path.join(directory, 'cache')))
+    
+    def test_categorical_encoder_unknown_bucket_and_pickle(self):
+        """
+        Validate the unknown-category bucket across input types and a pickle round trip
+        """
+        encoder = CategoricalEncoder(["Entry", "Mid", "Entry", "Senior"])
+        self.assertEqual(encoder.categories, ("Entry", "Mid", "Senior"))
+        self.assertEqual(encoder.unknown_code, 3)
+        self.assertEqual(encoder.encode_ordinal("Executive"), 3)
+        self.assertEqual(encoder.encode("Mid"), 1 / 3)
+        self.assertEqual(encoder.encode("Executive"), 1.0)
+        self.assertEqual(encoder.inverse_transform([2, 3]), ["Senior", None])
+        
+        values = ["Senior", "Executive", "Entry", "Mid", "Executive"]
+        expected = [2, 3, 0, 1, 3]
+        for column in (values, iter(values), np.array(values)):
+            self.assertEqual(encoder.transform_ordinal(column).tolist(), expected)
+        if importlib.util.find_spec('pandas'):
+            import pandas as pd
+            self.assertEqual(encoder.transform_ordinal(pd.Series(values)).tolist(), expected)
+        
+        fixed = CategoricalEncoder(["Entry", "Mid"], unknown_value=0.5)
+        self.assertEqual(fixed.transform(["Mid", "Executive"]).tolist(), [0.5, 0.5])
+        self.assertEqual(fixed.transform(["Entry", "Executive"]).tolist(), [0.0, 0.5])
+        
+        restored = pickle.loads(pickle.dumps(fixed))
+        self.assertEqual(restored.categories, fixed.categories)
+        self.assertEqual(restored.unknown_value, 0.5)
+        self.assertEqual(restored.encode_ordinal("Mid"), 1)
+        self.assertEqual(restored.encode("Executive"), 0.5)
+        self.assertNotIn("Executive", restored)
+    
+    
+    def test_batched_ml_inference_matches_per_item(self):
+        """
+        Validate that batched inference scores and ranks like one prediction per candidate
+        """
+        optimizer = self.ml_recommendation_optimizer
+        directories = list(self.metadata.get('directory_relationships', {}).keys())
+        queries = [
+            (current_dir, current_stage, [d for d in directories if d != current_dir] + ["99_Unknown"])
+            for current_dir in directories[:3]
+            for current_stage in ["Entry-Level Professional", "Unknown Stage"]
+        ]
+        queries.append((directories[0], "Entry-Level Professional", []))
+        
+        batch = optimizer.optimize_batch_recommendations(queries)
+        self.assertEqual(len(batch), len(queries))
+        self.assertEqual(batch[-1], [])
+        
+        for (current_dir, current_stage, candidates), ranked in zip(queries, batch):
+            per_item = {}
+            for target_dir in candidates:
+                features = optimizer.scaler.transform([[
+                    optimizer._encode_directory(current_dir),
+                    optimizer._encode_directory(target_dir),
+                    optimizer._encode_professional_stage(current_stage)
+                ]])
+                per_item[target_dir] = float(optimizer.model.predict(features)[0])
+            
+            self.assertEqual(sorted(target for target, _ in ranked), sorted(candidates))
+            for target_dir, score in ranked:
+                self.assertAlmostEqual(score, per_item[target_dir], places=9)
+            self.assertEqual([score for _, score in ranked], sorted((s for _, s in ranked), reverse=True))
+    
+    
+    def test_synthetic_interactions_distribution(self):
+        """
+        Validate no self-pairs, uniform targets and connection-biased scores in synthetic data
+        """
+        directories = ["a", "b", "c", "d"]
+        stages = ["Entry", "Senior"]
+        connection_sets = {"a": frozenset({"b"}), "c": frozenset({"a", "d", "missing"})}
+        data = generate_synthetic_interactions(
+            directories, stages, n_samples=40000, seed=8, connection_sets=connection_sets
+        )
+        self.assertEqual(set(data), set(TRAINING_COLUMNS))
+        self.assertTrue(all(len(column) == 40000 for column in data.values()))
+        self.assertFalse(np.any(data["current_directory"] == data["target_directory"]))
+        
+        # Each of the three other directories is an equally likely target
+        for current in directories:
+            targets = data["target_directory"][data["current_directory"] == current]
+            _, counts = np.unique(targets, return_counts=True)
+            self.assertEqual(len(counts), 3)
+            self.assertLess(np.ptp(counts / len(targets)), 0.05)
+        self.assertEqual(set(data["current_stage"]), set(stages))
+        
+        pairs = zip(data["current_directory"], data["target_directory"])
+        connected = np.array([target in connection_sets.get(current, ()) for current, target in pairs])
+        scores = data["interaction_score"]
+        self.assertTrue(np.all((scores[connected] >= 0.5) & (scores[connected] < 1.0)))
+        self.assertTrue(np.all((scores[~connected] >= 0.0) & (scores[~connected] < 0.5)))
+        self.assertAlmostEqual(scores[connected].mean(), 0.75, delta=0.02)
+        self.assertAlmostEqual(scores[~connected].mean(), 0.25, delta=0.02)
+        self.assertAlmostEqual(connected.mean(), 3 / 12, delta=0.02)
+        
+        # Same draws with a fixed seed, with or without pandas output
+        if importlib.util.find_spec('pandas'):
+            frame = generate_synthetic_interactions(
+                directories, stages, n_samples=40000, seed=8, connection_sets=connection_sets, as_dataframe=True
+            )
+            for column in TRAINING_COLUMNS:
+                self.assertEqual(frame[column].tolist(), data[column].tolist())
+        
+        empty = generate_synthetic_interactions(["a"], stages, n_samples=10)
+        self.assertTrue(all(len(column) == 0 for column in empty.values()))
+    
+    
+    def test_import_time_benchmark_script(self):
+        """
+        Validate the import-time benchmark summary, report and regression exit code
+        """
+        script = os.path.join(self.project_root, 'scripts', 'import_time_benchmark.py')
+        modules = ['metadata_repository', 'ml_recommendation_optimizer']
+        with tempfile.TemporaryDirectory() as directory:
+            report_path = os.path.join(directory, 'report.json')
+            result = subprocess.run(
+                [sys.executable, script, *modules, '--repeats', '1', '--output', report_path],
+                capture_output=True, text=True, timeout=120
+            )
+            self.assertEqual(result.returncode, 0, result.stderr)
+            for module in modules:
+                self.assertRegex(result.stdout, rf"{module}\s+\d+\.\d ms")
+            self.assertIn(f"Import Time Report: {report_path}", result.stdout)
+            
+            with open(report_path, 'r') as f:
+                report = json.load(f)
+            self.assertEqual(sorted(report['modules']), sorted(modules))
+            self.assertTrue(all(timing['cumulative_us'] > 0 for timing in report['modules'].values()))
+            
+            # A baseline that is impossibly fast flags every module as a regression
+            for timing in report['modules'].values():
+                timing['cumulative_us'] = 1
+            with open(report_path, 'w') as f:
+                json.dump(report, f)
+            regressed = subprocess.run(
+                [sys.executable, script, *modules, '--repeats', '1', '--baseline', report_path,
+                 '--output', os.path.join(directory, 'second.json')],
+                capture_output=True, text=True, timeout=120
+            )
+            self.assertEqual(regressed.returncode, 1)
+            self.assertIn("Import time regressions", regressed.stdout)
+        
+        # Heavyweight dependencies stay deferred until a model is trained
+        probe = subprocess.run(
+            [sys.executable, '-c', "import sys, ml_recommendation_optimizer, model_performance_dashboard; "
+             "print(sorted(m for m in ('sklearn', 'pandas', 'matplotlib') if m in sys.modules))"],
+            cwd=self.project_root, capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(probe.stdout.strip(), "[]", probe.stderr)
+    
+    
+    def test_ml_model_artifact_round_trip(self):
+        """
+        Validate model artifact save/load and rejection of incompatible artifacts
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            artifact_path = os.path.join(directory, 'model.pkl')
+            trained = MLRecommendationOptimizer(self.metadata_path, model_artifact_path=artifact_path)
+            trained.train_recommendation_model()
+            self.assertEqual(trained.save_model_artifact(), artifact_path)
+            
+            candidates = ["19_Digital_Marketing", "36_Personal_Development", "09_Workflow_Automation"]
+            restored = MLRecommendationOptimizer(self.metadata_path, model_artifact_path=artifact_path, warm_start=True)
+            self.assertIsNotNone(restored.model)
+            self.assertEqual(
+                restored.optimize_recommendations("04_Quick_Start_Guides", "Entry-Level Professional", candidates),
+                trained.optimize_recommendations("04_Quick_Start_Guides", "Entry-Level Professional", candidates)
+            )
+            
+            mismatched = MLRecommendationOptimizer(self.metadata_path, model_artifact_path=artifact_path)
+            mismatched.directory_encoder = CategoricalEncoder(reversed(mismatched.directory_encoder.categories))
+            self.assertFalse(mismatched.load_model_artifact())
+            
+            with open(artifact_path, 'rb') as f:
+                artifact = pickle.load(f)
+            artifact["artifact_version"] = MLRecommendationOptimizer.MODEL_ARTIFACT_VERSION + 1
+            with open(artifact_path, 'wb') as f:
+                pickle.dump(artifact, f)
+            self.assertFalse(MLRecommendationOptimizer(self.metadata_path, model_artifact_path=artifact_path).load_model_artifact())
+    
+    def test_performance_analyzer_sees_saved_edits(self):
+        """
+        Validate that saving a guide updates sizes and the modified count incrementally
+        """
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, '04_Quick_Start_Guides'))
+            guide_path = os.path.join(root, '04_Quick_Start_Guides', 'GUIDE.md')
+            with open(guide_path, 'w') as f:
+                f.write("# Guide\n")
+            
+            analyzer = SystemPerformanceAnalyzer(root, output_directory=os.path.join(root, 'reports'))
+            analyzer.analyze_directory_structure()
+            # The first scan creates .scan_cache in the root, so warm up once more
+            before = analyzer.analyze_directory_structure()
+            # Editors save by writing a new file and renaming it over the old one
+            with open(guide_path + '.tmp', 'w') as f:
+                f.write("# Guide\nMore local context.\n")
+            os.replace(guide_path + '.tmp', guide_path)
+            after = analyzer.analyze_directory_structure()
+            
+            self.assertEqual(after["changes_since_last_scan"]["modified"], 1)
+            # Only the guide's directory is re-listed
+            self.assertEqual(after["changes_since_last_scan"]["rescanned_directories"], 1)
+            self.assertEqual(
+                sum(entry["size"] for entry in after["largest_directories"]) -
+                sum(entry["size"] for entry in before["largest_directories"]),
+                len("More local context.\n")
+            )
+    
+    def test_keyword_categorizer_matches(self):
+        """
+        Validate overlapping keyword matches and vocabulary-order priority
+        """
+        vocabulary = {
+            "Marketing": ["market", "marketing"],
+            "Finance": ["fin", "finance"],
+            "Technology": ["tech", "ai"]
+        }
+        categorizer = KeywordCategorizer(vocabulary)
+        
+        self.assertEqual(
+            sorted(categorizer.find_matches("Marketing")),
+            sorted([
+                KeywordMatch("Marketing", "market", 0, 6),
+                KeywordMatch("Marketing", "marketing", 0, 9)
+            ])
+        )
+        self.assertEqual(
+            {match.keyword for match in categorizer.find_matches("FinTech_Finance")},
+            {"fin", "finance", "tech"}
+        )
+        self.assertEqual(categorizer.primary_label("tech_and_finance"), "Finance")
+        self.assertIsNone(categorizer.primary_label("Community"))
+        
+        # Same answers as `keyword in name`, labels in vocabulary order
+        for name in ["Retail_Tech_Finance_Marketing", "19_Digital_Marketing", "Fintech_Maintenance", "AI_Tools", "Community"]:
+            expected = [
+                label for label, keywords in vocabulary.items()
+                if any(keyword in name.lower() for keyword in keywords)
+            ]
+            self.assertEqual(categorizer.classify(name), expected)
+    
+    def test_navigation_artifacts_single_scan(self):
+        """
+        Validate that the metadata and navigation graph come from one directory scan
+        """
+        with tempfile.TemporaryDirectory() as root:
+            for directory in ('04_Quick_Start_Guides/templates', '07_AI_Tutorials', '12_Getting_Started',
+                              '22_Career_Development/interviews/panels'):
+                os.makedirs(os.path.join(root, directory))
+            with open(os.path.join(root, '07_AI_Tutorials', 'README.md'), 'w') as f:
+                f.write("# AI Tutorials\n")
+            
+            engine = ContentCrossReferencingEngine(root)
+            with mock.patch.object(engine.scanner, 'scan', wraps=engine.scanner.scan) as scan:
+                artifacts = engine.build_navigation_artifacts()
+            self.assertEqual(scan.call_count, 1)
+            # Root plus every directory, each listed exactly once
+            self.assertEqual(engine.scanner.rescanned_directories, 8)
+            self.assertEqual(set(artifacts['timings']), {'scan', 'categorize', 'connect', 'serialize'})
+            
+            metadata = artifacts['metadata']
+            self.assertEqual(metadata['directory_relationships']['07_AI_Tutorials']['files'], ['README.md'])
+            self.assertEqual(artifacts['navigation_graph']['thematic_connections'], metadata['content_connections'])
+            
+            with open(artifacts['metadata_path'], 'r') as f:
+                saved = json.load(f)
+            self.assertEqual(saved['directory_relationships'], metadata['directory_relationships'])
+            self.assertEqual(saved['content_connections'], dict(metadata['content_connections']))
+            self.assertEqual(NavigationGraph.load(artifacts['graph_path']).names, engine.content_graph.names)
+    
+    
+    def test_category_rule_connections_match_pairwise_rule(self):
+        """
+        Validate bucketed content connections against the quadratic pairwise scan
+        """
+        rng = random.Random(13)
+        categories = ["Getting Started", "AI & Technology", "Business Development", "Career Development", ""]
+        for _ in range(200):
+            directory_relationships = {}
+            for i in range(rng.randint(0, 25)):
+                details = {"files": []}
+                if rng.random() < 0.9:
+                    details["primary_category"] = rng.choice(categories)
+                directory_relationships[f"{i:02d}_dir"] = details
+            connection_rules = {
+                category: [rng.choice(categories + ["Unused Category"]) for _ in range(rng.randint(0, 4))]
+                for category in rng.sample(categories, rng.randint(0, len(categories)))
+            }
+            
+            expected = {
+                directory: [
+                    name for name, other in directory_relationships.items()
+                    if other.get("primary_category") in connection_rules.get(details.get("primary_category", ""), [])
+                ]
+                for directory, details in directory_relationships.items()
+            }
+            graph = NavigationGraph.from_category_rules(directory_relationships, connection_rules)
+            self.assertEqual({name: list(targets) for name, targets in graph.connections().items()}, expected)
+    
+    
+    def test_atomic_write_skips_unchanged_and_cleans_up(self):
+        """
+        Validate unchanged-content skips and that a failed write leaves no temp file
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'nested', 'CROSS_REFERENCING_METADATA.json')
+            self.assertTrue(atomic_write_json(path, {"a": 1}, indent=2))
+            inode = os.stat(path).st_ino
+            self.assertFalse(atomic_write_json(path, {"a": 1}, indent=2))
+            self.assertEqual(os.stat(path).st_ino, inode)
+            
+            # Same size, different content is still written
+            self.assertTrue(atomic_write_json(path, {"a": 2}, indent=2))
+            self.assertNotEqual(os.stat(path).st_ino, inode)
+            self.assertTrue(atomic_write_json(path, {"a": 2}, skip_unchanged=False, indent=2))
+            
+            with mock.patch('atomic_io.os.replace', side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    atomic_write_bytes(path, b"partial")
+            with self.assertRaises(TypeError):
+                atomic_write_json(path, {"a": object()})
+            
+            self.assertEqual(os.listdir(os.path.dirname(path)), ['CROSS_REFERENCING_METADATA.json'])
+            with open(path, 'r') as f:
+                self.assertEqual(json.load(f), {"a": 2})
+    
+    
+    def test_navigation_graph_binary_round_trip(self):
+        """
+        Validate the binary graph format: round trip, zero-copy views, header checks
+        """
+        graph = NavigationGraph.from_metadata(self.metadata)
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'NAVIGATION_GRAPH.bin')
+            self.assertTrue(graph.save(path))
+            self.assertFalse(graph.save(path))
+            
+            for use_mmap in (True, False):
+                loaded = NavigationGraph.load(path, use_mmap=use_mmap)
+                self.assertEqual(loaded.names, graph.names)
+                self.assertEqual(loaded.category_names, graph.category_names)
+                self.assertEqual(loaded.stage_names, graph.stage_names)
+                self.assertEqual(loaded.to_dict(), graph.to_dict())
+                for name in ('offsets', 'neighbors', 'categories', 'stage_offsets', 'stage_resources'):
+                    array = getattr(loaded, name)
+                    self.assertTrue((array == getattr(graph, name)).all())
+                    # Views into the file buffer, not copies
+                    self.assertFalse(array.flags.owndata)
+                    self.assertFalse(array.flags.writeable)
+            
+            data = graph.to_bytes()
+            with self.assertRaises(ValueError):
+                NavigationGraph.from_buffer(b"XXXX" + data[4:])
+            with self.assertRaises(ValueError):
+                NavigationGraph.from_buffer(data[:4] + struct.pack('<I', 99) + data[8:])
+    
+    def test_breadcrumb_ancestry_and_cache_isolation(self):
+        """
+        Validate multi-level breadcrumbs and that cached trails cannot be mutated by callers
+        """
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, '09_Workflow_Automation', 'templates', 'email_sequences'))
+            engine = CrossReferencingEngine(self.metadata_path, root_directory=root)
+            
+            breadcrumb = engine.generate_breadcrumb("09_Workflow_Automation/templates/email_sequences")
+            self.assertEqual(
+                [crumb['path'] for crumb in breadcrumb],
+                ["/09_Workflow_Automation", "/09_Workflow_Automation/templates",
+                 "/09_Workflow_Automation/templates/email_sequences"]
+            )
+            self.assertEqual(breadcrumb[0]['name'], "09 Workflow Automation")
+            self.assertEqual(breadcrumb[0]['context'], "Digital collaboration strategies for local professionals")
+            self.assertEqual(breadcrumb[-1]['context'], "Professional resource navigation")
+            
+            # Unambiguous bare names resolve to their full ancestry
+            self.assertEqual(engine.generate_breadcrumb("email_sequences"), breadcrumb)
+            
+            breadcrumb[0]['name'] = "Changed"
+            breadcrumb.pop()
+            self.assertEqual(
+                engine.generate_breadcrumb("09_Workflow_Automation/templates/email_sequences")[0]['name'],
+                "09 Workflow Automation"
+            )
+            self.assertEqual(len(engine.generate_breadcrumb("/09_Workflow_Automation/templates/email_sequences/")), 3)
+            
+            # Each engine keeps its own cache and directory index
+            other = CrossReferencingEngine(self.metadata_path, root_directory=os.path.join(root, '09_Workflow_Automation'))
+            self.assertEqual(len(other.generate_breadcrumb("templates/email_sequences")), 2)
+            self.assertEqual(len(engine.generate_breadcrumb("templates/email_sequences")), 2)
+            self.assertEqual(engine.generate_breadcrumb("email_sequences"), engine.generate_breadcrumb(
+                "09_Workflow_Automation/templates/email_sequences"
+            ))
+    
+    def test_recommendation_table_ordering_and_stats(self):
+        """
+        Validate compiled recommendation ordering, hit/miss counting and the bulk API
+        """
+        engine = CrossReferencingEngine(self.metadata_path)
+        relationships = self.metadata['directory_relationships']
+        pathways = self.metadata['professional_growth_pathways']
+        
+        for directory, details in relationships.items():
+            for stage in [None, *pathways]:
+                ranked = list(details.get('primary_connections', []))
+                if stage:
+                    ranked += pathways[stage].get('recommended_resources', [])
+                expected = [resource for resource in dict.fromkeys(ranked) if resource != directory]
+                self.assertEqual(engine.get_recommended_resources(directory, stage), expected)
+        
+        lookups = len(relationships) * (len(pathways) + 1)
+        self.assertEqual(engine.recommendation_stats, {"hits": lookups, "misses": 0})
+        
+        stage = next(iter(pathways))
+        self.assertEqual(
+            engine.get_recommended_resources("99_Unknown_Section", stage),
+            [resource for resource in dict.fromkeys(pathways[stage].get('recommended_resources', []))]
+        )
+        self.assertEqual(engine.recommendation_stats["misses"], 1)
+        
+        bulk = engine.get_bulk_recommendations([*relationships, "99_Unknown_Section"], stage)
+        self.assertEqual(list(bulk), [*relationships, "99_Unknown_Section"])
+        for directory, recommendations in bulk.items():
+            self.assertEqual(recommendations, engine.get_recommended_resources(directory, stage))
+        
+        # Returned lists are copies of the compiled table
+        bulk[next(iter(relationships))].append("mutated")
+        self.assertNotIn("mutated", engine.get_recommended_resources(next(iter(relationships)), stage))
+    
+    def test_personalized_pagerank_matches_linear_solve(self):
+        """
+        Validate batched PageRank (SciPy and NumPy propagation) against a dense linear solve
+        """
+        graph = NavigationGraph.from_metadata(self.metadata)
+        n, damping = graph.node_count, 0.85
+        
+        # r = (1 - d) e_s + d (P^T r + e_s * dangling mass)
+        transition = np.zeros((n, n))
+        for node in range(n):
+            neighbors = graph.neighbor_ids(node)
+            for neighbor in neighbors.tolist():
+                transition[neighbor, node] += 1.0 / len(neighbors)
+        dangling = np.diff(graph.offsets) == 0
+        expected = np.zeros((n, n))
+        for seed in range(n):
+            operator = transition.copy()
+            operator[seed, dangling] += 1.0
+            teleport = np.zeros(n)
+            teleport[seed] = 1.0 - damping
+            expected[seed] = np.linalg.solve(np.eye(n) - damping * operator, teleport)
+        
+        stationary, _ = personalized_pagerank(graph, damping=damping, tolerance=1e-12)
+        np.testing.assert_allclose(stationary, expected, atol=1e-9)
+        
+        with mock.patch.dict(sys.modules, {'scipy': None, 'scipy.sparse': None}):
+            fallback, _ = personalized_pagerank(graph, damping=damping, tolerance=1e-12, seed_batch_size=3)
+        np.testing.assert_allclose(fallback, expected, atol=1e-9)
+    
+    def test_tag_incidence_matrix_matches_set_reference(self):
+        """
+        Validate exact tag similarity (dense, sparse, per-row, top-k) against set arithmetic
+        """
+        rng = random.Random(7)
+        vocabulary = [f"tag_{i}" for i in range(25)]
+        tag_sets = {f"item_{i}": set(rng.sample(vocabulary, rng.randint(1, 6))) for i in range(60)}
+        tag_sets["untagged"] = set()
+        names = list(tag_sets)
+        
+        def jaccard(first, second):
+            union = len(tag_sets[first] | tag_sets[second])
+            return len(tag_sets[first] & tag_sets[second]) / union if union else 0.0
+        
+        expected = np.array([[jaccard(first, second) for second in names] for first in names])
+        matrix = TagIncidenceMatrix(tag_sets)
+        self.assertEqual(matrix.names, tuple(names))
+        
+        np.testing.assert_allclose(matrix.jaccard_matrix(), expected)
+        np.testing.assert_allclose(matrix.jaccard_matrix(sparse_output=True).toarray(), expected)
+        for row, name in enumerate(names):
+            np.testing.assert_allclose(matrix.jaccard_row(name), expected[row])
+        
+        with mock.patch.dict(sys.modules, {'scipy': None, 'scipy.sparse': None}):
+            np.testing.assert_allclose(matrix.jaccard_matrix(), expected)
+            self.assertIsNone(matrix.jaccard_matrix(sparse_output=True))
+        
+        # nearest()/top_k_neighbors() follow a stable descending sort of the reference row
+        neighbors, similarities = matrix.top_k_neighbors(5)
+        for row, name in enumerate(names):
+            ranked = sorted(
+                (column for column in range(len(names)) if column != row and expected[row, column] > 0),
+                key=lambda column: -expected[row, column]
+            )[:5]
+            self.assertEqual([neighbor for neighbor, _ in matrix.nearest(name, 5)], [names[c] for c in ranked])
+            self.assertEqual(neighbors[row, :len(ranked)].tolist(), ranked)
+            np.testing.assert_allclose(similarities[row, :len(ranked)], expected[row, ranked])
+            self.assertTrue(np.all(neighbors[row, len(ranked):] == -1))
+        self.assertEqual(matrix.nearest("untagged"), [])
+    
+    def test_minhash_lsh_recall(self):
+        """
+        Validate MinHash/LSH candidate recall and similarity estimates on a seeded fixture
+        """
+        rng = random.Random(11)
+        vocabulary = [f"tag_{i}" for i in range(400)]
+        tag_sets = {}
+        for cluster in range(40):
+            # Each cluster: a base tag set plus variants sharing most of it
+            base = rng.sample(vocabulary, 12)
+            for variant in range(4):
+                tags = set(base)
+                tags.discard(rng.choice(base))
+                tags.add(rng.choice(vocabulary))
+                tag_sets[f"cluster_{cluster}_{variant}"] = tags
+        matrix = TagIncidenceMatrix(tag_sets)
+        index = MinHashLSHIndex(matrix, num_permutations=64, bands=16, seed=42)
+        exact = matrix.jaccard_matrix()
+        
+        similar_pairs = found = 0
+        for row, name in enumerate(matrix.names):
+            candidates = set(index.candidates(name).tolist())
+            for column in np.flatnonzero(exact[row] >= 0.7).tolist():
+                if column != row:
+                    similar_pairs += 1
+                    found += column in candidates
+        self.assertGreater(similar_pairs, 100)
+        self.assertGreaterEqual(found / similar_pairs, 0.95)
+        
+        # Approximate neighbours are re-scored exactly, so every reported similarity is exact
+        for name in matrix.names[:20]:
+            for neighbor, similarity in index.nearest(name, 3):
+                self.assertAlmostEqual(similarity, exact[matrix.index[name], matrix.index[neighbor]])
+        
+        errors = [
+            abs(index.estimated_similarity(first, second) - exact[matrix.index[first], matrix.index[second]])
+            for first, second in zip(matrix.names[::2], matrix.names[1::2])
+        ]
+        self.assertLess(np.mean(errors), 0.1)
+    
+    def test_buffered_collector_record_flush_close(self):
+        """
+        Validate buffered ingestion: flush, context manager, finalizer and record() racing close()
+        """
+        def stored_ids(collector):
+            return {entry['interaction_id'] for entry in collector.get_training_data()}
+        
+        with tempfile.TemporaryDirectory() as storage:
+            collector = TrainingDataCollector(storage, buffered=True, flush_interval=60)
+            first = [collector.record(f"user_{i}", "01_Foundations", "02_Guides", "emerging_professional") for i in range(3)]
+            self.assertTrue(all(uuid.UUID(interaction_id).version == 7 for interaction_id in first))
+            self.assertEqual(stored_ids(collector), set())
+            self.assertTrue(collector.flush(timeout=10))
+            self.assertEqual(stored_ids(collector), set(first))
+            
+            # Records keep flowing (and are not lost) while another thread closes the collector
+            recorded: List[str] = []
+            started = threading.Barrier(5)
+            def produce():
+                started.wait()
+                for i in range(300):
+                    recorded.append(collector.record("user_race", "02_Guides", "03_Tools", "mid_career", context_metadata={"i": i}))
+            producers = [threading.Thread(target=produce) for _ in range(4)]
+            for producer in producers:
+                producer.start()
+            started.wait()
+            collector.close()
+            for producer in producers:
+                producer.join()
+            self.assertFalse(collector._writer.thread.is_alive())
+            self.assertEqual(stored_ids(collector), set(first) | set(recorded))
+            self.assertEqual(len(recorded), 1200)
+            
+            # Context manager closes (and flushes) on exit; a tiny queue only applies backpressure
+            with TrainingDataCollector(storage, buffered=True, batch_size=7, flush_interval=60, max_queue_size=5) as managed:
+                second = [managed.record("user_cm", "03_Tools", "04_Community", "established_professional") for _ in range(50)]
+            self.assertFalse(managed._writer.thread.is_alive())
+            self.assertTrue(set(second) <= stored_ids(managed))
+            
+            # A dropped collector is stopped and flushed by its weakref finalizer
+            abandoned = TrainingDataCollector(storage, buffered=True, flush_interval=60)
+            writer = abandoned._writer
+            last = abandoned.record("user_gc", "04_Community", "01_Foundations", "emerging_professional")
+            del abandoned
+            gc.collect()
+            writer.thread.join(timeout=10)
+            self.assertFalse(writer.thread.is_alive())
+            self.assertIn(last, stored_ids(managed))
+    
+    def test_buffered_collector_retries_and_spills_failed_batches(self):
+        """
+        Validate that transient write errors are retried and persistent ones are spilled and raised
+        """
+        from training_data_collector import _insert_rows as real_insert
+        
+        with tempfile.TemporaryDirectory() as storage, \
+                mock.patch('training_data_collector.WRITE_RETRY_DELAYS', (0, 0, 0)):
+            collector = TrainingDataCollector(storage, buffered=True, flush_interval=60)
+            
+            # One busy error, then success: retried without losing or reporting anything
+            attempts = []
+            def flaky_insert(database, rows):
+                attempts.append(len(rows))
+                if len(attempts) == 1:
+                    raise sqlite3.OperationalError("database is locked")
+                real_insert(database, rows)
+            
+            with mock.patch('training_data_collector._insert_rows', side_effect=flaky_insert):
+                retried = collector.record("user_retry", "01_Foundations", "02_Guides", "emerging_professional")
+                self.assertTrue(collector.flush(timeout=10))
+            self.assertEqual(attempts, [1, 1])
+            self.assertEqual(collector.write_errors, 0)
+            self.assertEqual([entry['interaction_id'] for entry in collector.get_training_data()], [retried])
+            
+            # Persistent failure: spilled to disk and surfaced once from flush()
+            with mock.patch('training_data_collector._insert_rows',
+                            side_effect=sqlite3.OperationalError("disk I/O error")):
+                lost = [collector.record("user_spill", "02_Guides", "03_Tools", "mid_career") for _ in range(3)]
+                with self.assertRaises(sqlite3.OperationalError):
+                    collector.flush(timeout=10)
+            self.assertEqual(collector.write_errors, 3)
+            self.assertTrue(collector.flush(timeout=10))
+            
+            spill_path = os.path.join(storage, UNWRITTEN_INTERACTIONS_FILENAME)
+            with open(spill_path) as f:
+                spilled = [json.loads(line) for line in f]
+            self.assertEqual([entry['interaction_id'] for entry in spilled], lost)
+            self.assertEqual(set(spilled[0]), set(TRAINING_DATA_COLUMNS))
+            
+            # A duplicate interaction ID rejects only that row; the rest of its batch commits
+            duplicate = collector._build_interaction_row(
+                "user_dup", "03_Tools", "04_Community", "mid_career", "navigation", 0.0, 0.5, None
+            )
+            collector._write_rows([duplicate])
+            kept = [collector.record("user_dup", "03_Tools", "04_Community", "mid_career") for _ in range(2)]
+            collector._writer.put(duplicate)
+            kept.append(collector.record("user_dup", "03_Tools", "04_Community", "mid_career"))
+            with self.assertRaises(sqlite3.IntegrityError):
+                collector.flush(timeout=10)
+            self.assertEqual(collector.write_errors, 4)
+            stored = {entry['interaction_id'] for entry in collector.get_training_data()}
+            self.assertTrue(set(kept) <= stored)
+            with open(spill_path) as f:
+                self.assertEqual([json.loads(line)['interaction_id'] for line in f][3:], [duplicate[0]])
+            collector.close()
+    
+    @unittest.skipUnless(hasattr(os, 'fork'), "needs os.fork")
+    def test_interaction_ids_differ_across_fork(self):
+        """
+        Validate that a forked child does not replay the parent's pooled ID randomness
+        """
+        from training_data_collector import _new_interaction_id
+        _new_interaction_id()  # Fill this thread's pool before forking
+        
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_end)
+            os.write(write_end, "\n".join(_new_interaction_id() for _ in range(100)).encode())
+            os._exit(0)
+        os.close(write_end)
+        parent_ids = [_new_interaction_id() for _ in range(100)]
+        with os.fdopen(read_end) as pipe:
+            child_ids = pipe.read().split("\n")
+        os.waitpid(pid, 0)
+        
+        # Compare the random parts only; the millisecond prefixes may legitimately match
+        random_part = lambda interaction_id: interaction_id[14:]
+        self.assertEqual(len(child_ids), 100)
+        self.assertFalse({random_part(i) for i in parent_ids} & {random_part(i) for i in child_ids})
+    
+    @unittest.skipUnless(hasattr(time, 'tzset'), "needs time.tzset to switch the local timezone")
+    def test_interaction_database_wal_readers_and_pooling(self):
+        """
+        Validate persisted WAL mode, read-only readers beside an open write and connection reuse
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'interactions.db')
+            database = InteractionDatabase(path)
+            try:
+                with database.transaction() as conn:
+                    conn.execute("CREATE TABLE events (value INTEGER)")
+                    conn.execute("INSERT INTO events VALUES (1)")
+                
+                # journal_mode=WAL is stored in the file, so plain connections see it too
+                plain = sqlite3.connect(path)
+                self.assertEqual(plain.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+                plain.close()
+                
+                writer = database.connection()
+                self.assertIs(database.connection(), writer)
+                writer.execute("BEGIN IMMEDIATE")
+                writer.execute("INSERT INTO events VALUES (2)")
+                
+                # Readers on this and another thread proceed while the write is open
+                reader = database.connection(read_only=True)
+                self.assertIs(database.connection(read_only=True), reader)
+                self.assertIsNot(reader, writer)
+                self.assertEqual(reader.execute("SELECT COUNT(*) FROM events").fetchone()[0], 1)
+                with self.assertRaises(sqlite3.OperationalError):
+                    reader.execute("INSERT INTO events VALUES (3)")
+                
+                other_thread = {}
+                def read_from_worker():
+                    with database.reader() as conn:
+                        other_thread['count'] = conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+                        other_thread['same'] = conn is reader
+                    database.close_thread_connections()
+                worker = threading.Thread(target=read_from_worker)
+                worker.start()
+                worker.join(timeout=10)
+                self.assertEqual(other_thread, {'count': 1, 'same': False})
+                
+                writer.commit()
+                self.assertEqual(reader.execute("SELECT COUNT(*) FROM events").fetchone()[0], 2)
+                self.assertIs(get_interaction_database(path), get_interaction_database(os.path.relpath(path)))
+            finally:
+                database.close_all()
+                get_interaction_database(path).close_all()
+    
+    
+    def test_timestamp_schema_migration(self):
+        """
+        Validate the version 0 -> 1 migration (integer timestamps, indexes, aware values on the local clock)
+        """
+        legacy_rows = [
+            ("naive", "2024-03-01T09:30:00.250000"),
+            ("offset", "2024-03-01T09:30:00+02:00"),
+            ("utc", "2024-03-01T09:30:00Z"),
+            ("space", "2024-03-02 18:05:07"),
+        ]
+        try:
+            # Local time UTC-8, so converting aware values to UTC instead would show
+            with mock.patch.dict(os.environ, {'TZ': 'Etc/GMT+8'}), tempfile.TemporaryDirectory() as storage:
+                time.tzset()
+                legacy = sqlite3.connect(os.path.join(storage, 'user_interactions.db'))
+                legacy.execute('''
+                    CREATE TABLE user_interactions (
+                        interaction_id TEXT PRIMARY KEY, user_hash TEXT, timestamp DATETIME,
+                        current_directory TEXT, target_directory TEXT, professional_stage TEXT,
+                        interaction_type TEXT, interaction_duration REAL, interaction_score REAL,
+                        context_metadata TEXT
+                    )
+                ''')
+                legacy.executemany(
+                    "INSERT INTO user_interactions VALUES (?, 'hash', ?, '01_Foundations', '02_Guides', "
+                    "'emerging_professional', 'navigation', 1.5, 0.5, '{}')",
+                    legacy_rows
+                )
+                legacy.commit()
+                legacy.close()
+                
+                collector = TrainingDataCollector(storage)
+                with collector.database.reader() as conn:
+                    self.assertEqual(conn.execute('PRAGMA user_version').fetchone()[0], 1)
+                    stored = dict(conn.execute('SELECT interaction_id, timestamp FROM user_interactions'))
+                    indexes = {name for (name,) in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'user_interactions' "
+                        "AND name NOT LIKE 'sqlite_autoindex%'"
+                    )}
+                
+                self.assertTrue(all(isinstance(value, int) for value in stored.values()))
+                self.assertEqual(indexes, {
+                    'idx_interactions_timestamp',
+                    'idx_interactions_stage_timestamp',
+                    'idx_interactions_user_timestamp',
+                })
+                for interaction_id, value in legacy_rows:
+                    self.assertEqual(stored[interaction_id], to_epoch_micros(datetime.fromisoformat(value)))
+                
+                entries = {
+                    entry['interaction_id']: entry['timestamp']
+                    for entry in collector.get_training_data(start_date=datetime(2024, 1, 1))
+                }
+                self.assertEqual(entries, {
+                    "naive": "2024-03-01T09:30:00.250000",
+                    "offset": "2024-02-29T23:30:00",
+                    "utc": "2024-03-01T01:30:00",
+                    "space": "2024-03-02T18:05:07",
+                })
+                self.assertEqual(
+                    [entry['interaction_id'] for entry in collector.get_training_data(
+                        start_date=datetime(2024, 3, 1), end_date=datetime(2024, 3, 1, 12)
+                    )],
+                    ["utc", "naive"]
+                )
+        finally:
+            time.tzset()
+    
+    def test_breadcrumb_index_on_read_only_root_and_refresh(self):
+        """
+        Validate breadcrumbs without a writable scan cache and pickup of later directories
+        """
+        with tempfile.TemporaryDirectory() as root:
+            os.makedirs(os.path.join(root, '09_Workflow_Automation', 'templates'))
+            # A plain file where the scan cache directory would go makes any write fail
+            with open(os.path.join(root, '.scan_cache'), 'w') as f:
+                f.write('')
+            
+            engine = CrossReferencingEngine(self.metadata_path, root_directory=root)
+            self.assertEqual(len(engine.generate_breadcrumb("09_Workflow_Automation/templates")), 2)
+            self.assertTrue(os.path.isfile(os.path.join(root, '.scan_cache')))
+            
+            # Directories added later resolve after an explicit refresh
+            os.makedirs(os.path.join(root, '09_Workflow_Automation', 'templates', 'email_sequences'))
+            self.assertTrue(engine.refresh_directory_index())
+            self.assertEqual(
+                [crumb['path'] for crumb in engine.generate_breadcrumb("email_sequences")],
+                ["/09_Workflow_Automation", "/09_Workflow_Automation/templates",
+                 "/09_Workflow_Automation/templates/email_sequences"]
+            )
+            self.assertFalse(engine.refresh_directory_index())
+            
+            # ... or on their own once the refresh interval has passed
+            polling = CrossReferencingEngine(self.metadata_path, root_directory=root, directory_refresh_interval=0)
+            self.assertEqual(len(polling.generate_breadcrumb("email_sequences")), 3)
+            os.makedirs(os.path.join(root, '09_Workflow_Automation', 'templates', 'email_sequences', 'onboarding'))
+            self.assertEqual(len(polling.generate_breadcrumb("onboarding")), 4)
+    
+    
     def test_breadcrumb_navigation(self):
         """
         Validate breadcrumb navigation across different directories
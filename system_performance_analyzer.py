@@ -5,6 +5,8 @@ import hashlib
 from typing import Dict, Any, List
 from datetime import datetime
 
+from directory_scanner import DirectoryScanner
+
 class SystemPerformanceAnalyzer:
     """
     Lightweight System Performance Analysis for Port Townsend Professional Resource Library
@@ -32,6 +34,8 @@ class SystemPerformanceAnalyzer:
         
         # Ensure output directory exists
         os.makedirs(self.output_directory, exist_ok=True)
+        
+        self.scanner = DirectoryScanner(self.root_directory)
     
     def analyze_directory_structure(self) -> Dict[str, Any]:
         """
@@ -51,8 +55,14 @@ class SystemPerformanceAnalyzer:
             "largest_directories": []
         }
         
-        # Walk through directory
-        for root, dirs, files in os.walk(self.root_directory):
+        # Walk through directory (incremental scan; file sizes come from the stat cache).
+        # Only directories whose mtime changed are re-listed, so files saved by
+        # replacement (write-then-rename, as editors do) are picked up but plain
+        # in-place appends are not until their directory changes. Counts exclude
+        # the scanner's ignored directories (.git, node_modules, __pycache__,
+        # .scan_cache), which the previous os.walk included.
+        scan_diff = self.scanner.scan()
+        for root, dirs, files in self.scanner.walk():
             directory_metrics["total_directories"] += len(dirs)
             directory_metrics["total_files"] += len(files)
             
@@ -69,18 +79,26 @@ class SystemPerformanceAnalyzer:
                 directory_metrics["file_types"][ext] = directory_metrics["file_types"].get(ext, 0) + 1
             
             # Track largest directories
-            dir_size = sum(os.path.getsize(os.path.join(root, f)) for f in files)
+            dir_size = sum(file_stat.size for file_stat in self.scanner.file_stats(root).values())
             directory_metrics["largest_directories"].append({
                 "path": root,
                 "size": dir_size
             })
         
         # Sort largest directories
-        directory_metrics["largest_directories"].sort(
+        directory_metrics["largest_directories"] = sorted(
+            directory_metrics["largest_directories"],
             key=lambda x: x["size"], 
             reverse=True
         )[:5]  # Top 5 largest
         
+        directory_metrics["changes_since_last_scan"] = {
+            "added": len(scan_diff.added),
+            "removed": len(scan_diff.removed),
+            "modified": len(scan_diff.modified),
+            "rescanned_directories": self.scanner.rescanned_directories
+        }
+        
         # Performance timing
         end_time = time.time()
         directory_metrics["analysis_duration"] = end_time - start_time
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ranking_utils import select_top_k
+
+if TYPE_CHECKING:
+    import scipy.sparse
+
+# Mersenne prime for the MinHash universal hash family
+_MINHASH_PRIME = (1 << 31) - 1
+
+def _load_scipy_sparse():
+    """
+    Import scipy.sparse on first use; it is optional
+
+    Returns:
+        The scipy.sparse module, or None when SciPy is not installed
+    """
+    try:
+        import scipy.sparse
+    except ImportError:
+        return None
+    return scipy.sparse
+
+class TagIncidenceMatrix:
+    """
+    Sparse binary item x tag matrix for context-tag similarity
+
+    Design Philosophy: One sparse product instead of a set intersection per pair
+    Core Objective: Scale tag similarity from top-level sections to individual guide files
+
+    Rows are stored in CSR form (indptr/indices) with a tag -> rows posting
+    list alongside, so single-row queries touch only the rows that share a
+    tag. SciPy is used for all-pairs products when it is installed; the
+    NumPy fallback gives identical results.
+    """
+
+    def __init__(self, tag_sets: Mapping[str, Iterable[str]]):
+        """
+        Build the matrix
+
+        Args:
+            tag_sets: Item name -> tags (directories, guide files, ...)
+        """
+        self.names: Tuple[str, ...] = tuple(tag_sets)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+
+        tag_index: Dict[str, int] = {}
+        rows = []
+        for name in self.names:
+            # Sorted so the vocabulary order does not depend on set iteration order
+            rows.append(sorted({tag_index.setdefault(tag, len(tag_index)) for tag in sorted(set(tag_sets[name]))}))
+        self.tags: Tuple[str, ...] = tuple(tag_index)
+
+        self.indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(row) for row in rows], out=self.indptr[1:])
+        self.indices = np.fromiter(
+            (tag for row in rows for tag in row), dtype=np.int32, count=int(self.indptr[-1])
+        )
+        self.row_counts = np.diff(self.indptr)
+
+        # Posting lists (the CSC view): rows carrying each tag, ascending
+        order = np.argsort(self.indices, kind='stable')
+        self._posting_rows = np.repeat(np.arange(len(rows), dtype=np.int32), self.row_counts)[order]
+        self._posting_ptr = np.zeros(len(self.tags) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(self.indices, minlength=len(self.tags)), out=self._posting_ptr[1:])
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.names), len(self.tags)
+
+    def row_tags(self, item: Union[str, int]) -> np.ndarray:
+        """
+        Tag IDs of one item
+        """
+        row = self.index[item] if isinstance(item, str) else item
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def to_scipy(self) -> Optional["scipy.sparse.csr_matrix"]:
+        """
+        The matrix as a SciPy CSR matrix, or None without SciPy
+        """
+        sparse = _load_scipy_sparse()
+        if sparse is None:
+            return None
+        data = np.ones(len(self.indices), dtype=np.float64)
+        return sparse.csr_matrix((data, self.indices, self.indptr), shape=self.shape)
+
+    def intersection_counts(self) -> np.ndarray:
+        """
+        All-pairs shared-tag counts (A @ A.T), dense
+
+        Returns:
+            Float matrix of shape (items, items)
+        """
+        matrix = self.to_scipy()
+        if matrix is not None:
+            return (matrix @ matrix.T).toarray()
+
+        counts = np.zeros((len(self.names), len(self.names)))
+        for tag in range(len(self.tags)):
+            rows = self._posting_rows[self._posting_ptr[tag]:self._posting_ptr[tag + 1]]
+            counts[np.ix_(rows, rows)] += 1.0
+        return counts
+
+    def jaccard_matrix(
+        self, sparse_output: bool = False
+    ) -> Optional[Union[np.ndarray, "scipy.sparse.csr_matrix"]]:
+        """
+        All-pairs Jaccard similarity: |A∩B| / (|A| + |B| - |A∩B|)
+
+        The dense form is meant for small item sets such as top-level
+        sections; for guide-level item counts use sparse_output or
+        top_k_neighbors(), which never allocate an items x items array.
+
+        Args:
+            sparse_output: Return a SciPy CSR matrix holding only pairs that share a tag
+
+        Returns:
+            Float matrix of shape (items, items); 0 (or absent) where items share no tag.
+            None when sparse_output is requested without SciPy installed.
+        """
+        if sparse_output:
+            matrix = self.to_scipy()
+            if matrix is None:
+                return None
+            intersection = (matrix @ matrix.T).tocsr()
+            intersection.sort_indices()
+            rows = np.repeat(np.arange(len(self.names)), np.diff(intersection.indptr))
+            union = self.row_counts[rows] + self.row_counts[intersection.indices] - intersection.data
+            intersection.data = intersection.data / union
+            return intersection
+
+        intersection = self.intersection_counts()
+        union = self.row_counts[:, None] + self.row_counts[None, :] - intersection
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+    def top_k_neighbors(self, k: int, min_similarity: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exact k nearest neighbours of every item, one posting-list scan per row
+
+        Memory stays at O(items * k) with or without SciPy.
+
+        Args:
+            k: Neighbours per item
+            min_similarity: Drop neighbours at or below this similarity
+
+        Returns:
+            (neighbors, similarities), both of shape (items, k), best first;
+            unused slots hold -1 and 0.0
+        """
+        neighbors = np.full((len(self.names), k), -1, dtype=np.int64)
+        similarities = np.zeros((len(self.names), k))
+        for row in range(len(self.names)):
+            ranking, scores = self._rank_row(row, k, min_similarity)
+            neighbors[row, :ranking.size] = ranking
+            similarities[row, :ranking.size] = scores
+        return neighbors, similarities
+
+    def jaccard_row(self, item: Union[str, int]) -> np.ndarray:
+        """
+        Jaccard similarity of one item against all items
+
+        Only the posting lists of the item's own tags are read.
+
+        Args:
+            item: Item name or row
+
+        Returns:
+            Float vector of length items
+        """
+        row = self.index[item] if isinstance(item, str) else item
+        postings = [
+            self._posting_rows[self._posting_ptr[tag]:self._posting_ptr[tag + 1]]
+            for tag in self.row_tags(row).tolist()
+        ]
+        intersection = np.bincount(
+            np.concatenate(postings) if postings else np.empty(0, dtype=np.int32),
+            minlength=len(self.names)
+        ).astype(np.float64)
+        union = self.row_counts[row] + self.row_counts - intersection
+        return np.divide(intersection, union, out=np.zeros_like(intersection), where=union > 0)
+
+    def nearest(self, item: str, k: int = 5, min_similarity: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Exact k most similar items
+
+        Args:
+            item: Item name
+            k: Number of neighbors
+            min_similarity: Drop neighbors at or below this similarity
+
+        Returns:
+            (name, Jaccard similarity) pairs, best first; ties go to earlier items
+        """
+        ranking, scores = self._rank_row(self.index[item], k, min_similarity)
+        return [(self.names[row], float(score)) for row, score in zip(ranking.tolist(), scores.tolist())]
+
+    def _rank_row(self, row: int, k: int, min_similarity: float) -> Tuple[np.ndarray, np.ndarray]:
+        similarities = self.jaccard_row(row)
+        scores = np.where(similarities > min_similarity, similarities, -np.inf)
+        scores[row] = -np.inf
+        ranking = select_top_k(scores, k)
+        return ranking, similarities[ranking]
+
+class MinHashLSHIndex:
+    """
+    Approximate nearest neighbours by tag Jaccard (MinHash signatures + LSH banding)
+
+    Design Philosophy: Only compare items that are likely to be similar
+    Core Objective: Keep neighbour lookups sublinear as the tagged item count grows
+
+    Items sharing every signature value in at least one band become
+    candidates; candidates are then re-scored with exact Jaccard. With b bands
+    of r rows, a pair with similarity s is found with probability
+    1 - (1 - s^r)^b. Untagged items are never returned.
+    """
+
+    def __init__(self, matrix: TagIncidenceMatrix, num_permutations: int = 64, bands: int = 16, seed: int = 42):
+        """
+        Hash every item and fill the band buckets
+
+        Args:
+            matrix: Tag incidence matrix to index
+            num_permutations: MinHash signature length
+            bands: LSH bands (must divide num_permutations)
+            seed: Seed for the hash family
+        """
+        if num_permutations % bands:
+            raise ValueError("bands must divide num_permutations")
+
+        self.matrix = matrix
+        self.num_permutations = num_permutations
+        self.bands = bands
+        self.rows_per_band = num_permutations // bands
+
+        rng = np.random.default_rng(seed)
+        a = rng.integers(1, _MINHASH_PRIME, size=num_permutations, dtype=np.int64)
+        b = rng.integers(0, _MINHASH_PRIME, size=num_permutations, dtype=np.int64)
+
+        # Hash every stored tag once per permutation, then take per-row minima
+        hashed = (a[:, None] * matrix.indices.astype(np.int64)[None, :] + b[:, None]) % _MINHASH_PRIME
+        self.signatures = np.full((len(matrix.names), num_permutations), _MINHASH_PRIME, dtype=np.int64)
+        tagged = np.flatnonzero(matrix.row_counts)
+        if tagged.size:
+            self.signatures[tagged] = np.minimum.reduceat(hashed, matrix.indptr[tagged], axis=1).T
+
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(bands)]
+        for row in tagged.tolist():
+            for band, key in enumerate(self._band_keys(row)):
+                self._buckets[band].setdefault(key, []).append(row)
+
+    def _band_keys(self, row: int) -> List[bytes]:
+        signature = self.signatures[row]
+        return [
+            signature[band * self.rows_per_band:(band + 1) * self.rows_per_band].tobytes()
+            for band in range(self.bands)
+        ]
+
+    def candidates(self, item: str) -> np.ndarray:
+        """
+        Items sharing at least one LSH band with the query item
+
+        Args:
+            item: Item name
+
+        Returns:
+            Candidate rows, ascending (the item itself excluded)
+        """
+        row = self.matrix.index[item]
+        if not self.matrix.row_counts[row]:
+            return np.empty(0, dtype=np.int64)
+        found = set()
+        for band, key in enumerate(self._band_keys(row)):
+            found.update(self._buckets[band].get(key, ()))
+        found.discard(row)
+        return np.array(sorted(found), dtype=np.int64)
+
+    def estimated_similarity(self, first: str, second: str) -> float:
+        """
+        MinHash estimate of Jaccard similarity (share of equal signature values)
+        """
+        index = self.matrix.index
+        return float(np.mean(self.signatures[index[first]] == self.signatures[index[second]]))
+
+    def nearest(self, item: str, k: int = 5, min_similarity: float = 0.0) -> List[Tuple[str, float]]:
+        """
+        Approximate k most similar items, re-scored with exact Jaccard
+
+        Args:
+            item: Item name
+            k: Number of neighbors
+            min_similarity: Drop neighbors at or below this similarity
+
+        Returns:
+            (name, Jaccard similarity) pairs, best first
+        """
+        matrix = self.matrix
+        query_tags = matrix.row_tags(item)
+        scored = []
+        for row in self.candidates(item).tolist():
+            shared = np.intersect1d(query_tags, matrix.row_tags(row), assume_unique=True).size
+            similarity = shared / float(len(query_tags) + matrix.row_counts[row] - shared)
+            if similarity > min_similarity:
+                scored.append((-similarity, row))
+        scored.sort()
+        return [(matrix.names[row], -negative) for negative, row in scored[:k]]
+
+def build_tag_similarity_index(
+    tag_sets: Mapping[str, Iterable[str]],
+    approximate: bool = False,
+    **lsh_options
+) -> Union[TagIncidenceMatrix, MinHashLSHIndex]:
+    """
+    Build an exact or approximate neighbour index; both expose nearest()
+
+    Args:
+        tag_sets: Item name -> tags
+        approximate: Use MinHash/LSH instead of exact posting-list scans
+        **lsh_options: num_permutations, bands, seed
+
+    Returns:
+        Index object
+    """
+    matrix = TagIncidenceMatrix(tag_sets)
+    return MinHashLSHIndex(matrix, **lsh_options) if approximate else matrix
@@ -1,10 +1,291 @@
 import os
 import json
-import uuid
+import time
+import queue
+import weakref
+import textwrap
+import threading
+from functools import lru_cache
 from datetime import datetime, timedelta
 import sqlite3
 import hashlib
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+
+from interaction_archive import ARCHIVE_DIRECTORY, DEFAULT_COMPACTION_GRACE, compact_interaction_log
+from interaction_database import (
+    INTERACTION_COLUMN_TYPES, from_epoch_micros, get_interaction_database, to_epoch_micros
+)
+
+# PRAGMA user_version of the current user_interactions schema:
+#   1 - integer epoch-microsecond timestamps, range-query indexes
+SCHEMA_VERSION = 1
+
+INSERT_INTERACTION_SQL = '''
+    INSERT INTO user_interactions (
+        interaction_id, user_hash, timestamp, 
+        current_directory, target_directory, 
+        professional_stage, interaction_type, 
+        interaction_duration, interaction_score, 
+        context_metadata
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Column order of training data entries and exports
+TRAINING_DATA_COLUMNS = tuple(name for name, _ in INTERACTION_COLUMN_TYPES)
+TIMESTAMP_COLUMN = TRAINING_DATA_COLUMNS.index('timestamp')
+
+# Rows fetched per cursor round trip when streaming training data
+TRAINING_DATA_CHUNK_SIZE = 10000
+
+EXPORT_FORMATS = ('json', 'jsonl', 'csv')
+
+# Serialized empty context, the common case
+EMPTY_CONTEXT_JSON = json.dumps({})
+
+# Buffered mode: interactions per write transaction, and queued interactions before record() blocks
+DEFAULT_BATCH_SIZE = 50000
+DEFAULT_MAX_QUEUE_SIZE = 100000
+
+# Seconds to wait before each retry of a batch that failed with an OperationalError (busy, locked, I/O)
+WRITE_RETRY_DELAYS = (0.05, 0.25, 1.0)
+
+# Batches that still cannot be written are appended here (JSON Lines) rather than dropped
+UNWRITTEN_INTERACTIONS_FILENAME = 'unwritten_interactions.jsonl'
+
+@lru_cache(maxsize=65536)
+def _hash_user_identifier(user_identifier: str) -> str:
+    """
+    Salted SHA-256 of a user identifier (memoized; active users repeat constantly)
+    """
+    salt = "PORT_TOWNSEND_PROFESSIONAL_LIBRARY_SALT"
+    return hashlib.sha256(f"{user_identifier}{salt}".encode()).hexdigest()
+
+_id_pool = threading.local()
+
+def _reset_id_pool():
+    """
+    Give a forked child its own pool; an inherited copy would repeat the parent's IDs
+    """
+    global _id_pool
+    _id_pool = threading.local()
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+# First hex digit of the UUID variant byte: 10xx in binary (RFC 4122)
+_VARIANT_DIGIT = str.maketrans('0123456789abcdef', '89ab89ab89ab89ab')
+
+def _new_interaction_id() -> str:
+    """
+    Time-ordered (version 7) UUID string, with random bits drawn from a per-thread pool
+    
+    Version 4 IDs land at random positions in the primary-key index, so every
+    batch dirtied (and rewrote to the WAL) about one index page per row;
+    millisecond-prefixed IDs are appended at its right edge instead. Reading
+    random bytes for a few thousand IDs at once also avoids uuid.uuid4()'s
+    os.urandom call per ID.
+    """
+    state = _id_pool.__dict__
+    pool = state.get('tails')
+    if not pool:
+        hex_digits = os.urandom(10 * 4096).hex()
+        pool = state['tails'] = [
+            f"7{hex_digits[i + 1:i + 4]}-{hex_digits[i + 4].translate(_VARIANT_DIGIT)}"
+            f"{hex_digits[i + 5:i + 8]}-{hex_digits[i + 8:i + 20]}"
+            for i in range(0, len(hex_digits), 20)
+        ]
+    millis = time.time_ns() // 1000000
+    if state.get('millis') != millis:
+        state['millis'] = millis
+        state['prefix'] = f"{millis >> 16:08x}-{millis & 0xFFFF:04x}-"
+    return state['prefix'] + pool.pop()
+
+def _insert_rows(database, rows: List[Tuple]):
+    """
+    Insert rows with executemany inside a single transaction
+    
+    Args:
+        database: InteractionDatabase to write to
+        rows: INSERT parameter tuples
+    """
+    if rows:
+        with database.transaction() as conn:
+            conn.executemany(INSERT_INTERACTION_SQL, rows)
+
+def _insert_rows_skipping_conflicts(database, rows: List[Tuple]) -> List[Tuple[Tuple, sqlite3.IntegrityError]]:
+    """
+    Insert rows one statement at a time inside a single transaction, skipping constraint violations
+    
+    A failed INSERT only undoes its own statement, so the rest of the batch
+    still commits.
+    
+    Args:
+        database: InteractionDatabase to write to
+        rows: INSERT parameter tuples
+    
+    Returns:
+        (row, error) for each row that was not inserted
+    """
+    conflicts = []
+    with database.transaction() as conn:
+        for row in rows:
+            try:
+                conn.execute(INSERT_INTERACTION_SQL, row)
+            except sqlite3.IntegrityError as e:
+                conflicts.append((row, e))
+    return conflicts
+
+class _FlushRequest:
+    """
+    Queue marker: the writer signals `done` once everything queued before it is
+    committed, handing over the first write error since the previous flush
+    """
+    __slots__ = ('done', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[sqlite3.Error] = None
+
+_STOP = object()
+
+class _InteractionWriter:
+    """
+    Background writer of a buffered TrainingDataCollector
+    
+    Holds everything the writer thread uses, so the thread never references
+    the collector and an abandoned collector can still be garbage collected
+    (its weakref finalizer then stops the writer).
+    """
+
+    def __init__(self, database, spill_path: str, batch_size: int, flush_interval: float, max_queue_size: int):
+        self.database = database
+        self.spill_path = spill_path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self.space_available = threading.Event()
+        self.write_errors = 0
+        self.error: Optional[sqlite3.Error] = None
+        self.thread = threading.Thread(target=self._run, name='TrainingDataWriter', daemon=True)
+        self.thread.start()
+
+    def put(self, item):
+        """
+        Enqueue an item, first waiting while max_queue_size items are pending
+        
+        The bound is a high-water mark checked before each put (a C-level
+        qsize() call) rather than queue.Queue(maxsize), whose Python-level
+        condition variable would add a lock round trip to every row.
+        """
+        while self.queue.qsize() >= self.max_queue_size and self.thread.is_alive():
+            self.space_available.clear()
+            # The timeout covers a wakeup that lands between the check and clear()
+            self.space_available.wait(0.05)
+        self.queue.put(item)
+
+    def stop(self):
+        """
+        Write everything queued so far, then end the writer thread
+        """
+        if self.thread.is_alive():
+            self.put(_STOP)
+            self.thread.join()
+
+    def _run(self):
+        """
+        Drain the queue into batched transactions
+        
+        A batch is written when it reaches batch_size, when its oldest row has
+        waited flush_interval seconds, or when a flush/stop marker arrives.
+        """
+        batch: List[Tuple] = []
+        deadline = None
+        stopping = False
+        
+        try:
+            while not stopping:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+                try:
+                    item = self.queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                
+                markers = []
+                while item is not None:
+                    if item is _STOP:
+                        stopping = True
+                    elif isinstance(item, _FlushRequest):
+                        markers.append(item)
+                    else:
+                        if not batch:
+                            deadline = time.monotonic() + self.flush_interval
+                        batch.append(item)
+                    if stopping or markers or len(batch) >= self.batch_size:
+                        break
+                    try:
+                        item = self.queue.get_nowait()
+                    except queue.Empty:
+                        item = None
+                
+                if batch and (stopping or markers or len(batch) >= self.batch_size or
+                              time.monotonic() >= deadline):
+                    self._write_batch(batch)
+                    batch = []
+                    deadline = None
+                    self.space_available.set()
+                
+                for marker in markers:
+                    marker.error, self.error = self.error, None
+                    marker.done.set()
+        finally:
+            self.database.close_thread_connections()
+
+    def _write_batch(self, batch: List[Tuple]):
+        """
+        Commit one batch, retrying OperationalErrors; spill the batch if it still fails
+        
+        A constraint violation (e.g. a duplicate interaction ID) only rejects
+        the offending rows: the batch is re-inserted row by row without them.
+        """
+        for attempt in range(len(WRITE_RETRY_DELAYS) + 1):
+            try:
+                try:
+                    _insert_rows(self.database, batch)
+                except sqlite3.IntegrityError:
+                    conflicts = _insert_rows_skipping_conflicts(self.database, batch)
+                    if conflicts:
+                        self._reject([row for row, _ in conflicts], conflicts[0][1])
+                return
+            except sqlite3.Error as e:
+                error = e
+                if not isinstance(e, sqlite3.OperationalError) or attempt == len(WRITE_RETRY_DELAYS):
+                    break
+            time.sleep(WRITE_RETRY_DELAYS[attempt])
+        
+        self._reject(batch, error)
+
+    def _reject(self, rows: List[Tuple], error: sqlite3.Error):
+        """
+        Count, report and spill rows that could not be written
+        """
+        self.write_errors += len(rows)
+        self.error = self.error or error
+        print(f"❌ Failed to write {len(rows)} interactions: {error}")
+        self._spill(rows)
+
+    def _spill(self, batch: List[Tuple]):
+        """
+        Append unwritten rows to the spill file (one JSON object per line) instead of dropping them
+        """
+        try:
+            with open(self.spill_path, 'a') as f:
+                for row in batch:
+                    f.write(json.dumps(dict(zip(TRAINING_DATA_COLUMNS, row))))
+                    f.write('\n')
+            print(f"⚠️ Saved {len(batch)} unwritten interactions to {self.spill_path}")
+        except OSError as e:
+            print(f"❌ Could not save {len(batch)} unwritten interactions: {e}")
 
 class TrainingDataCollector:
     """
@@ -14,12 +295,25 @@ class TrainingDataCollector:
     Local Economic Context: Enhance professional resource discovery
     """
     
-    def __init__(self, data_storage_path: str = None):
+    def __init__(
+        self, 
+        data_storage_path: str = None,
+        buffered: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        flush_interval: float = 1.0,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE
+    ):
         """
         Initialize Training Data Collector
         
         Args:
             data_storage_path: Optional custom path for data storage
+            buffered: Queue interactions in memory and write them from a background
+                thread in batched transactions instead of committing each one
+            batch_size: Maximum interactions per write transaction (buffered mode)
+            flush_interval: Maximum seconds an interaction waits in the queue (buffered mode)
+            max_queue_size: Queued interactions at which record() blocks until the
+                writer catches up (buffered mode); nothing is dropped
         """
         # Default storage in project root
         self.project_root = os.path.dirname(os.path.abspath(__file__))
@@ -30,42 +324,138 @@ class TrainingDataCollector:
         
         # Initialize SQLite database for secure, structured storage
         self.db_path = os.path.join(self.data_storage_path, 'user_interactions.db')
+        self.database = get_interaction_database(self.db_path)
         self._initialize_database()
+        
+        # Buffered ingestion
+        self.buffered = buffered
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._closed = False
+        self._writer: Optional[_InteractionWriter] = None
+        if self.buffered:
+            self._writer = _InteractionWriter(
+                self.database, os.path.join(self.data_storage_path, UNWRITTEN_INTERACTIONS_FILENAME),
+                batch_size, flush_interval, max_queue_size
+            )
+            # Stops the writer on close(), garbage collection or interpreter exit
+            # without keeping the collector alive the way atexit.register would
+            self._finalizer = weakref.finalize(self, self._writer.stop)
+    
+    @property
+    def write_errors(self) -> int:
+        """
+        Interactions the background writer failed to commit (and spilled instead)
+        """
+        return self._writer.write_errors if self._writer is not None else 0
     
     def _initialize_database(self):
         """
-        Create SQLite database schema for training data
-        """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # User interaction tracking table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_interactions (
-                    interaction_id TEXT PRIMARY KEY,
-                    user_hash TEXT,
-                    timestamp DATETIME,
-                    current_directory TEXT,
-                    target_directory TEXT,
-                    professional_stage TEXT,
-                    interaction_type TEXT,
-                    interaction_duration REAL,
-                    interaction_score REAL,
-                    context_metadata TEXT
-                )
-            ''')
-            
-            # Consent and privacy tracking table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS user_consent (
-                    user_hash TEXT PRIMARY KEY,
-                    consent_timestamp DATETIME,
-                    consent_version TEXT,
-                    anonymization_level TEXT
-                )
-            ''')
-            
+        Create SQLite database schema for training data, migrating older schemas
+        
+        The schema version lives in PRAGMA user_version; the migration runs once,
+        under a write lock, so concurrent collectors cannot both apply it.
+        """
+        conn = self.database.connection()
+        if conn.execute('PRAGMA user_version').fetchone()[0] >= SCHEMA_VERSION:
+            return
+        
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            version = conn.execute('PRAGMA user_version').fetchone()[0]
+            if version < SCHEMA_VERSION:
+                self._create_schema(conn)
+                if version < 1:
+                    self._migrate_timestamps(conn)
+                self._create_indexes(conn)
+                conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
             conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    def _create_schema(self, conn: sqlite3.Connection):
+        """
+        Create the interaction and consent tables if missing
+        """
+        cursor = conn.cursor()
+        # User interaction tracking table (timestamp: epoch microseconds)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_interactions (
+                interaction_id TEXT PRIMARY KEY,
+                user_hash TEXT,
+                timestamp INTEGER,
+                current_directory TEXT,
+                target_directory TEXT,
+                professional_stage TEXT,
+                interaction_type TEXT,
+                interaction_duration REAL,
+                interaction_score REAL,
+                context_metadata TEXT
+            )
+        ''')
+        
+        # Consent and privacy tracking table
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS user_consent (
+                user_hash TEXT PRIMARY KEY,
+                consent_timestamp DATETIME,
+                consent_version TEXT,
+                anonymization_level TEXT
+            )
+        ''')
+    
+    def _migrate_timestamps(self, conn: sqlite3.Connection):
+        """
+        Convert ISO-8601 text timestamps from schema version 0 to epoch microseconds
+        
+        Naive values are converted in one UPDATE inside SQLite. Values with a UTC
+        offset are left to to_epoch_micros (SQLite would shift them to UTC rather
+        than to the local wall clock interactions are recorded in), as is anything
+        SQLite cannot parse; values datetime.fromisoformat rejects too are left
+        untouched with a warning.
+        """
+        conn.execute('''
+            UPDATE user_interactions
+            SET timestamp = CAST(strftime('%s', timestamp) AS INTEGER) * 1000000 + CASE
+                WHEN substr(timestamp, 20, 1) = '.' THEN CAST(substr(timestamp || '000000', 21, 6) AS INTEGER)
+                ELSE 0
+            END
+            WHERE typeof(timestamp) = 'text' AND strftime('%s', timestamp) IS NOT NULL
+              AND timestamp NOT GLOB '*[+-][0-9][0-9]:[0-9][0-9]' AND timestamp NOT GLOB '*[Zz]'
+        ''')
+        
+        leftovers = conn.execute(
+            "SELECT rowid, timestamp FROM user_interactions WHERE typeof(timestamp) = 'text'"
+        ).fetchall()
+        converted = []
+        for rowid, value in leftovers:
+            try:
+                converted.append((to_epoch_micros(datetime.fromisoformat(value)), rowid))
+            except ValueError:
+                continue
+        conn.executemany('UPDATE user_interactions SET timestamp = ? WHERE rowid = ?', converted)
+        
+        if len(converted) < len(leftovers):
+            print(f"⚠️ {len(leftovers) - len(converted)} interaction timestamps could not be converted")
+    
+    def _create_indexes(self, conn: sqlite3.Connection):
+        """
+        Secondary indexes for time-range, stage and per-user queries
+        """
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_interactions_timestamp '
+            'ON user_interactions (timestamp)'
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_interactions_stage_timestamp '
+            'ON user_interactions (professional_stage, timestamp)'
+        )
+        conn.execute(
+            'CREATE INDEX IF NOT EXISTS idx_interactions_user_timestamp '
+            'ON user_interactions (user_hash, timestamp)'
+        )
     
     def _generate_user_hash(self, user_identifier: str) -> str:
         """
@@ -78,8 +468,126 @@ class TrainingDataCollector:
             Anonymized user hash
         """
         # Salted hash for additional privacy
-        salt = "PORT_TOWNSEND_PROFESSIONAL_LIBRARY_SALT"
-        return hashlib.sha256(f"{user_identifier}{salt}".encode()).hexdigest()
+        return _hash_user_identifier(user_identifier)
+    
+    def _build_interaction_row(
+        self,
+        user_identifier: str,
+        current_directory: str,
+        target_directory: str,
+        professional_stage: str,
+        interaction_type: str,
+        interaction_duration: float,
+        interaction_score: float,
+        context_metadata: Optional[Dict[str, Any]]
+    ) -> Tuple:
+        """
+        Build one user_interactions row (the INSERT parameter tuple)
+        """
+        return (
+            _new_interaction_id(), self._generate_user_hash(user_identifier), to_epoch_micros(datetime.now()),
+            current_directory, target_directory,
+            professional_stage, interaction_type,
+            interaction_duration, interaction_score,
+            json.dumps(context_metadata) if context_metadata else EMPTY_CONTEXT_JSON
+        )
+    
+    def record(
+        self, 
+        user_identifier: str, 
+        current_directory: str, 
+        target_directory: str,
+        professional_stage: str,
+        interaction_type: str = 'navigation',
+        interaction_duration: float = 0.0,
+        interaction_score: float = 0.5,
+        context_metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Queue an interaction for the background writer
+        
+        Arguments match record_user_interaction. Returns immediately unless
+        max_queue_size interactions are already waiting, in which case it
+        blocks until the writer catches up. Without buffered mode, or after
+        close(), the interaction is written immediately instead.
+        
+        Returns:
+            Unique interaction ID
+        """
+        row = self._build_interaction_row(
+            user_identifier, current_directory, target_directory, professional_stage,
+            interaction_type, interaction_duration, interaction_score, context_metadata
+        )
+        if self._writer is not None:
+            # Under the lock so close() cannot slip its stop marker in between
+            with self._lock:
+                if not self._closed:
+                    self._writer.put(row)
+                    return row[0]
+        self._write_rows([row])
+        return row[0]
+    
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every interaction queued so far is committed
+        
+        Args:
+            timeout: Optional maximum seconds to wait
+        
+        Returns:
+            True when the flush completed
+        
+        Raises:
+            sqlite3.Error: A batch failed since the previous flush; its rows were
+                saved to unwritten_interactions.jsonl in the data storage path
+        """
+        writer = self._writer
+        if writer is None or not writer.thread.is_alive():
+            return True
+        request = _FlushRequest()
+        writer.queue.put(request)
+        if not request.done.wait(timeout):
+            return False
+        if request.error is not None:
+            raise request.error
+        return True
+    
+    def close(self):
+        """
+        Flush outstanding interactions and stop the background writer
+        
+        Raises:
+            sqlite3.Error: A batch failed since the last flush (see flush)
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._writer is not None:
+            self._finalizer()
+            error, self._writer.error = self._writer.error, None
+            if error is not None:
+                raise error
+    
+    def __enter__(self) -> "TrainingDataCollector":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            self.close()
+        except sqlite3.Error:
+            # Already reported by the writer; do not mask the original exception
+            if exc_type is None:
+                raise
+    
+    def _write_rows(self, rows: List[Tuple]):
+        """
+        Insert rows with executemany inside a single transaction
+        
+        Args:
+            rows: INSERT parameter tuples
+        """
+        _insert_rows(self.database, rows)
     
     def record_user_interaction(
         self, 
@@ -108,121 +616,206 @@ class TrainingDataCollector:
         Returns:
             Unique interaction ID
         """
-        # Generate unique interaction ID
-        interaction_id = str(uuid.uuid4())
-        
-        # Generate privacy-preserving user hash
-        user_hash = self._generate_user_hash(user_identifier)
-        
-        # Prepare context metadata
-        context_metadata = context_metadata or {}
-        context_json = json.dumps(context_metadata)
-        
-        # Record interaction in database
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO user_interactions (
-                    interaction_id, user_hash, timestamp, 
-                    current_directory, target_directory, 
-                    professional_stage, interaction_type, 
-                    interaction_duration, interaction_score, 
-                    context_metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                interaction_id, user_hash, datetime.now().isoformat(),
-                current_directory, target_directory, 
-                professional_stage, interaction_type,
-                interaction_duration, interaction_score,
-                context_json
-            ))
-            conn.commit()
-        
-        return interaction_id
+        # Buffered collectors queue the interaction; otherwise it is committed now
+        return self.record(
+            user_identifier, current_directory, target_directory, professional_stage,
+            interaction_type, interaction_duration, interaction_score, context_metadata
+        )
     
-    def get_training_data(
-        self, 
-        start_date: Optional[datetime] = None, 
+    def iter_training_data(
+        self,
+        start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-        professional_stages: Optional[List[str]] = None
-    ) -> List[Dict[str, Any]]:
+        professional_stages: Optional[List[str]] = None,
+        chunk_size: int = TRAINING_DATA_CHUNK_SIZE
+    ) -> Iterator[Dict[str, Any]]:
         """
-        Retrieve training data with optional filtering
-        
+        Stream training data entries, fetching rows in fixed-size chunks
+
+        Memory use is bounded by chunk_size regardless of table size. The
+        read-only connection holds one WAL snapshot until the generator is
+        exhausted or closed, so rows recorded meanwhile are not included.
+
         Args:
             start_date: Optional start date for data retrieval
             end_date: Optional end date for data retrieval
             professional_stages: Optional list of professional stages
-        
-        Returns:
-            List of training data entries
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Training data entries (timestamps as ISO-8601 strings)
+        """
+        for row in self._iter_interaction_rows(start_date, end_date, professional_stages, chunk_size):
+            entry = dict(zip(TRAINING_DATA_COLUMNS, row))
+            entry['timestamp'] = from_epoch_micros(entry['timestamp']).isoformat()
+            entry['context_metadata'] = json.loads(entry['context_metadata'])
+            yield entry
+
+    def _iter_interaction_rows(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        professional_stages: Optional[List[str]],
+        chunk_size: int
+    ) -> Iterator[Tuple]:
+        """
+        Raw user_interactions rows in TRAINING_DATA_COLUMNS order, chunk by chunk
+
+        Args:
+            start_date: Optional start date
+            end_date: Optional end date (defaults to now)
+            professional_stages: Optional list of professional stages
+            chunk_size: Rows fetched per round trip
+
+        Yields:
+            Row tuples (integer timestamps, context_metadata as stored JSON)
         """
         start_date = start_date or datetime.min
         end_date = end_date or datetime.now()
-        
-        query = '''
-            SELECT 
-                interaction_id, user_hash, timestamp, 
-                current_directory, target_directory, 
-                professional_stage, interaction_type, 
-                interaction_duration, interaction_score, 
-                context_metadata
+
+        query = f'''
+            SELECT {', '.join(TRAINING_DATA_COLUMNS)}
             FROM user_interactions
             WHERE timestamp BETWEEN ? AND ?
         '''
-        
-        params = [start_date.isoformat(), end_date.isoformat()]
-        
+
+        params = [to_epoch_micros(start_date), to_epoch_micros(end_date)]
+
         if professional_stages:
             query += ' AND professional_stage IN ({})'.format(
                 ','.join(['?'] * len(professional_stages))
             )
             params.extend(professional_stages)
+
+        with self.database.reader() as conn:
+            cursor = conn.execute(query, params)
+            try:
+                while True:
+                    rows = cursor.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+
+    def get_training_data(
+        self, 
+        start_date: Optional[datetime] = None, 
+        end_date: Optional[datetime] = None,
+        professional_stages: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve training data with optional filtering
+        
+        Materializes iter_training_data; prefer the iterator for large ranges.
+        
+        Args:
+            start_date: Optional start date for data retrieval
+            end_date: Optional end date for data retrieval
+            professional_stages: Optional list of professional stages
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-            cursor.execute(query, params)
-            
-            training_data = []
-            for row in cursor.fetchall():
-                entry = dict(row)
-                entry['context_metadata'] = json.loads(entry['context_metadata'])
-                training_data.append(entry)
-        
-        return training_data
+        Returns:
+            List of training data entries (timestamps as ISO-8601 strings)
+        """
+        return list(self.iter_training_data(start_date, end_date, professional_stages))
     
     def export_training_data(
         self, 
         output_path: Optional[str] = None, 
-        format: str = 'json'
-    ):
+        format: str = 'json',
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        professional_stages: Optional[List[str]] = None,
+        chunk_size: int = TRAINING_DATA_CHUNK_SIZE
+    ) -> Optional[str]:
         """
-        Export training data to specified format
+        Export training data to specified format, streaming row by row
+        
+        Rows are written as they are fetched, so memory use stays constant
+        however large the interaction log is. `json` produces the same
+        indented array as before; `jsonl` writes one entry per line; `csv`
+        keeps context_metadata as its JSON string. An empty selection still
+        yields a valid file (`[]`, an empty file, or a header-only CSV).
         
         Args:
-            output_path: Optional custom output path
-            format: Export format (json or csv)
+            output_path: Optional custom output path (without extension)
+            format: Export format (json, jsonl or csv)
+            start_date: Optional start date for exported data
+            end_date: Optional end date for exported data
+            professional_stages: Optional list of professional stages
+            chunk_size: Rows fetched per round trip
+        
+        Returns:
+            Path of the written file, or None for an unsupported format
         """
-        training_data = self.get_training_data()
+        if format not in EXPORT_FORMATS:
+            print(f"❌ Unsupported export format: {format} (expected one of {', '.join(EXPORT_FORMATS)})")
+            return None
         
         if not output_path:
             output_path = os.path.join(
                 self.data_storage_path, 
                 f'training_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}'
             )
+        file_path = f'{output_path}.{format}'
+        filters = (start_date, end_date, professional_stages)
         
-        if format == 'json':
-            with open(f'{output_path}.json', 'w') as f:
-                json.dump(training_data, f, indent=2)
-        elif format == 'csv':
+        exported = 0
+        if format == 'csv':
             import csv
-            with open(f'{output_path}.csv', 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=training_data[0].keys())
-                writer.writeheader()
-                writer.writerows(training_data)
+            with open(file_path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(TRAINING_DATA_COLUMNS)
+                for row in self._iter_interaction_rows(*filters, chunk_size):
+                    row = list(row)
+                    row[TIMESTAMP_COLUMN] = from_epoch_micros(row[TIMESTAMP_COLUMN]).isoformat()
+                    writer.writerow(row)
+                    exported += 1
+        elif format == 'jsonl':
+            with open(file_path, 'w') as f:
+                for entry in self.iter_training_data(*filters, chunk_size):
+                    f.write(json.dumps(entry))
+                    f.write('\n')
+                    exported += 1
+        else:
+            # Matches json.dump(entries, f, indent=2) without holding the list
+            with open(file_path, 'w') as f:
+                for entry in self.iter_training_data(*filters, chunk_size):
+                    f.write(',\n' if exported else '[\n')
+                    f.write(textwrap.indent(json.dumps(entry, indent=2), '  '))
+                    exported += 1
+                f.write('\n]' if exported else '[]')
+        
+        print(f"🗂️ Exported {exported} training entries to {file_path}")
+        return file_path
+
+    def compact_interactions(
+        self,
+        until: Optional[datetime] = None,
+        use_parquet: Optional[bool] = None,
+        grace: timedelta = DEFAULT_COMPACTION_GRACE
+    ) -> Dict[str, Any]:
+        """
+        Export closed days of interactions into the columnar archive
         
-        print(f"🗂️ Training data exported to {output_path}")
+        Queued interactions are flushed first. Partitions are written to
+        INTERACTION_ARCHIVE under the data storage path (see
+        interaction_archive.compact_interaction_log).
+        
+        Args:
+            until: Compact days that ended at or before this time (default: now)
+            use_parquet: Force Parquet (True) or .npz (False); default: Parquet when available
+            grace: How long after midnight a day stays open
+        
+        Returns:
+            Compaction summary
+        """
+        self.flush()
+        summary = compact_interaction_log(
+            self.db_path, os.path.join(self.data_storage_path, ARCHIVE_DIRECTORY), until, use_parquet, grace
+        )
+        print(f"🗄️ Compacted {summary['rows']} interactions into {summary['partitions']} {summary['format']} partitions")
+        return summary
 
 def main():
     """